@@ -0,0 +1,35 @@
+"""
+Bagian bersama script benchmark: path repo, scenario standar dan timer
+best-of. Di-import sebagai modul lokal (``from _common import ...``) karena
+script dijalankan langsung: ``python benchmarks/<script>.py``.
+"""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# scenario standar benchmark (suite.py / baseline.json)
+DIST_A = [(4.0, 25.0), (5.0, 40.0), (6.0, 35.0)]
+DIST_B = [(4.0, 35.0), (5.0, 40.0), (6.0, 25.0)]
+DIST_S = [(1.0, 30.0), (2.0, 45.0), (3.0, 25.0)]
+# distribusi timbangan default dashboard: scale jadi bottleneck, antrian panjang
+DIST_S_SLOW = [(4.0, 30.0), (5.0, 45.0), (6.0, 25.0)]
+TRAVEL = 10.0
+
+
+def best_of(fn, repeat=3, min_seconds=0.0):
+    """Waktu terbaik dari >= repeat panggilan, diulang sampai total >= min_seconds."""
+    best = float("inf")
+    spent = 0.0
+    n = 0
+    while n < repeat or spent < min_seconds:
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = min(best, elapsed)
+        spent += elapsed
+        n += 1
+    return best
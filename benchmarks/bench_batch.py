@@ -0,0 +1,52 @@
+"""
+Benchmark + cross-check: batch.run_simulation_batch (NumPy, lockstep) vs
+engine referensi run_simulation_metrics.
+
+    python benchmarks/bench_batch.py [n_reps_batch] [n_reps_reference]
+
+Cross-check: selisih mean tiap metric dibagi standard error gabungan (z).
+|z| < 3 untuk semua metric = kedua engine konsisten secara statistik.
+"""
+import sys
+import time
+
+from _common import DIST_A, DIST_B, DIST_S_SLOW
+
+import numpy as np
+
+from dump_truck_sim.batch import run_simulation_batch
+from dump_truck_sim.engine import run_simulation_metrics
+
+
+def main():
+    n_batch = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_ref = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    travel, total_time, n_trucks = 10.0, 480.0, 6
+
+    t0 = time.perf_counter()
+    batch = run_simulation_batch(DIST_A, DIST_B, DIST_S_SLOW, travel, total_time,
+                                 n_trucks, n_reps=n_batch, seed=1)
+    t_batch = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ref = [run_simulation_metrics(DIST_A, DIST_B, DIST_S_SLOW, travel, total_time,
+                                  n_trucks, seed=s) for s in range(n_ref)]
+    t_ref = time.perf_counter() - t0
+
+    print(f"batch    : {n_batch} reps in {t_batch:.2f}s ({n_batch / t_batch:,.0f} reps/s)")
+    print(f"reference: {n_ref} reps in {t_ref:.2f}s ({n_ref / t_ref:,.0f} reps/s)")
+    print()
+    print(f"{'metric':<24} {'batch':>10} {'reference':>10} {'z':>7}")
+    worst = 0.0
+    for key, values in batch.items():
+        ref_values = np.array([m[key] for m in ref])
+        se = np.sqrt(values.var() / values.size + ref_values.var() / ref_values.size)
+        z = (values.mean() - ref_values.mean()) / se if se > 0 else 0.0
+        worst = max(worst, abs(z))
+        print(f"{key:<24} {values.mean():>10.4f} {ref_values.mean():>10.4f} {z:>7.2f}")
+    print()
+    print("cross-check OK" if worst < 3.0 else "cross-check FAILED (|z| >= 3)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark batch means (1 run panjang) vs replikasi independen dengan total
+menit simulasi yang sama: half-width CI avg loader wait & waktu, plus peak
+memori batch means untuk run makin panjang (harus datar).
+
+    python benchmarks/bench_batch_means.py
+"""
+import time
+import tracemalloc
+
+from _common import DIST_A, DIST_B, DIST_S
+
+from dump_truck_sim.replication import average_metrics, run_batch_means, run_replications
+
+ARGS = (DIST_A, DIST_B, DIST_S, 10.0)
+METRIC = "avg_loader_queue_wait"
+WARMUP = 60.0
+
+
+def main():
+    print("peak memori batch means (tanpa timeline):")
+    print(f"{'run (min)':>10} {'peak (KB)':>10} {'time (s)':>9}")
+    for run_length in (4_800.0, 48_000.0, 480_000.0):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        run_batch_means(*ARGS, run_length, n_batches=20, warmup=WARMUP, base_seed=1)
+        elapsed = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{run_length:>10.0f} {peak / 1024:>10.1f} {elapsed:>9.2f}")
+
+    print(f"\nsama-sama 96000 menit simulasi, {METRIC}:")
+    print(f"{'mode':>28} {'mean':>8} {'±hw':>8} {'time (s)':>9}")
+    budget = 96_000.0
+
+    t0 = time.perf_counter()
+    summary, _ = run_batch_means(*ARGS, budget, n_batches=20, warmup=WARMUP, base_seed=1)
+    elapsed = time.perf_counter() - t0
+    print(f"{'batch means 1 x 96000':>28} {summary[METRIC]:>8.4f} "
+          f"{summary['ci_halfwidth'][METRIC]:>8.4f} {elapsed:>9.2f}")
+
+    for horizon in (480.0, 1920.0):
+        n = int(budget // horizon)
+        t0 = time.perf_counter()
+        metrics, _ = run_replications(*ARGS, horizon, num_runs=n, base_seed=1, max_workers=1, warmup=WARMUP)
+        elapsed = time.perf_counter() - t0
+        avg = average_metrics(metrics)
+        label = f"replikasi {n} x {horizon:g}"
+        print(f"{label:>28} {avg[METRIC]:>8.4f} {avg['ci_halfwidth'][METRIC]:>8.4f} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
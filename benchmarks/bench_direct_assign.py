@@ -0,0 +1,43 @@
+"""
+Benchmark: trace lama (CHECK_ASSIGN sebagai event heap) vs assignment
+langsung per clock (default). final_metrics harus identik per seed.
+
+    python benchmarks/bench_direct_assign.py
+"""
+from _common import best_of
+
+from dump_truck_sim.engine import run_simulation_metrics, run_simulation_with_timeline
+
+DIST_A = [(3.0, 30.0), (4.0, 40.0), (5.0, 30.0)]
+DIST_B = [(4.0, 50.0), (6.0, 50.0)]
+DIST_SCALE = [(1.0, 60.0), (2.0, 40.0)]
+
+
+def main():
+    print(f"{'total_time':>10} {'mode':>7} {'steps':>8} {'events':>8} "
+          f"{'recorded (s)':>13} {'headless (s)':>13}")
+    for total_time in (480.0, 4800.0, 48000.0):
+        results = {}
+        for legacy in (True, False):
+            kw = dict(
+                dist_loader_A=DIST_A,
+                dist_loader_B=DIST_B,
+                dist_scale=DIST_SCALE,
+                travel_time_value=10.0,
+                total_time=total_time,
+                n_trucks=6,
+                seed=1,
+                legacy_trace=legacy,
+            )
+            metrics, timeline, event_log, _ = run_simulation_with_timeline(**kw)
+            results[legacy] = metrics
+            t_rec = best_of(lambda: run_simulation_with_timeline(**kw), 5)
+            t_head = best_of(lambda: run_simulation_metrics(**kw), 5)
+            print(f"{total_time:>10.0f} {'legacy' if legacy else 'direct':>7} {len(timeline):>8} "
+                  f"{len(event_log):>8} {t_rec:>13.4f} {t_head:>13.4f}")
+        assert results[True] == results[False], "final_metrics berbeda antar mode"
+    print("\nfinal_metrics identik OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark export streaming (export.py): events/sec menulis Parquet / Arrow,
+ukuran file, peak RSS saat export untuk beberapa jumlah replikasi (memori
+harus datar karena flush per row group), dan waktu baca ulang lewat
+memory map (read_export) vs baca penuh tanpa mmap.
+
+    python benchmarks/bench_export.py
+
+Tiap case dijalankan di subprocess sendiri supaya peak RSS tidak tercampur
+(buffer pyarrow tidak terlihat oleh tracemalloc).
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import DIST_A, DIST_B, DIST_S
+
+
+def _case(format, num_runs, out_dir):
+    """Dijalankan di subprocess: export + baca ulang, hasil JSON ke stdout."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from dump_truck_sim.export import export_replications, read_export
+
+    events_path = os.path.join(out_dir, f"events.{format}")
+    metrics_path = os.path.join(out_dir, f"metrics.{format}")
+    t0 = time.perf_counter()
+    res = export_replications(
+        events_path, metrics_path, DIST_A, DIST_B, DIST_S, 10.0, 480.0,
+        n_trucks=6, num_runs=num_runs, base_seed=1, format=format,
+    )
+    seconds = time.perf_counter() - t0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    t0 = time.perf_counter()
+    table = read_export(events_path, columns=["replication", "time", "code"])
+    total = pa.compute.sum(table["time"]).as_py()
+    read_mmap = time.perf_counter() - t0
+    del table
+    t0 = time.perf_counter()
+    if format == "parquet":
+        table = pq.read_table(events_path)
+    else:
+        with open(events_path, "rb") as f:
+            table = pa.ipc.open_file(pa.BufferReader(f.read())).read_all()
+    read_full = time.perf_counter() - t0
+    return {
+        "events": res["events"],
+        "seconds": seconds,
+        "rss": rss,
+        "bytes": os.path.getsize(events_path),
+        "read_mmap": read_mmap,
+        "read_full": read_full,
+        "check": total,
+    }
+
+
+def main():
+    if len(sys.argv) == 4:
+        print(json.dumps(_case(sys.argv[1], int(sys.argv[2]), sys.argv[3])))
+        return
+    print(f"{'format':>8} {'runs':>6} {'events':>10} {'events/s':>10} {'peak RSS (MB)':>14} "
+          f"{'B/event':>8} {'read mmap (ms)':>15} {'read full (ms)':>15}")
+    for format in ("parquet", "arrow"):
+        for num_runs in (10, 100, 1000):
+            with tempfile.TemporaryDirectory() as out_dir:
+                out = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), format, str(num_runs), out_dir],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+            r = json.loads(out)
+            print(f"{format:>8} {num_runs:>6} {r['events']:>10} {r['events'] / r['seconds']:>10,.0f} "
+                  f"{r['rss'] / 1e6:>14.1f} {r['bytes'] / r['events']:>8.2f} "
+                  f"{r['read_mmap'] * 1000:>15.1f} {r['read_full'] * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Benchmark: run_simulation_with_timeline (timeline penuh) vs
+run_simulation_metrics (headless) untuk beberapa total_time.
+
+    python benchmarks/bench_headless.py
+"""
+from _common import DIST_A, DIST_B, DIST_S_SLOW, best_of
+
+from dump_truck_sim.engine import run_simulation_with_timeline, run_simulation_metrics
+
+
+def main():
+    print(f"{'total_time':>10} {'full (s)':>10} {'headless (s)':>13} {'speedup':>8}")
+    for total_time in (480, 4_800, 48_000, 480_000):
+        full = best_of(lambda: run_simulation_with_timeline(
+            DIST_A, DIST_B, DIST_S_SLOW, 10.0, total_time, seed=1))
+        headless = best_of(lambda: run_simulation_metrics(
+            DIST_A, DIST_B, DIST_S_SLOW, 10.0, total_time, seed=1))
+        print(f"{total_time:>10} {full:>10.4f} {headless:>13.4f} {full / headless:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
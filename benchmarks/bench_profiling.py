@@ -0,0 +1,55 @@
+"""
+Benchmark profiling: overhead run_simulation_with_timeline tanpa profiler,
+dengan profiler, dan profile_simulation (+ run tracemalloc), plus ringkasan
+fase dari satu run.
+
+    python benchmarks/bench_profiling.py
+"""
+import time
+
+from _common import DIST_A, DIST_B, DIST_S
+
+from dump_truck_sim.engine import run_simulation_with_timeline
+from dump_truck_sim.profiling import Profiler, profile_simulation
+
+SIM_KWARGS = dict(
+    dist_loader_A=DIST_A,
+    dist_loader_B=DIST_B,
+    dist_scale=DIST_S,
+    travel_time_value=10.0,
+    total_time=48_000.0,
+    n_trucks=6,
+)
+REPEATS = 5
+
+
+def _best(fn):
+    best = float("inf")
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    base = _best(lambda: run_simulation_with_timeline(seed=1, **SIM_KWARGS))
+    wrapped = _best(lambda: run_simulation_with_timeline(seed=1, profiler=Profiler(), **SIM_KWARGS))
+    full = _best(lambda: profile_simulation(SIM_KWARGS, seed=1))
+
+    print(f"{'mode':<22} {'time (s)':>9} {'vs off':>8}")
+    print(f"{'profiler=None':<22} {base:9.3f} {1.0:7.2f}x")
+    print(f"{'Profiler()':<22} {wrapped:9.3f} {wrapped / base:7.2f}x")
+    print(f"{'profile_simulation':<22} {full:9.3f} {full / base:7.2f}x")
+
+    report = profile_simulation(SIM_KWARGS, seed=1).report()
+    print(f"\nevents {report['events']}, {report['events_per_sec']:,.0f} events/sec, "
+          f"peak memori {report['peak_memory_bytes'] / 1024:.0f} KiB, heap maks {report['heap']['max']}")
+    for name, row in sorted(report["phases"].items(), key=lambda kv: -kv[1]["seconds"]):
+        print(f"  {name:<16} {row['seconds'] * 1000:8.1f} ms {row['calls']:>8} calls "
+              f"{row['us_per_call']:7.2f} us/call {row['share'] * 100:5.1f} %")
+    print(f"  {'core (sisa)':<16} {report['core_other_seconds'] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
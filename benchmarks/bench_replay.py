@@ -0,0 +1,88 @@
+"""
+Benchmark replay step run #1: ukuran payload browser (to_payload, mentah vs
+terkompres) dan latensi per step, server (timeline[i] di Python) vs client
+(replay core JS, diukur di node kalau tersedia). Kolom "js frame" = biaya
+satu frame autoplay yang maju 50 step (budget 60 fps = 16.7 ms).
+
+    python benchmarks/bench_replay.py
+"""
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+
+from _common import DIST_A, DIST_B, DIST_S
+
+from dump_truck_sim.engine import run_simulation_with_timeline
+from replay_view import REPLAY_CORE_JS
+
+NODE_BENCH = """
+(async () => {
+const t0 = performance.now();
+const r = makeReplay(PAYLOAD, await loadTimeline(PAYLOAD));
+const mount = performance.now() - t0;
+let t = performance.now();
+for (let i = 0; i < r.length; i++) r.snapshot(i);
+const seq = (performance.now() - t) / r.length;
+const order = ORDER;
+t = performance.now();
+for (const i of order) r.snapshot(i);
+const rnd = (performance.now() - t) / order.length;
+let frames = 0;
+t = performance.now();
+for (let i = 0; i < r.length; i += 50, frames++) r.snapshot(i);
+const frame = (performance.now() - t) / frames;
+process.stdout.write(JSON.stringify({mount: mount, seq: seq, rnd: rnd, frame: frame}));
+})();
+"""
+
+
+def _python_latency(timeline, order):
+    t0 = time.perf_counter()
+    for i in order:
+        timeline[i]
+    return (time.perf_counter() - t0) / len(order)
+
+
+def _node_latency(payload, order):
+    node = shutil.which("node")
+    if node is None:
+        return None
+    script = REPLAY_CORE_JS + NODE_BENCH.replace("PAYLOAD", json.dumps(payload)).replace(
+        "ORDER", json.dumps(order)
+    )
+    with tempfile.NamedTemporaryFile("w", suffix=".js", delete=False) as f:
+        f.write(script)
+    try:
+        out = subprocess.run([node, f.name], capture_output=True, text=True, check=True).stdout
+    finally:
+        os.unlink(f.name)
+    return json.loads(out)
+
+
+def main():
+    print(f"{'steps':>8} {'raw KB':>8} {'payload KB':>11} {'py step (ms)':>13} {'js mount (ms)':>14} "
+          f"{'js next (us)':>13} {'js seek (us)':>13} {'js frame (ms)':>14}")
+    for total_time in (480.0, 4_800.0, 48_000.0, 192_000.0, 960_000.0):
+        _, timeline, _, _ = run_simulation_with_timeline(
+            DIST_A, DIST_B, DIST_S, 10.0, total_time, n_trucks=6, seed=1
+        )
+        payload = timeline.to_payload()
+        size = len(json.dumps(payload, separators=(",", ":")))
+        raw = len(json.dumps(timeline.to_payload(compress=False), separators=(",", ":")))
+        rng = random.Random(0)
+        order = [rng.randrange(len(timeline)) for _ in range(500)]
+        py = _python_latency(timeline, order[:200])
+        js = _node_latency(payload, order)
+        js_cols = (
+            f"{js['mount']:14.1f} {js['seq'] * 1000:13.2f} {js['rnd'] * 1000:13.1f} {js['frame']:14.3f}"
+            if js else f"{'-':>14} {'-':>13} {'-':>13} {'-':>14}"
+        )
+        print(f"{len(timeline):8d} {raw / 1024:8.1f} {size / 1024:11.1f} {py * 1000:13.3f} {js_cols}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark skala fleet: biaya per step (event heap) vs jumlah truck (6 .. 1000).
+
+    python benchmarks/bench_scaling.py [total_time]
+
+Jumlah server ikut fleet (n/4 loader, n/8 scale, minimal 2 + 1) supaya
+sistem tetap sibuk dan jumlah event tumbuh dengan fleet. Core dengan
+queue O(1) & running total memberi us/step yang kira-kira rata di semua
+ukuran fleet untuk headless dan recorded; kolom "snapshots" (snapshot
+dict tiap step) tetap menyalin isi antrian, jadi wajar tumbuh pelan.
+
+    headless  = run_simulation_metrics
+    recorded  = run_simulation_with_timeline (event log + timeline kolom)
+    snapshots = iter_simulation(snapshots=True) dikonsumsi habis
+"""
+import sys
+
+from _common import DIST_A, DIST_S, best_of
+
+from dump_truck_sim.engine import (
+    iter_simulation,
+    run_simulation_metrics,
+    run_simulation_with_timeline,
+)
+
+FLEETS = (6, 25, 100, 250, 500, 1000)
+
+
+def _drain(stream):
+    for _ in stream:
+        pass
+
+
+def main():
+    total_time = float(sys.argv[1]) if len(sys.argv) > 1 else 480.0
+    travel = 20.0
+
+    print(f"{'n_trucks':>8} {'servers':>8} {'steps':>8} "
+          f"{'headless':>9} {'recorded':>9} {'snapshots':>10}   (us/step)")
+    for n in FLEETS:
+        kw = dict(
+            dist_loader_A=None,
+            dist_loader_B=None,
+            dist_scale=None,
+            travel_time_value=travel,
+            total_time=total_time,
+            n_trucks=n,
+            seed=1,
+            loaders=[DIST_A] * max(2, n // 4),
+            scales=[DIST_S] * max(1, n // 8),
+        )
+        _, timeline, _, _ = run_simulation_with_timeline(**kw)
+        steps = len(timeline)
+        t_head = best_of(lambda: run_simulation_metrics(**kw))
+        t_rec = best_of(lambda: run_simulation_with_timeline(**kw))
+        t_snap = best_of(lambda: _drain(iter_simulation(snapshots=True, **kw)))
+        servers = len(kw["loaders"]) + len(kw["scales"])
+        print(f"{n:>8} {servers:>8} {steps:>8} "
+              f"{t_head / steps * 1e6:>9.2f} {t_rec / steps * 1e6:>9.2f} {t_snap / steps * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
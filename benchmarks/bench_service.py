@@ -0,0 +1,104 @@
+"""
+Benchmark service HTTP (service.py) di bawah beban konkuren: request/detik
+dan latensi p50 / p95 / max untuk beberapa tingkat konkurensi, dengan
+scenario berbeda-beda (seed unik, tanpa dedupe / cache) vs scenario
+identik (digabung jadi satu job), plus jumlah request yang ditolak 429
+saat antrian penuh.
+
+    python benchmarks/bench_service.py
+
+Server & client jalan di proses ini (thread); worker simulasi di process pool.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import DIST_A, DIST_B, DIST_S, TRAVEL
+
+from dump_truck_sim.service import SimulationService, make_server
+
+SCENARIO = {
+    "n_trucks": 6,
+    "travel_time_value": TRAVEL,
+    "total_time": 480,
+    "dist_loader_A": DIST_A,
+    "dist_loader_B": DIST_B,
+    "dist_scale": DIST_S,
+}
+REPLICATIONS = 20
+REQUESTS = 96
+CONCURRENCY = (1, 4, 16, 64)
+
+
+def _post(url, body):
+    data = json.dumps(body).encode("utf-8")
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req) as r:
+            r.read()
+            status = r.status
+    except urllib.error.HTTPError as exc:
+        exc.read()
+        status = exc.code
+    return status, time.perf_counter() - t0
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+def _load(url, bodies, concurrency):
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as ex:
+        results = list(ex.map(lambda body: _post(url, body), bodies))
+    seconds = time.perf_counter() - t0
+    ok = [lat for status, lat in results if status == 200]
+    return {
+        "ok": len(ok),
+        "rejected": sum(1 for status, _ in results if status == 429),
+        "rps": len(ok) / seconds,
+        "p50": _percentile(ok, 0.50),
+        "p95": _percentile(ok, 0.95),
+        "max": max(ok) if ok else float("nan"),
+    }
+
+
+def main():
+    workers = os.cpu_count() or 1
+    seeds = itertools.count(1)
+    print(f"{workers} worker, {REQUESTS} request x {REPLICATIONS} replikasi per case")
+    print(f"{'case':>10} {'max_pending':>11} {'conc':>5} {'ok':>4} {'429':>4} {'req/s':>7} "
+          f"{'p50 (ms)':>9} {'p95 (ms)':>9} {'max (ms)':>9}")
+    for max_pending in (REQUESTS, 8):
+        service = SimulationService(max_workers=workers, max_pending=max_pending).start()
+        server = make_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/simulate"
+        try:
+            for concurrency in CONCURRENCY:
+                for case in ("distinct", "identical"):
+                    if case == "distinct":
+                        bodies = [dict(SCENARIO, replications=REPLICATIONS, seed=next(seeds)) for _ in range(REQUESTS)]
+                    else:
+                        # seed acak -> identik hanya dalam case ini (tidak kena cache)
+                        seed = next(seeds) + 10**6
+                        bodies = [dict(SCENARIO, replications=REPLICATIONS, seed=seed)] * REQUESTS
+                    r = _load(url, bodies, concurrency)
+                    print(f"{case:>10} {max_pending:>11} {concurrency:>5} {r['ok']:>4} {r['rejected']:>4} "
+                          f"{r['rps']:>7.1f} {r['p50'] * 1000:>9.1f} {r['p95'] * 1000:>9.1f} {r['max'] * 1000:>9.1f}")
+            print(f"{'':>10} stats: {service.stats()}")
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
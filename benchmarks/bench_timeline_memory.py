@@ -0,0 +1,58 @@
+"""
+Benchmark memori timeline run #1: ColumnarTimeline vs representasi lama
+(list of snapshot dict + list of event log dict), plus waktu seek acak
+timeline[i] (replay dari checkpoint terdekat).
+
+    python benchmarks/bench_timeline_memory.py
+
+Representasi lama di-materialize dari timeline yang sama (timeline[i] dan
+event_log[r] menghasilkan dict yang identik dengan versi lama), jadi yang
+dibandingkan murni cara penyimpanannya.
+"""
+import random
+import time
+import tracemalloc
+
+from _common import DIST_A, DIST_B, DIST_S_SLOW
+
+from dump_truck_sim.engine import run_simulation_with_timeline
+
+
+def _traced(fn):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+
+def _seek_ms(timeline, n=200):
+    times = []
+    for i in random.Random(0).sample(range(len(timeline)), min(n, len(timeline))):
+        t0 = time.perf_counter()
+        timeline[i]
+        times.append(time.perf_counter() - t0)
+    return 1000 * sum(times) / len(times), 1000 * max(times)
+
+
+def main():
+    print(f"{'total_time':>10} {'steps':>9} {'legacy (MB)':>12} {'columnar (MB)':>14} "
+          f"{'B/step legacy':>14} {'B/step col':>11} {'ratio':>7} {'seek avg/max (ms)':>18}")
+    for total_time in (480, 4_800, 48_000):
+        (_, timeline, event_log, _), col_bytes = _traced(lambda: run_simulation_with_timeline(
+            DIST_A, DIST_B, DIST_S_SLOW, 10.0, total_time, seed=1))
+        legacy, legacy_bytes = _traced(lambda: (
+            [timeline[i] for i in range(len(timeline))],
+            [event_log[r] for r in range(len(event_log))],
+        ))
+        n = len(timeline)
+        seek_avg, seek_max = _seek_ms(timeline)
+        print(f"{total_time:>10} {n:>9} {legacy_bytes / 1e6:>12.1f} {col_bytes / 1e6:>14.2f} "
+              f"{legacy_bytes / n:>14.0f} {col_bytes / n:>11.0f} {legacy_bytes / col_bytes:>6.1f}x"
+              f" {seek_avg:>9.2f}/{seek_max:.2f}")
+        del legacy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark warm-up: bias estimasi steady-state pada horizon pendek, tanpa
+warm-up vs warm-up tetap vs MSER-5, terhadap referensi run sangat panjang.
+Juga jumlah replikasi yang dibutuhkan run_until_precision (target 2%).
+
+    python benchmarks/bench_warmup.py
+"""
+import time
+
+from _common import DIST_A, DIST_B, DIST_S
+
+from dump_truck_sim.engine import run_simulation_metrics
+from dump_truck_sim.replication import run_until_precision
+from dump_truck_sim.stats import RunningStats
+
+ARGS = (DIST_A, DIST_B, DIST_S, 10.0)
+METRIC = "avg_loader_queue_wait"
+
+
+def _mean(total_time, n_reps, warmup):
+    rs = RunningStats()
+    for seed in range(n_reps):
+        rs.push(run_simulation_metrics(*ARGS, total_time, seed=seed, warmup=warmup)[METRIC])
+    return rs
+
+
+def main():
+    # referensi steady-state: run panjang, warm-up kecil dibanding horizon
+    ref = _mean(200_000.0, 5, 500.0).mean
+    print(f"referensi steady-state {METRIC}: {ref:.4f} min\n")
+
+    print(f"{'horizon':>8} {'warm-up':>9} {'mean':>8} {'bias %':>8} {'±hw':>7} {'reps@2%':>8} {'time (s)':>9}")
+    for total_time in (120.0, 480.0):
+        for warmup in (None, 30.0, "mser5"):
+            rs = _mean(total_time, 400, warmup)
+            t0 = time.perf_counter()
+            summary, _ = run_until_precision(
+                *ARGS, total_time,
+                targets={METRIC: 0.02}, min_runs=20, max_runs=5000,
+                base_seed=1, max_workers=1, warmup=warmup,
+            )
+            elapsed = time.perf_counter() - t0
+            label = "none" if warmup is None else str(warmup)
+            print(f"{total_time:>8.0f} {label:>9} {rs.mean:>8.4f} {(rs.mean / ref - 1) * 100:>+7.1f}% "
+                  f"{rs.half_width():>7.4f} {summary['replications']:>8} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark: biaya bootstrap worker process pool ("spawn"). Worker meng-import
+ulang script utama sebagai __mp_main__ (di Streamlit: app.py) lalu modul
+engine untuk unpickle task. Diukur sebagai wall time subprocess python.
+
+    python benchmarks/bench_worker_startup.py
+"""
+import subprocess
+import sys
+
+from _common import ROOT, best_of
+
+CASES = (
+    ("python kosong", "pass"),
+    ("import dump_truck_sim.engine", "import dump_truck_sim.engine"),
+    ("import dump_truck_sim.replication", "import dump_truck_sim.replication"),
+    (
+        "worker: app.py sbg __mp_main__ + replication",
+        "import runpy; runpy.run_path('app.py', run_name='__mp_main__'); "
+        "import dump_truck_sim.replication",
+    ),
+)
+
+
+def _python(code):
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def main():
+    print(f"{'case':<46} {'time (ms)':>10}")
+    for label, code in CASES:
+        print(f"{label:<46} {best_of(lambda: _python(code), 7) * 1000:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
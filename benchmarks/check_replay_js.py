@@ -0,0 +1,100 @@
+"""
+Cek kesetaraan replay core JS (replay_view.REPLAY_CORE_JS) vs
+ColumnarTimeline: snapshot step yang diturunkan di node harus identik dengan
+timeline[i] di Python, untuk beberapa topologi, mode legacy_trace, payload
+terkompres maupun mentah, urutan maju dan lompat (seek lintas checkpoint).
+
+    python benchmarks/check_replay_js.py
+
+Butuh node >= 18 (DecompressionStream); exit 1 kalau ada mismatch.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from _common import DIST_S
+
+from dump_truck_sim.engine import run_simulation_with_timeline
+from replay_view import REPLAY_CORE_JS
+
+DIST_A = [(3.0, 30.0), (4.0, 40.0), (5.0, 30.0)]
+DIST_B = [(4.0, 50.0), (6.0, 50.0)]
+
+CASES = (
+    ("default", dict(n_trucks=6, total_time=480.0)),
+    ("5x2 server", dict(n_trucks=20, total_time=2000.0, loaders=[DIST_A, DIST_A, DIST_B, DIST_B, DIST_A],
+                        scales=[("WB1", DIST_S), ("WB2", DIST_S)])),
+    ("legacy_trace", dict(n_trucks=6, total_time=300.0, legacy_trace=True)),
+)
+
+NODE_CHECK = """
+(async () => {
+const p = PAYLOAD;
+const r = makeReplay(p, await loadTimeline(p));
+process.stdout.write(JSON.stringify(ORDER.map(i => r.snapshot(i))));
+})();
+"""
+
+
+def _js_snapshots(node, payload, order):
+    script = REPLAY_CORE_JS + NODE_CHECK.replace("PAYLOAD", json.dumps(payload)).replace(
+        "ORDER", json.dumps(order)
+    )
+    with tempfile.NamedTemporaryFile("w", suffix=".js", delete=False) as f:
+        f.write(script)
+    try:
+        out = subprocess.run([node, f.name], capture_output=True, text=True, check=True).stdout
+    finally:
+        os.unlink(f.name)
+    return json.loads(out)
+
+
+def _expected(timeline, i):
+    """timeline[i] dalam bentuk snapshot replay core (server / busy_time per key)."""
+    snap = timeline[i]
+    keys = timeline.topology.keys
+    return {
+        "clock": snap["clock"],
+        "event": snap["event"],
+        "truck": snap["truck"],
+        "note": snap["note"],
+        "loader_queue": snap["loader_queue"],
+        "scale_queue": snap["scale_queue"],
+        "traveling": snap["traveling"],
+        "server": [snap[k + "_truck"] for k in keys],
+        "busy_time": [snap[k + "_busy_time"] for k in keys],
+        "avg_loader_wait_so_far": snap["avg_loader_wait_so_far"],
+        "avg_scale_wait_so_far": snap["avg_scale_wait_so_far"],
+    }
+
+
+def main():
+    node = shutil.which("node")
+    if node is None:
+        print("node tidak ditemukan, cek dilewati")
+        return 0
+    failed = 0
+    print(f"{'case':<14} {'payload':<8} {'steps':>6} {'mismatch':>9}")
+    for label, kw in CASES:
+        _, timeline, _, _ = run_simulation_with_timeline(DIST_A, DIST_B, DIST_S, 10.0, seed=5, **kw)
+        n = len(timeline)
+        # maju semua step, lalu lompat mundur / melewati batas checkpoint
+        order = list(range(n)) + [i for i in (n - 1, 0, 300, 299, 700, 5, n // 2, n // 2 + 1) if i < n]
+        for compress in (True, False):
+            got = _js_snapshots(node, timeline.to_payload(compress=compress), order)
+            bad = [i for i, snap in zip(order, got) if snap != _expected(timeline, i)]
+            failed += len(bad)
+            print(f"{label:<14} {'deflate' if compress else 'raw':<8} {n:>6} {len(bad):>9}")
+            for i in bad[:3]:
+                want = _expected(timeline, i)
+                js = got[order.index(i)]
+                print(f"  step {i}: " + ", ".join(f"{k} py={want[k]!r} js={js[k]!r}" for k in want if want[k] != js[k]))
+    print("OK" if not failed else f"{failed} snapshot berbeda")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Cek validasi request service HTTP (service.py): body dengan tipe / rentang
+salah harus dijawab 400 + {"error": ...} sebelum job masuk pool, bukan 500
+atau koneksi yang putus tanpa response; body valid tetap 200.
+
+    python benchmarks/check_service.py
+
+Server jalan di thread proses ini dengan 1 worker; exit 1 kalau ada yang beda.
+"""
+import http.client
+import json
+import sys
+import threading
+
+from _common import DIST_A, DIST_B, DIST_S, TRAVEL
+
+from dump_truck_sim.service import SimulationService, make_server
+
+SCENARIO = {
+    "n_trucks": 3,
+    "travel_time_value": TRAVEL,
+    "total_time": 120,
+    "dist_loader_A": DIST_A,
+    "dist_loader_B": DIST_B,
+    "dist_scale": DIST_S,
+}
+
+# (path, perubahan body, status yang diharapkan)
+CASES = (
+    ("/simulate", {"replications": 2, "seed": 1}, 200),
+    ("/simulate", {"replications": 2, "seed": 1, "confidence": 0.9, "per_replication": True}, 200),
+    ("/simulate", {"replications": None, "seed": None, "confidence": None}, 200),
+    ("/timeline", {"seed": 1, "format": None}, 200),
+    ("/simulate", {"replications": [5]}, 400),
+    ("/simulate", {"replications": 0}, 400),
+    ("/simulate", {"replications": 2.5}, 400),
+    ("/simulate", {"replications": True}, 400),
+    ("/simulate", {"replications": 10**9}, 400),
+    ("/simulate", {"seed": [1]}, 400),
+    ("/simulate", {"seed": "1"}, 400),
+    ("/simulate", {"seed": False}, 400),
+    ("/simulate", {"confidence": 1.5}, 400),
+    ("/simulate", {"confidence": 0}, 400),
+    ("/simulate", {"confidence": "0.95"}, 400),
+    ("/simulate", {"per_replication": "yes"}, 400),
+    ("/simulate", {"n_trucks": [3]}, 400),
+    ("/simulate", {"n_trucks": 0}, 400),
+    ("/simulate", {"n_trucks": 2.5}, 400),
+    ("/simulate", {"total_time": "480"}, 400),
+    ("/simulate", {"total_time": 0}, 400),
+    ("/simulate", {"travel_time_value": -1}, 400),
+    ("/simulate", {"warmup": 1000}, 400),
+    ("/simulate", {"warmup": "abc"}, 400),
+    ("/simulate", {"dist_scale": [[[1], 100]]}, 400),
+    ("/simulate", {"dist_scale": {"x": 1}}, 400),
+    ("/timeline", {"format": "csv"}, 400),
+    ("/timeline", {"format": ["payload"]}, 400),
+)
+
+
+def _post(port, path, body):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        conn.request("POST", path, json.dumps(body), {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        return resp.status, json.loads(resp.read())
+    except (http.client.HTTPException, ConnectionError) as exc:
+        return None, {"error": f"tanpa response: {type(exc).__name__}"}
+    finally:
+        conn.close()
+
+
+def main():
+    service = SimulationService(max_workers=1, max_pending=4, max_replications=1000).start()
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    failed = 0
+    try:
+        for path, change, expected in CASES:
+            status, out = _post(port, path, dict(SCENARIO, **change))
+            ok = status == expected and (expected == 200 or "error" in out)
+            failed += not ok
+            detail = out.get("error", "") if status != 200 else ""
+            print(f"{'ok ' if ok else 'FAIL'} {path:<10} {json.dumps(change):<60} {status} {detail}")
+        # thread handler harus tetap hidup setelah semua request buruk
+        status, _ = _post(port, "/simulate", dict(SCENARIO, replications=1, seed=2))
+        failed += status != 200
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+    print("OK" if not failed else f"{failed} case gagal")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Benchmark suite core simulasi (tanpa Streamlit): events/sec, replications/sec
+dan memori per event untuk beberapa ukuran fleet, horizon dan jumlah
+replikasi. Hasil ditulis ke JSON dan dibandingkan dengan baseline tersimpan.
+
+    python benchmarks/suite.py                          # jalankan + bandingkan baseline.json
+    python benchmarks/suite.py --quick                  # grid kecil (smoke / CI)
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --save-baseline          # tulis ulang baseline.json
+
+Exit code 1 kalau ada metric yang lebih buruk dari baseline melebihi --tolerance.
+Angka absolut bergantung mesin: simpan baseline di mesin yang sama.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tracemalloc
+
+from _common import DIST_A, DIST_B, DIST_S, TRAVEL, best_of
+
+from dump_truck_sim.engine import run_simulation_metrics, run_simulation_with_timeline
+from dump_truck_sim.profiling import Profiler
+from dump_truck_sim.replication import run_replications
+from dump_truck_sim.sampling import sample_from_distribution
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# grid (full, quick)
+FLEETS = ((3, 6, 12, 24), (6, 24))
+HORIZONS = ((480.0, 4_800.0, 48_000.0), (480.0, 4_800.0))
+REPLICATIONS = ((10, 100, 1000), (10, 100))
+FLEET_HORIZON = 4_800.0
+REPLICATION_HORIZON = 480.0
+MIN_SECONDS = 0.5  # case kecil diulang supaya best-of tidak didominasi noise
+
+# arah metric: +1 -> makin besar makin baik, -1 -> makin kecil makin baik
+DIRECTION = {
+    "events_per_sec": 1,
+    "replications_per_sec": 1,
+    "calls_per_sec": 1,
+    "bytes_per_event": -1,
+}
+
+
+# ---------------------------------------------------------------------------------
+# PENGUKURAN
+# ---------------------------------------------------------------------------------
+
+def _sim_kwargs(n_trucks, total_time):
+    return dict(
+        dist_loader_A=DIST_A,
+        dist_loader_B=DIST_B,
+        dist_scale=DIST_S,
+        travel_time_value=TRAVEL,
+        total_time=total_time,
+        n_trucks=n_trucks,
+    )
+
+
+def _event_count(sim_kwargs, seed):
+    """Jumlah event (pop future event list) satu run; deterministik per seed."""
+    profiler = Profiler()
+    run_simulation_with_timeline(seed=seed, record_timeline=False, profiler=profiler, **sim_kwargs)
+    return profiler.report()["events"]
+
+
+def _peak_bytes(fn):
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def bench_core(n_trucks, total_time, repeat, seed=1):
+    """events/sec headless & timeline penuh + memori per event (timeline penuh)."""
+    sim_kwargs = _sim_kwargs(n_trucks, total_time)
+    events = _event_count(sim_kwargs, seed)
+    headless = best_of(lambda: run_simulation_metrics(seed=seed, **sim_kwargs), repeat, MIN_SECONDS)
+    full = best_of(lambda: run_simulation_with_timeline(seed=seed, **sim_kwargs), repeat, MIN_SECONDS)
+    peak = _peak_bytes(lambda: run_simulation_with_timeline(seed=seed, **sim_kwargs))
+    return {
+        "events": events,
+        "events_per_sec": events / headless,
+        "timeline_events_per_sec": events / full,
+        "bytes_per_event": peak / max(events, 1),
+    }
+
+
+def bench_replications(num_runs, engine, repeat):
+    """Replikasi/detik run_replications (termasuk replikasi #1 dengan timeline)."""
+    sim_kwargs = _sim_kwargs(6, REPLICATION_HORIZON)
+    seconds = best_of(
+        lambda: run_replications(num_runs=num_runs, base_seed=1, engine=engine, **sim_kwargs),
+        repeat,
+        MIN_SECONDS,
+    )
+    return {"replications_per_sec": num_runs / seconds}
+
+
+def bench_sampling(n_calls):
+    """sample_from_distribution: panggilan/detik (RNG global, seperti app)."""
+    random.seed(1)
+    seconds = best_of(lambda: [sample_from_distribution(DIST_A) for _ in range(n_calls)], 3, MIN_SECONDS)
+    return {"calls_per_sec": n_calls / seconds}
+
+
+def run_suite(quick=False, log=print):
+    g = 1 if quick else 0
+    repeat = 2 if quick else 5
+    results = {}
+
+    def record(name, values):
+        results[name] = values
+        log(f"  {name:<34} " + "  ".join(
+            f"{k}={v:,.0f}" if isinstance(v, (int, float)) and abs(v) >= 100 else f"{k}={v:.3g}"
+            for k, v in values.items()
+        ))
+
+    log("core: fleet size")
+    for n_trucks in FLEETS[g]:
+        record(f"core/trucks={n_trucks}/T={FLEET_HORIZON:g}", bench_core(n_trucks, FLEET_HORIZON, repeat))
+    log("core: horizon")
+    for total_time in HORIZONS[g]:
+        record(f"core/trucks=6/T={total_time:g}", bench_core(6, total_time, repeat))
+    log("replications")
+    for engine in ("python", "numpy"):
+        for num_runs in REPLICATIONS[g]:
+            record(f"replications/{engine}/n={num_runs}", bench_replications(num_runs, engine, repeat))
+    log("sampling")
+    record("sampling/sample_from_distribution", bench_sampling(20_000 if quick else 200_000))
+    return results
+
+
+# ---------------------------------------------------------------------------------
+# BASELINE
+# ---------------------------------------------------------------------------------
+
+def environment():
+    import numpy
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Bandingkan dengan baseline (hanya case & metric yang ada di keduanya).
+    returns list baris (case, metric, baseline, current, ratio, regressed),
+    ratio > 1 = lebih baik dari baseline.
+    """
+    rows = []
+    for name, values in results.items():
+        base_values = baseline.get(name)
+        if not base_values:
+            continue
+        for metric, direction in DIRECTION.items():
+            if metric not in values or not base_values.get(metric):
+                continue
+            ratio = (values[metric] / base_values[metric]) ** direction
+            rows.append((name, metric, base_values[metric], values[metric], ratio, ratio < 1.0 - tolerance))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--quick", action="store_true", help="grid kecil (lebih cepat, noise lebih besar)")
+    parser.add_argument("--output", help="tulis hasil JSON ke path ini")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON untuk dibandingkan")
+    parser.add_argument("--save-baseline", action="store_true", help="simpan hasil sebagai baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="regresi relatif yang ditoleransi (default 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if "streamlit" in sys.modules:
+        raise RuntimeError("core simulasi tidak boleh meng-import streamlit")
+
+    results = run_suite(quick=args.quick)
+    payload = {"environment": environment(), "quick": args.quick, "results": results}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        print(f"\nhasil ditulis ke {args.output}")
+    if args.save_baseline:
+        # replications/* memakai process pool -> angka hanya sebanding di jumlah core yang sama
+        payload["note"] = (f"direkam di mesin {payload['environment']['cpu_count']} CPU; "
+                           "rekam ulang (--save-baseline) di mesin target sebelum dipakai sebagai gate")
+        with open(args.baseline, "w") as f:
+            json.dump(payload, f, indent=2, sort_keys=True)
+        print(f"baseline disimpan ke {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nbaseline {args.baseline} belum ada (jalankan dengan --save-baseline)")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline["results"], args.tolerance)
+    base_env = baseline["environment"]
+    print(f"\nvs baseline ({base_env['python']}, {base_env['machine']}, {base_env['cpu_count']} CPU), "
+          f"toleransi {args.tolerance:.0%}:")
+    if base_env["cpu_count"] != payload["environment"]["cpu_count"]:
+        print(f"PERINGATAN: baseline direkam di {base_env['cpu_count']} CPU, mesin ini "
+              f"{payload['environment']['cpu_count']} CPU -> replications/* tidak sebanding")
+    print(f"{'case':<36} {'metric':<24} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    regressions = 0
+    for name, metric, base, current, ratio, regressed in rows:
+        regressions += regressed
+        flag = "  REGRESI" if regressed else ""
+        print(f"{name:<36} {metric:<24} {base:12,.1f} {current:12,.1f} {ratio:6.2f}x{flag}")
+    print(f"\n{regressions} regresi dari {len(rows)} perbandingan")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
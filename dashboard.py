@@ -0,0 +1,1222 @@
+"""
+UI Streamlit dump truck simulation. Dijalankan lewat app.py (main() dipanggil
+tiap rerun); semua logika simulasi ada di package dump_truck_sim.
+"""
+import os
+import shutil
+import tempfile
+from contextlib import nullcontext
+
+import streamlit as st
+import pandas as pd
+import streamlit.components.v1 as components
+
+from dump_truck_sim.cache import ResultCache, cache_key
+from dump_truck_sim.export import FORMATS as EXPORT_FORMATS, export_replications
+from dump_truck_sim.profiling import profile_simulation
+from dump_truck_sim.topology import make_topology
+from dump_truck_sim.sweep import grid_scenarios, run_sweep, summarize_sweep, throughput_chart
+from dump_truck_sim.replication import (
+    run_replications,
+    run_until_precision,
+    run_batch_means,
+    average_metrics,
+    replication_seeds,
+)
+from replay_view import replay_height, replay_html
+
+
+@st.cache_resource
+def get_result_cache():
+    """Satu cache hasil per proses server (dibagi semua sesi / user)."""
+    return ResultCache()
+
+
+# ---------------------------------------------------------------------------------
+# CUSTOM CSS (visual style)
+# ---------------------------------------------------------------------------------
+CUSTOM_CSS = """
+.status-card {
+    background: #0f172a;
+    color: #f8fafc;
+    border: 1px solid #1e293b;
+    border-radius: 1rem;
+    padding: 1rem 1.25rem;
+    font-family: ui-rounded, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", sans-serif;
+    box-shadow: 0 20px 40px rgb(0 0 0 / 0.4);
+    min-height: 140px;
+}
+.status-title {
+    font-size: 0.8rem;
+    font-weight: 600;
+    letter-spacing: -0.03em;
+    color: #94a3b8;
+    text-transform: uppercase;
+    margin-bottom: .25rem;
+}
+.status-body {
+    font-size: 1rem;
+    font-weight: 500;
+    color: #f8fafc;
+    line-height: 1.4;
+    margin-bottom: .5rem;
+    display: flex;
+    flex-wrap: wrap;
+    gap: 0.4rem;
+}
+.badge {
+    border-radius: .5rem;
+    padding: .4rem .6rem;
+    font-size: .8rem;
+    font-weight: 500;
+    line-height: 1;
+    display: inline-block;
+}
+.badge-idle {
+    background: rgba(16,185,129,.12);
+    color: rgb(16,185,129);
+    border: 1px solid rgba(16,185,129,.4);
+}
+.badge-busy {
+    background: rgba(244,63,94,.12);
+    color: rgb(244,63,94);
+    border: 1px solid rgba(244,63,94,.4);
+}
+.truck-chip {
+    background: rgba(96,165,250,.12);
+    color: rgb(96,165,250);
+    border: 1px solid rgba(96,165,250,.4);
+    border-radius: .5rem;
+    padding: .4rem .6rem;
+    font-size: .8rem;
+    font-weight: 500;
+    line-height: 1;
+    display: inline-flex;
+    align-items: center;
+    gap: .4rem;
+}
+.pipeline-diagram {
+    background: radial-gradient(circle at 20% 20%, #1e2638 0%, #0b0f19 60%);
+    border-radius: 1rem;
+    border: 1px solid #1e293b;
+    padding: 1rem 1.5rem;
+    box-shadow: 0 24px 48px rgb(0 0 0 / .6);
+    color: #e2e8f0;
+    font-family: ui-rounded, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto;
+}
+.stage-box {
+    background: rgba(15,23,42,.6);
+    border: 1px solid rgba(148,163,184,.2);
+    border-radius: .75rem;
+    padding: .75rem 1rem;
+    flex: 1;
+    min-width: 140px;
+    text-align: center;
+}
+.stage-title {
+    font-size: .8rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: -0.03em;
+    color: #94a3b8;
+    margin-bottom: .25rem;
+}
+.stage-icon {
+    font-size: 1.2rem;
+    line-height: 1.2rem;
+}
+.stage-content {
+    font-size: .8rem;
+    line-height: 1.3;
+    color: #f8fafc;
+}
+.arrow {
+    font-size: 1.5rem;
+    line-height: 2rem;
+    color: #475569;
+    font-weight: 500;
+    padding: 0 .5rem;
+}
+.metrics-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit,minmax(180px,1fr));
+    gap: 1rem;
+}
+.metric-card {
+    background: #0f172a;
+    border-radius: .75rem;
+    border: 1px solid #1e293b;
+    padding: .75rem 1rem;
+    box-shadow: 0 20px 40px rgb(0 0 0 / 0.4);
+}
+.metric-label {
+    font-size: .7rem;
+    text-transform: uppercase;
+    font-weight: 600;
+    color: #94a3b8;
+    margin-bottom: .25rem;
+    letter-spacing: -0.03em;
+}
+.metric-value {
+    font-size: 1.4rem;
+    line-height: 1.2;
+    font-weight: 600;
+    color: #f8fafc;
+}
+.metric-suffix {
+    font-size: .75rem;
+    font-weight: 500;
+    color: #64748b;
+    margin-left: .25rem;
+}
+"""
+
+
+def render_distribution_editor(label, state_key):
+    st.sidebar.markdown(f"### {label} Time Distribution")
+    with st.sidebar.expander(f"{label} Durasi (menit) dan Prob (%)", expanded=False):
+        dist_list = st.session_state[state_key]
+
+        to_delete_idx = None
+        for i, row in enumerate(dist_list):
+            c1, c2, c3 = st.columns([1,1,0.4])
+            with c1:
+                new_time = st.number_input(
+                    f"{label} Durasi {i+1} (menit)",
+                    key=f"{state_key}_time_{i}",
+                    min_value=0.0,
+                    value=float(row["time"]),
+                    step=0.5,
+                )
+            with c2:
+                new_prob = st.number_input(
+                    f"Prob {i+1} (%)",
+                    key=f"{state_key}_prob_{i}",
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=float(row["prob"]),
+                    step=1.0,
+                )
+            with c3:
+                if st.button("🗑️", key=f"{state_key}_del_{i}"):
+                    to_delete_idx = i
+
+            row["time"] = new_time
+            row["prob"] = new_prob
+
+        # hapus baris jika tombol delete dipencet (tapi jangan kalau tinggal 1 baris)
+        if to_delete_idx is not None and len(dist_list) > 1:
+            dist_list.pop(to_delete_idx)
+
+        # tombol tambah baris baru
+        if st.button(f"➕ Add Option {label}", key=f"{state_key}_add"):
+            dist_list.append({"time": 0.0, "prob": 0.0})
+
+
+# ---------------------------------------------------------------------------------
+# HELPER RENDER
+# ---------------------------------------------------------------------------------
+
+def trucks_to_html(truck_ids, icon="🚚"):
+    if not truck_ids:
+        return '<span style="color:#475569;font-size:.8rem;">(empty)</span>'
+    chips = []
+    for t in truck_ids:
+        chips.append(f'<span class="truck-chip">{icon} T{t}</span>')
+    return " ".join(chips)
+
+def badge_html(busy):
+    status = "BUSY" if busy else "IDLE"
+    return f'<span class="badge {"badge-busy" if busy else "badge-idle"}">{status}</span>'
+
+
+# catatan peran per pool untuk status card
+SERVER_ROLE = {True: "Muat material.", False: "Bottleneck potensial."}
+
+
+def render_step_ui(timeline, step_idx):
+    # snapshot step aktif dibangun on-demand dari timeline kolom run pertama
+    current = timeline[step_idx]
+    steps_len = len(timeline)
+    topo = timeline.topology
+
+    # nilai live: gunakan hasil run pertama (yang lagi ditampilkan)
+    clock_now = round(current["clock"], 2)
+
+    # per server: (label, icon, is_loader, busy, truck, util so far %)
+    servers = []
+    for k, key in enumerate(topo.keys):
+        util_now = (current[key + "_busy_time"] / max(current["clock"], 1e-9)) * 100.0
+        servers.append((
+            topo.labels[k],
+            "🏗" if topo.is_loader(k) else "⚖️",
+            topo.is_loader(k),
+            current[key + "_busy"],
+            current[key + "_truck"],
+            round(util_now, 2),
+        ))
+
+    avg_loader_wait_now = round(current["avg_loader_wait_so_far"], 2)
+    avg_scale_wait_now  = round(current["avg_scale_wait_so_far"], 2)
+
+    loader_queue_html = trucks_to_html(current["loader_queue"], "🚚")
+    scale_queue_html = trucks_to_html(current["scale_queue"], "🚚")
+    traveling_html = trucks_to_html(current["traveling"], "🚚")
+
+    # METRICS SNAPSHOT (run pertama, live)
+    util_cards_html = "".join(
+        f"""
+        <div class="metric-card">
+            <div class="metric-label">{label.replace(" ", "")} Util (so far)</div>
+            <div class="metric-value">{util_now}<span class="metric-suffix"> %</span></div>
+        </div>
+        """
+        for label, _, _, _, _, util_now in servers
+    )
+    metrics_html = f"""
+    <div class="metrics-grid">
+        <div class="metric-card">
+            <div class="metric-label">Sim Clock (now)</div>
+            <div class="metric-value">{clock_now}<span class="metric-suffix"> min</span></div>
+        </div>
+
+        <div class="metric-card">
+            <div class="metric-label">Event</div>
+            <div class="metric-value">{current["event"] if current["event"] else "-"}<span class="metric-suffix"></span></div>
+        </div>
+
+        <div class="metric-card">
+            <div class="metric-label">Truck</div>
+            <div class="metric-value">{("T"+str(current["truck"])) if current["truck"] is not None else "-"}<span class="metric-suffix"></span></div>
+        </div>
+
+        <div class="metric-card">
+            <div class="metric-label">Avg Wait Loader (so far)</div>
+            <div class="metric-value">{avg_loader_wait_now}<span class="metric-suffix"> min</span></div>
+        </div>
+
+        <div class="metric-card">
+            <div class="metric-label">Avg Wait Scale (so far)</div>
+            <div class="metric-value">{avg_scale_wait_now}<span class="metric-suffix"> min</span></div>
+        </div>
+
+        {util_cards_html}
+
+        <div class="metric-card">
+            <div class="metric-label">Step</div>
+            <div class="metric-value">{step_idx}<span class="metric-suffix"> / {steps_len-1}</span></div>
+        </div>
+    </div>
+    """
+    n_cards = 6 + len(servers)
+    components.html(
+        f"""
+        <html>
+        <head><style>{CUSTOM_CSS}</style></head>
+        <body style="background-color:transparent;margin:0;">
+        {metrics_html}
+        </body>
+        </html>
+        """,
+        height=270 + 90 * max(0, (n_cards - 9 + 2) // 3),
+    )
+
+    st.markdown("---")
+
+    # PIPELINE SNAPSHOT (run pertama)
+    def server_boxes(is_loader):
+        return "".join(
+            f"""
+            <div class="stage-box" style="min-width:160px;">
+                <div class="stage-title">{label}</div>
+                <div class="stage-icon">{icon}</div>
+                <div class="stage-content">
+                    {badge_html(busy)}<br/>
+                    {trucks_to_html([truck] if truck is not None else [], "🚚")}
+                </div>
+            </div>
+            """
+            for label, icon, loader, busy, truck, _ in servers
+            if loader == is_loader
+        )
+
+    pipeline_html = f"""
+    <div class="pipeline-diagram">
+        <div style="display:flex; flex-wrap:wrap; align-items:flex-start; justify-content:center; gap:.75rem;">
+
+            <div class="stage-box">
+                <div class="stage-title">Loader Queue</div>
+                <div class="stage-icon">🚚⏳</div>
+                <div class="stage-content">{loader_queue_html}</div>
+            </div>
+
+            <div class="arrow">➡</div>
+
+            {server_boxes(True)}
+
+            <div class="arrow">➡</div>
+
+            <div class="stage-box">
+                <div class="stage-title">Scale Queue</div>
+                <div class="stage-icon">🚚⏳</div>
+                <div class="stage-content">{scale_queue_html}</div>
+            </div>
+
+            <div class="arrow">➡</div>
+
+            {server_boxes(False)}
+
+            <div class="arrow">➡</div>
+
+            <div class="stage-box">
+                <div class="stage-title">Traveling</div>
+                <div class="stage-icon">🔄</div>
+                <div class="stage-content">{traveling_html}</div>
+            </div>
+
+            <div class="arrow">↩</div>
+
+            <div class="stage-box" style="opacity:.6;">
+                <div class="stage-title">Back to Loader Queue</div>
+                <div class="stage-icon">🚚</div>
+                <div class="stage-content" style="font-size:.7rem; color:#94a3b8;">
+                    setelah travel selesai → join Loader Queue lagi
+                </div>
+            </div>
+
+        </div>
+    </div>
+    """
+    components.html(
+        f"""
+        <html>
+        <head><style>{CUSTOM_CSS}</style></head>
+        <body style="background-color: transparent; margin:0;">
+        {pipeline_html}
+        </body>
+        </html>
+        """,
+        height=420,
+        scrolling=True
+    )
+
+    st.markdown("---")
+
+    # RESOURCE STATUS CARDS (run pertama)
+    status_cards_html = "".join(
+        f"""
+        <div class="status-card" style="flex:1; min-width:250px;">
+            <div class="status-title">{label} {icon}</div>
+            <div class="status-body">
+                {badge_html(busy)}
+                <div class="truck-chip">🚚 Active:
+                    {("T"+str(truck)) if truck is not None else "None"}
+                </div>
+            </div>
+            <div style="font-size:.75rem;color:#94a3b8;line-height:1.4;">
+                Util (so far): <b>{util_now}%</b><br/>
+                {SERVER_ROLE[loader]}
+            </div>
+        </div>
+        """
+        for label, icon, loader, busy, truck, util_now in servers
+    )
+    components.html(
+        f"""
+        <html>
+        <head><style>{CUSTOM_CSS}</style></head>
+        <body style="background-color: transparent; margin:0;">
+        <div style="display:flex; flex-wrap:wrap; gap:1rem;">
+        {status_cards_html}
+        </div>
+        </body>
+        </html>
+        """,
+        height=260 * ((len(servers) + 2) // 3),
+    )
+
+    st.markdown("---")
+
+
+@st.fragment
+def render_server_replay(timeline, ui_phase):
+    """Replay versi server: Next / slider hanya me-rerun fragment ini."""
+    col_next, col_slider = st.columns([1,3])
+    with col_next:
+        next_clicked = st.button("➡ Next", use_container_width=True)
+    with col_slider:
+        manual_idx = st.slider(
+            "Manual Step Control (Run #1)",
+            min_value=0,
+            max_value=len(timeline)-1,
+            value=st.session_state.event_idx,
+            step=1,
+        )
+
+    # slider override
+    if manual_idx != st.session_state.event_idx:
+        st.session_state.event_idx = manual_idx
+
+    # next -> maju 1 event (masih run pertama)
+    if next_clicked:
+        if st.session_state.event_idx < len(timeline)-1:
+            st.session_state.event_idx += 1
+
+    # render snapshot untuk step aktif
+    with ui_phase("render_step"):
+        render_step_ui(timeline, st.session_state.event_idx)
+
+
+def render_final_performance(final_metrics_avg, topo):
+    # FINAL PERFORMANCE (AVERAGE ACROSS N RUNS)
+    avg_loader_wait_val = final_metrics_avg['avg_loader_queue_wait']
+    avg_scale_wait_val  = final_metrics_avg['avg_scale_queue_wait']
+    sim_end_clock_val   = final_metrics_avg['sim_end_time']
+    reps                = final_metrics_avg['replications']
+    batches             = final_metrics_avg.get('batches')
+
+    avg_loader_wait_round = round(avg_loader_wait_val)
+    avg_scale_wait_round  = round(avg_scale_wait_val)
+    sim_end_clock_round   = round(sim_end_clock_val)
+
+    if batches:
+        st.markdown(f"### ✅ Final Performance (Batch means: 1 run, {batches} batches)")
+    else:
+        st.markdown(f"### ✅ Final Performance (Averaged over {reps} run{'s' if reps>1 else ''})")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.metric(
+            "Avg Loader Queue Wait (final)",
+            f"{round(avg_loader_wait_val,2)} min  →  {avg_loader_wait_round} min"
+        )
+    with c2:
+        st.metric(
+            "Avg Weighing Queue Wait (final)",
+            f"{round(avg_scale_wait_val,2)} min  →  {avg_scale_wait_round} min"
+        )
+    with c3:
+        st.metric(
+            "Sim End Clock",
+            f"{round(sim_end_clock_val,2)} min  →  {sim_end_clock_round} min"
+        )
+
+    # panjang antrian time-weighted + throughput
+    q1, q2, q3 = st.columns(3)
+    with q1:
+        st.metric(
+            "Avg Loader Queue Length",
+            f"{final_metrics_avg['avg_loader_queue_len']:.2f} truck",
+            help=f"Maks {final_metrics_avg['max_loader_queue_len']:.1f} truck · "
+                 f"WIP loader (antri + dilayani) {final_metrics_avg['avg_loader_wip']:.2f}",
+        )
+    with q2:
+        st.metric(
+            "Avg Weighing Queue Length",
+            f"{final_metrics_avg['avg_scale_queue_len']:.2f} truck",
+            help=f"Maks {final_metrics_avg['max_scale_queue_len']:.1f} truck · "
+                 f"WIP timbangan (antri + dilayani) {final_metrics_avg['avg_scale_wip']:.2f}",
+        )
+    with q3:
+        st.metric(
+            "Throughput",
+            f"{final_metrics_avg['throughput_per_hour']:.2f} load/jam",
+        )
+
+    # utilisasi per server (3 kolom, urut loader lalu scale)
+    util_cols = st.columns(3)
+    for k, util_key in enumerate(topo.util_keys):
+        util_val = final_metrics_avg[util_key] * 100.0
+        with util_cols[k % 3]:
+            st.metric(
+                f"{topo.labels[k]} Util (final)",
+                f"{round(util_val,1)} %  →  {round(util_val)} %"
+            )
+
+    # half-width CI per metric (butuh >= 2 replikasi atau batch)
+    ci = final_metrics_avg.get("ci_halfwidth")
+    if ci and (reps > 1 or batches):
+        conf = round(final_metrics_avg.get("confidence", 0.95) * 100)
+        util_ci = " · ".join(
+            f"{topo.labels[k].lower()} ±{ci[util_key] * 100:.1f} %"
+            for k, util_key in enumerate(topo.util_keys)
+        )
+        st.caption(
+            f"CI {conf}% (± half-width): "
+            f"loader wait ±{ci['avg_loader_queue_wait']:.2f} min · "
+            f"weighing wait ±{ci['avg_scale_queue_wait']:.2f} min · "
+            f"{util_ci}"
+        )
+    if batches:
+        lag1 = final_metrics_avg["batch_lag1"]
+        worst = max(lag1, key=lambda k: abs(lag1[k]))
+        if abs(lag1[worst]) > 0.3:
+            st.warning(
+                f"Autokorelasi lag-1 batch means {worst} = {lag1[worst]:.2f}: batch terlalu pendek, "
+                f"CI bisa terlalu sempit. Perpanjang run atau kurangi jumlah batch."
+            )
+    if final_metrics_avg.get("warmup_time"):
+        st.caption(
+            f"Statistik steady-state: warm-up {final_metrics_avg['warmup_time']:.1f} menit "
+            f"pertama tiap replikasi dibuang (rata-rata)."
+        )
+    if "converged" in final_metrics_avg:
+        if final_metrics_avg["converged"]:
+            st.success(f"Semua target presisi tercapai setelah {reps} replikasi.")
+        else:
+            st.warning(f"Batas {reps} replikasi tercapai sebelum semua target presisi terpenuhi.")
+
+    st.markdown("---")
+
+
+def render_export(export_inputs, replication_engine):
+    """Export event log semua replikasi + final_metrics ke Parquet / Arrow, lalu download."""
+    with st.expander("💾 Export semua event & metrics (Parquet / Arrow)", expanded=False):
+        n_runs = export_inputs["num_runs"]
+        st.caption(
+            f"{n_runs} replikasi (seed {export_inputs['base_seed']}..{export_inputs['base_seed'] + n_runs - 1}) "
+            "dijalankan ulang dan di-stream ke file per row group, jadi memori tetap kecil. "
+            "Baca ulang dengan dump_truck_sim.read_export(path) (memory map)."
+            + (" Engine NumPy: replikasi 2..n diekspor dari engine Python, angkanya bisa beda "
+               "dengan rata-rata di atas." if replication_engine == "numpy" else "")
+        )
+        e1, e2, e3 = st.columns([1, 1, 2])
+        with e1:
+            export_format = st.selectbox(
+                "Format",
+                options=list(EXPORT_FORMATS),
+                format_func=lambda f: {"parquet": "Parquet (zstd)", "arrow": "Arrow IPC"}[f],
+                key="export_format_input",
+            )
+        with e2:
+            include_events = st.checkbox("Termasuk event log", value=True, key="export_events_input")
+        with e3:
+            st.write("")
+            prepare = st.button("Siapkan file export", key="export_button")
+
+        if prepare:
+            previous = st.session_state.export_files
+            if previous is not None:
+                shutil.rmtree(previous["dir"], ignore_errors=True)
+            out_dir = tempfile.mkdtemp(prefix="dump_truck_export_")
+            events_path = os.path.join(out_dir, f"events.{export_format}") if include_events else None
+            metrics_path = os.path.join(out_dir, f"metrics.{export_format}")
+            progress_bar = st.progress(0.0, text="Export...")
+
+            def _on_export_progress(done, total):
+                progress_bar.progress(done / total, text=f"Export replikasi {done}/{total}")
+
+            try:
+                result = export_replications(
+                    events_path,
+                    metrics_path,
+                    format=export_format,
+                    on_progress=_on_export_progress,
+                    **export_inputs,
+                )
+            except ImportError as exc:
+                # pyarrow opsional: tanpa itu dashboard tetap jalan, hanya export yang mati
+                progress_bar.empty()
+                shutil.rmtree(out_dir, ignore_errors=True)
+                st.session_state.export_files = None
+                st.warning(str(exc))
+            else:
+                progress_bar.empty()
+                st.session_state.export_files = dict(result, dir=out_dir, format=export_format)
+
+        files = st.session_state.export_files
+        if files is not None:
+            mime = "application/vnd.apache.parquet" if files["format"] == "parquet" else "application/vnd.apache.arrow.file"
+            d1, d2 = st.columns(2)
+            if files["events_path"] is not None:
+                with open(files["events_path"], "rb") as f:
+                    d1.download_button(
+                        f"⬇ Event log ({files['events']:,} baris)",
+                        data=f,
+                        file_name=f"dump_truck_events.{files['format']}",
+                        mime=mime,
+                    )
+            with open(files["metrics_path"], "rb") as f:
+                d2.download_button(
+                    f"⬇ Final metrics ({files['replications']} replikasi)",
+                    data=f,
+                    file_name=f"dump_truck_metrics.{files['format']}",
+                    mime=mime,
+                )
+
+
+def parse_levels(text, cast):
+    """'2, 4, 6' -> [2, 4, 6] (nilai kosong / tidak valid di-skip)."""
+    levels = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            levels.append(cast(part))
+        except ValueError:
+            pass
+    return levels
+
+
+def main():
+    # -----------------------------------------------------------------------------
+    # PAGE CONFIG
+    # -----------------------------------------------------------------------------
+    st.set_page_config(page_title="Dump Truck Simulation", layout="wide")
+
+    result_cache = get_result_cache()
+
+    # -----------------------------------------------------------------------------
+    # SESSION STATE INIT (termasuk distribusi dinamis & hasil simulasi)
+    # -----------------------------------------------------------------------------
+
+    # Distribusi default (set sekali)
+    if "loaderA_dist" not in st.session_state:
+        st.session_state.loaderA_dist = [
+            {"time": 4.0, "prob": 25.0},
+            {"time": 5.0, "prob": 40.0},
+            {"time": 6.0, "prob": 35.0},
+        ]
+    if "loaderB_dist" not in st.session_state:
+        st.session_state.loaderB_dist = [
+            {"time": 4.0, "prob": 35.0},
+            {"time": 5.0, "prob": 40.0},
+            {"time": 6.0, "prob": 25.0},
+        ]
+    if "scale_dist" not in st.session_state:
+        st.session_state.scale_dist = [
+            {"time": 4.0, "prob": 30.0},
+            {"time": 5.0, "prob": 45.0},
+            {"time": 6.0, "prob": 25.0},
+        ]
+
+    # state hasil simulasi
+    if "timeline_steps" not in st.session_state:
+        st.session_state.timeline_steps = []
+    if "final_metrics_avg" not in st.session_state:
+        st.session_state.final_metrics_avg = {}
+    if "event_log" not in st.session_state:
+        st.session_state.event_log = []
+    if "trucks_final" not in st.session_state:
+        st.session_state.trucks_final = []
+    if "event_idx" not in st.session_state:
+        st.session_state.event_idx = 0
+    if "sweep_summary" not in st.session_state:
+        st.session_state.sweep_summary = None
+    if "profiler" not in st.session_state:
+        st.session_state.profiler = None
+    if "replay_html" not in st.session_state:
+        st.session_state.replay_html = None
+    if "export_inputs" not in st.session_state:
+        st.session_state.export_inputs = None
+    if "export_files" not in st.session_state:
+        st.session_state.export_files = None
+
+    # -----------------------------------------------------------------------------
+    # SIDEBAR INPUT FORM
+    # -----------------------------------------------------------------------------
+
+    st.title("🚧 Dump Truck Cyclic Haulage Simulation (Step Replay + Multi-Run Avg)")
+    st.caption(
+        "Run Simulation untuk 1 atau lebih replikasi.\n"
+        "• Slider / Next = lihat urutan event dari replikasi pertama.\n"
+        "• Final Performance = rata-rata dari semua replikasi.\n"
+        "• Nilai ditampilkan (as-is) → (dibulatkan)."
+    )
+
+    st.sidebar.header("Simulation Inputs")
+
+    # topologi: jumlah server per pool (nama & key state dari topology.py)
+    st.sidebar.markdown("### Topologi")
+    n_loaders = st.sidebar.number_input(
+        "Jumlah loader",
+        min_value=1,
+        max_value=26,
+        value=2,
+        step=1,
+        key="n_loaders_input"
+    )
+    n_scales = st.sidebar.number_input(
+        "Jumlah scale",
+        min_value=1,
+        max_value=8,
+        value=1,
+        step=1,
+        key="n_scales_input"
+    )
+    ui_topology = make_topology(loaders=[None] * int(n_loaders), scales=[None] * int(n_scales))
+
+    # editor distribusi service time per server (server baru menyalin server
+    # pertama di pool-nya: Loader A / Scale)
+    server_state_keys = []
+    for k, key in enumerate(ui_topology.keys):
+        state_key = key + "_dist"
+        if state_key not in st.session_state:
+            template = "loaderA_dist" if ui_topology.is_loader(k) else "scale_dist"
+            st.session_state[state_key] = [dict(row) for row in st.session_state[template]]
+        render_distribution_editor(ui_topology.labels[k], state_key)
+        server_state_keys.append(state_key)
+
+
+    def server_pools():
+        """(loaders, scales) sebagai list (nama, [(time, prob)]) dari editor sidebar."""
+        dists = [
+            [(row["time"], row["prob"]) for row in st.session_state[state_key]]
+            for state_key in server_state_keys
+        ]
+        n = ui_topology.n_loaders
+        loaders = [(name, dist) for (name, _), dist in zip(ui_topology.loaders, dists[:n])]
+        scales = [(name, dist) for (name, _), dist in zip(ui_topology.scales, dists[n:])]
+        return loaders, scales
+
+    st.sidebar.markdown("### Traveling & Runtime")
+    travel_time_value = st.sidebar.number_input(
+        "Travel Time (menit, deterministik)",
+        min_value=0.0,
+        value=10.0,
+        step=0.5,
+        key="travel_time_value_input"
+    )
+    total_time = st.sidebar.number_input(
+        "Total Simulation Time (menit)",
+        min_value=1.0,
+        value=120.0,
+        step=10.0,
+        key="total_time_input"
+    )
+    n_trucks = st.sidebar.number_input(
+        "Jumlah truck",
+        min_value=1,
+        value=6,
+        step=1,
+        key="n_trucks_input"
+    )
+
+    warmup_mode = st.sidebar.selectbox(
+        "Warm-up",
+        options=["none", "fixed", "mser5"],
+        format_func=lambda m: {"none": "Tanpa warm-up", "fixed": "Tetap (menit)", "mser5": "Otomatis (MSER-5)"}[m],
+        key="warmup_mode_input",
+        help="Statistik final dihitung setelah periode warm-up (semua truck mulai di antrian loader). "
+             "MSER-5 mendeteksi titik potong per replikasi dari panjang antrian loader.",
+    )
+    warmup = None
+    if warmup_mode == "fixed":
+        warmup = st.sidebar.number_input(
+            "Periode warm-up (menit)",
+            min_value=0.0,
+            max_value=max(float(total_time) - 1.0, 0.0),
+            value=min(30.0, max(float(total_time) - 1.0, 0.0)),
+            step=5.0,
+            key="warmup_input",
+        )
+    elif warmup_mode == "mser5":
+        warmup = "mser5"
+
+    st.sidebar.markdown("### Replications")
+    num_runs = st.sidebar.number_input(
+        "Jumlah replikasi (n)",
+        min_value=1,
+        value=1,
+        step=1,
+        key="num_runs_input"
+    )
+    base_seed = st.sidebar.number_input(
+        "Seed (0 = acak)",
+        min_value=0,
+        value=0,
+        step=1,
+        key="base_seed_input",
+        help="Seed > 0 -> replikasi i memakai seed+i, hasil bisa direproduksi.",
+    )
+
+    replication_engine = st.sidebar.selectbox(
+        "Engine replikasi 2..n",
+        options=["python", "numpy"],
+        format_func=lambda e: {"python": "Python (process pool)", "numpy": "NumPy batch (vectorized)"}[e],
+        key="replication_engine_input",
+        help="NumPy batch menjalankan ribuan replikasi sekaligus; replikasi #1 tetap engine Python.",
+    )
+
+    legacy_trace = st.sidebar.checkbox(
+        "Tampilkan event CHECK_ASSIGN",
+        value=False,
+        key="legacy_trace_input",
+        help="Trace lama untuk pengajaran: tiap END_* / END_TRAVEL menjadwalkan CHECK_ASSIGN "
+             "sebagai step sendiri. Hasil metric sama, hanya timeline lebih panjang.",
+    )
+
+    replay_mode = st.sidebar.selectbox(
+        "Replay step run #1",
+        options=["browser", "server"],
+        format_func=lambda m: {"browser": "Browser (tanpa rerun)", "server": "Server (Next / slider)"}[m],
+        key="replay_mode_input",
+        help="Browser: timeline dikirim sekali, Next / Prev / slider / autoplay dijalankan di browser. "
+             "Server: tiap step dirender ulang oleh Python (hanya bagian replay yang rerun).",
+    )
+
+    profiling = st.sidebar.checkbox(
+        "Profiling",
+        value=False,
+        key="profiling_input",
+        help="Ukur events/sec, waktu per fase, peak memori & ukuran heap replikasi #1 "
+             "(dijalankan ulang terpisah, tidak ikut cache) plus waktu render UI.",
+    )
+
+    estimation_mode = st.sidebar.selectbox(
+        "Estimasi final performance",
+        options=["replications", "batch_means"],
+        format_func=lambda m: {"replications": "Replikasi independen", "batch_means": "Batch means (1 run panjang)"}[m],
+        key="estimation_mode_input",
+        help="Batch means: 1 run panjang tanpa timeline, warm-up dibuang sekali, lalu dibagi batch "
+             "untuk CI. Replay di bawah tetap memakai horizon Total Simulation Time.",
+    )
+    run_length = None
+    n_batches = None
+    if estimation_mode == "batch_means":
+        run_length = st.sidebar.number_input(
+            "Panjang run batch means (menit)",
+            min_value=float(total_time),
+            value=float(total_time) * 20,
+            step=float(total_time),
+            key="run_length_input",
+        )
+        n_batches = st.sidebar.number_input(
+            "Jumlah batch",
+            min_value=2,
+            max_value=50,
+            value=20,
+            step=1,
+            key="n_batches_input",
+        )
+
+    sequential_mode = estimation_mode == "replications" and st.sidebar.checkbox(
+        "Stop otomatis (target presisi CI)",
+        value=False,
+        key="sequential_mode_input",
+        help="Replikasi ditambah per batch sampai half-width CI 95% tiap metric <= target, "
+             "atau batas maksimum tercapai. Jumlah replikasi (n) di atas jadi batch awal.",
+    )
+    ci_targets = {}
+    max_runs = None
+    if sequential_mode:
+        max_runs = st.sidebar.number_input(
+            "Maks replikasi",
+            min_value=2,
+            value=1000,
+            step=50,
+            key="max_runs_input",
+        )
+        with st.sidebar.expander("Target half-width relatif (%)", expanded=False):
+            st.caption("0 = metric tidak ditarget.")
+            target_keys = (
+                ("avg_loader_queue_wait", "avg_scale_queue_wait")
+                + ui_topology.util_keys
+                + ("throughput_per_hour",)
+            )
+            for metric_key in target_keys:
+                ci_targets[metric_key] = st.number_input(
+                    metric_key,
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=5.0,
+                    step=0.5,
+                    key=f"ci_target_{metric_key}",
+                ) / 100.0
+
+    run_button = st.sidebar.button("▶ Run Simulation")
+    cache_status = st.sidebar.empty()
+
+    # -----------------------------------------------------------------------------
+    # KETIKA RUN SIMULATION DIKLIK
+    # -----------------------------------------------------------------------------
+
+    if run_button:
+        # Siapkan distribusi (list of (time,prob)) per server dari sidebar editable state
+        loaders, scales = server_pools()
+
+        sim_inputs = dict(
+            dist_loader_A=None,
+            dist_loader_B=None,
+            dist_scale=None,
+            loaders=loaders,
+            scales=scales,
+            travel_time_value=travel_time_value,
+            total_time=total_time,
+            n_trucks=int(n_trucks),
+            base_seed=int(base_seed) if base_seed > 0 else None,
+            engine=replication_engine,
+            legacy_trace=legacy_trace,
+            warmup=warmup,
+        )
+        # seed acak ditarik sekali di sini -> export & profiling memakai seed
+        # yang sama dengan replikasi yang ditampilkan (cache tetap hanya
+        # untuk seed dari user)
+        cacheable = sim_inputs["base_seed"] is not None
+        sim_inputs["base_seed"] = replication_seeds(sim_inputs["base_seed"], 1)[0]
+
+        def compute_run():
+            # replikasi disebar ke semua core; hanya replikasi #1 yang bawa timeline
+            progress_bar = st.progress(0.0, text="Running replications...")
+
+            def _on_progress(done, total):
+                progress_bar.progress(done / total, text=f"Replikasi {done}/{total}")
+
+            if estimation_mode == "batch_means":
+                progress_bar.progress(0.0, text=f"Batch means: 1 run × {run_length:g} menit...")
+                try:
+                    metrics_avg, _ = run_batch_means(
+                        n_batches=int(n_batches),
+                        **dict(
+                            {k: sim_inputs[k] for k in (
+                                "dist_loader_A", "dist_loader_B", "dist_scale", "loaders", "scales",
+                                "travel_time_value", "n_trucks", "base_seed", "warmup",
+                            )},
+                            total_time=float(run_length),
+                        ),
+                    )
+                except ValueError as exc:
+                    # mis. warm-up >= panjang run, atau batch terlalu banyak untuk MSER-5
+                    progress_bar.empty()
+                    st.error(f"Batch means gagal: {exc}")
+                    st.stop()
+                # replay: seed sama -> identik dengan awal run panjang
+                _, run_1 = run_replications(num_runs=1, **sim_inputs)
+            elif sequential_mode:
+                def _on_batch(done, total, summary):
+                    pending = [k for k, rel in ci_targets.items()
+                               if rel and summary["ci_halfwidth"][k] > rel * abs(summary[k])]
+                    progress_bar.progress(
+                        min(done / total, 1.0),
+                        text=f"Replikasi {done} (maks {total}) — belum presisi: {', '.join(pending) or '-'}",
+                    )
+
+                metrics_avg, run_1 = run_until_precision(
+                    targets=ci_targets,
+                    min_runs=max(2, int(num_runs)),
+                    max_runs=int(max_runs),
+                    on_progress=_on_batch,
+                    **sim_inputs,
+                )
+            else:
+                metrics_list, run_1 = run_replications(
+                    num_runs=int(num_runs),
+                    on_progress=_on_progress,
+                    **sim_inputs,
+                )
+                metrics_avg = average_metrics(metrics_list)
+            progress_bar.empty()
+            return metrics_avg, run_1
+
+        # hasil hanya deterministik kalau seed tetap -> hanya itu yang di-cache
+        if cacheable:
+            run_key = cache_key(
+                "run",
+                num_runs=int(num_runs),
+                sequential=sequential_mode,
+                max_runs=int(max_runs) if sequential_mode else None,
+                estimation=estimation_mode,
+                run_length=run_length,
+                n_batches=n_batches,
+                targets=ci_targets,
+                **sim_inputs,
+            )
+            final_metrics_avg, first_run = result_cache.get_or_compute(run_key, compute_run)
+        else:
+            final_metrics_avg, first_run = compute_run()
+
+        final_metrics_first, timeline_steps_first, event_log_first, trucks_final_first = first_run
+
+        # update session_state agar UI pakai data ini
+        st.session_state.timeline_steps = timeline_steps_first
+        st.session_state.final_metrics_avg = final_metrics_avg
+        st.session_state.event_log = event_log_first
+        st.session_state.trucks_final = trucks_final_first
+        st.session_state.event_idx = 0
+        st.session_state.replay_html = None
+
+        # export: replikasi yang sama dijalankan ulang (engine python) saat diminta
+        st.session_state.export_inputs = dict(
+            {k: v for k, v in sim_inputs.items() if k != "engine"},
+            num_runs=int(final_metrics_avg.get("replications", num_runs)),
+        )
+        if st.session_state.export_files is not None:
+            shutil.rmtree(st.session_state.export_files["dir"], ignore_errors=True)
+        st.session_state.export_files = None
+
+        # profiling: replikasi #1 dijalankan ulang dengan instrumentasi (di luar cache)
+        st.session_state.profiler = None
+        if profiling:
+            seed_1 = replication_seeds(sim_inputs["base_seed"], 1)[0]
+            st.session_state.profiler = profile_simulation(
+                {k: v for k, v in sim_inputs.items() if k not in ("base_seed", "engine")},
+                seed=seed_1,
+            )
+
+
+    # -----------------------------------------------------------------------------
+    # NAVIGATION CONTROLS (Next + Slider) UNTUK REPLIKASI PERTAMA
+    # -----------------------------------------------------------------------------
+
+    if len(st.session_state.timeline_steps) == 0:
+        st.info("Isi parameter → klik ▶ Run Simulation untuk mulai.")
+    else:
+        steps = st.session_state.timeline_steps
+        final_metrics_avg = st.session_state.final_metrics_avg
+
+        # waktu render UI ikut dicatat kalau ada hasil profiling
+        profiler = st.session_state.profiler
+
+        def ui_phase(name):
+            return profiler.phase(name) if profiler is not None else nullcontext()
+
+        if replay_mode == "browser":
+            # timeline dikirim sekali; step di browser tanpa rerun
+            with ui_phase("render_replay"):
+                if st.session_state.replay_html is None:
+                    st.session_state.replay_html = replay_html(steps.to_payload(), CUSTOM_CSS)
+                components.html(
+                    st.session_state.replay_html,
+                    height=replay_height(steps.topology.n_servers),
+                    scrolling=True,
+                )
+            st.markdown("---")
+        else:
+            render_server_replay(steps, ui_phase)
+
+        render_final_performance(final_metrics_avg, steps.topology)
+
+        with ui_phase("render_tables"):
+            # tabel per truck DARI RUN PERTAMA (bukan average)
+            st.markdown("### 🚚 Statistik per Truck (Run #1)")
+            truck_table = []
+            for tr in st.session_state.trucks_final:
+                truck_table.append({
+                    "Truck": f"T{tr['id']}",
+                    "Total Wait @ Loader (min)": round(tr["total_wait_loader"], 2),
+                    "Total Wait @ Scale (min)": round(tr["total_wait_scale"], 2),
+                    "#Times Loaded": tr["loader_visits"],
+                    "#Times Weighed": tr["scale_visits"],
+                    "Final State (end of run #1)": tr["state"],
+                })
+            st.table(pd.DataFrame(truck_table))
+
+            # event log terakhir dari run pertama
+            st.markdown("### 📝 Event Log (Run #1, last 30 events)")
+            to_show = st.session_state.event_log[-30:]
+            st.dataframe(pd.DataFrame(to_show))
+
+        render_export(st.session_state.export_inputs, replication_engine)
+
+        if profiler is not None:
+            report = profiler.report()
+            with st.expander("⏱ Profiling (Run #1)", expanded=False):
+                p1, p2, p3 = st.columns(3)
+                p1.metric("Events/sec", f"{report['events_per_sec']:,.0f}")
+                p2.metric("Waktu simulate", f"{report['simulate_seconds'] * 1000:.1f} ms")
+                peak = report["peak_memory_bytes"]
+                p3.metric("Peak memori", f"{peak / 1024:.0f} KiB" if peak is not None else "-")
+                phase_rows = [
+                    {
+                        "Fase": name,
+                        "Total (ms)": round(row["seconds"] * 1000, 3),
+                        "Panggilan": row["calls"],
+                        "µs/panggilan": round(row["us_per_call"], 2),
+                        "% simulate": round(row["share"] * 100, 1),
+                    }
+                    for name, row in report["phases"].items()
+                ]
+                phase_rows.append({
+                    "Fase": "core (sisa loop engine)",
+                    "Total (ms)": round(report["core_other_seconds"] * 1000, 3),
+                    "Panggilan": None,
+                    "µs/panggilan": None,
+                    "% simulate": round(report["core_other_seconds"] / max(report["simulate_seconds"], 1e-12) * 100, 1),
+                })
+                st.dataframe(pd.DataFrame(phase_rows), use_container_width=True)
+                st.caption(
+                    "Fase render_* = waktu render UI (akumulasi semua rerun). "
+                    "Waktu fase engine sudah termasuk overhead timer. "
+                    f"Ukuran heap maks {report['heap']['max']} event."
+                )
+                if report["heap"]["samples"]:
+                    st.line_chart(
+                        pd.DataFrame(report["heap"]["samples"], columns=["event", "heap size"]).set_index("event")
+                    )
+                st.download_button(
+                    "⬇ Download profil (JSON)",
+                    data=profiler.to_json(),
+                    file_name="dump_truck_profile.json",
+                    mime="application/json",
+                )
+
+
+    # -----------------------------------------------------------------------------
+    # SCENARIO SWEEP (fleet sizing)
+    # -----------------------------------------------------------------------------
+
+    st.markdown("---")
+    st.markdown("## 📈 Scenario Sweep (Fleet Sizing)")
+    with st.expander("Grid scenario (distribusi dari sidebar)", expanded=False):
+        sc1, sc2, sc3 = st.columns(3)
+        with sc1:
+            sweep_trucks_text = st.text_input("Jumlah truck", value="2, 4, 6, 8, 10", key="sweep_trucks_input")
+        with sc2:
+            sweep_travel_text = st.text_input(
+                "Travel time (menit)", value=f"{travel_time_value:g}", key="sweep_travel_input"
+            )
+        with sc3:
+            sweep_horizon_text = st.text_input(
+                "Total time (menit)", value=f"{total_time:g}", key="sweep_horizon_input"
+            )
+        sweep_runs = st.number_input(
+            "Replikasi per scenario", min_value=2, value=20, step=1, key="sweep_runs_input"
+        )
+        sweep_button = st.button("▶ Run Sweep", key="sweep_button")
+
+    if sweep_button:
+        sweep_loaders, sweep_scales = server_pools()
+        sweep_base = dict(
+            dist_loader_A=None,
+            dist_loader_B=None,
+            dist_scale=None,
+            loaders=sweep_loaders,
+            scales=sweep_scales,
+            travel_time_value=travel_time_value,
+            total_time=total_time,
+            n_trucks=int(n_trucks),
+        )
+        axes = dict(
+            n_trucks=parse_levels(sweep_trucks_text, int) or [int(n_trucks)],
+            travel_time_value=parse_levels(sweep_travel_text, float) or [travel_time_value],
+            total_time=parse_levels(sweep_horizon_text, float) or [total_time],
+        )
+        scenarios = grid_scenarios(sweep_base, **axes)
+        sweep_bar = st.progress(0.0, text=f"Sweep {len(scenarios)} scenario...")
+
+        def _on_sweep_progress(done, total):
+            sweep_bar.progress(done / total, text=f"Replikasi {done}/{total}")
+
+        sweep_results = run_sweep(
+            scenarios,
+            num_runs=int(sweep_runs),
+            base_seed=int(base_seed) if base_seed > 0 else None,
+            on_progress=_on_sweep_progress,
+            cache=result_cache,
+        )
+        sweep_bar.empty()
+        st.session_state.sweep_summary = summarize_sweep(sweep_results)
+
+    if st.session_state.sweep_summary is not None:
+        sweep_summary = st.session_state.sweep_summary
+        st.altair_chart(throughput_chart(sweep_summary), use_container_width=True)
+        st.dataframe(sweep_summary)
+
+
+    # status cache (diisi terakhir supaya counter run ini ikut terhitung)
+    cache_stats = result_cache.stats()
+    cache_status.caption(
+        f"Cache: {cache_stats['hits_memory']} hit memory · {cache_stats['hits_disk']} hit disk · "
+        f"{cache_stats['misses']} miss · {cache_stats['disk_items']} entry "
+        f"({cache_stats['disk_bytes'] / 2**20:.1f} MB di disk)"
+    )
@@ -0,0 +1,62 @@
+"""
+Package engine dump truck simulation (tanpa Streamlit).
+
+Export di level package di-load lazy (PEP 562): `import dump_truck_sim.engine`
+di worker process hanya memuat engine + sampling/timeline/topology/stats,
+bukan replication (multiprocessing), cache, profiling atau export (pyarrow).
+"""
+import importlib
+
+_EXPORTS = {
+    "sample_from_distribution": "sampling",
+    "DiscreteSampler": "sampling",
+    "resource_streams": "sampling",
+    "iter_simulation": "engine",
+    "run_simulation_with_timeline": "engine",
+    "run_simulation_metrics": "engine",
+    "run_simulation_batch_means": "engine",
+    "ColumnarTimeline": "timeline",
+    "Topology": "topology",
+    "make_topology": "topology",
+    "run_replications": "replication",
+    "run_until_precision": "replication",
+    "compare_scenarios": "replication",
+    "run_batch_means": "replication",
+    "replication_seeds": "replication",
+    "average_metrics": "replication",
+    "iter_metrics": "replication",
+    "RunningStats": "stats",
+    "MetricAccumulator": "stats",
+    "t_quantile": "stats",
+    "mser_truncation": "stats",
+    "lag1_autocorrelation": "stats",
+    "ResultCache": "cache",
+    "cache_key": "cache",
+    "Profiler": "profiling",
+    "profile_simulation": "profiling",
+    "export_replications": "export",
+    "EventLogWriter": "export",
+    "MetricsWriter": "export",
+    "read_export": "export",
+    "iter_export": "export",
+    "export_metadata": "export",
+    "load_config": "cli",
+    "run_config": "cli",
+    "SimulationService": "service",
+    "make_server": "service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # cache: lookup berikutnya tanpa __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
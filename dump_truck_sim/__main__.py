@@ -0,0 +1,7 @@
+"""python -m dump_truck_sim config.yaml -> batch runner (cli.py)."""
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+"""
+Batch simulator (NumPy): banyak replikasi dijalankan lockstep sebagai array.
+
+Siklusnya tetap (pool loader -> pool scale -> travel -> loader, N x M
+server lewat topology.py), dan tiap truck paling banyak punya 1 event pending. Jadi future event list per
+replikasi cukup berupa array next_time[n_trucks, R]: event berikutnya =
+argmin per kolom, tanpa heapq. Array per truck/per server disimpan
+transposed (truck x replikasi) supaya reduksi min/argmin jalan di axis 0
+yang kontigu -- jauh lebih cepat daripada reduksi axis pendek. Setiap iterasi memproses tepat 1 event untuk
+setiap replikasi yang masih aktif.
+
+Semantik sama dengan run_simulation_with_timeline (event di luar total_time
+tidak dijadwalkan, wait dihitung saat service mulai, utilisasi = busy time /
+clock event terakhir). Tie waktu dipecah dengan urutan penjadwalan seperti
+counter heap engine referensi kalau ada > 1 scale (di situ urutan END_LOAD
+vs END_SCALE menentukan scale mana yang dipakai); dengan 1 scale urutan tie
+tidak mengubah hasil. RNG memakai numpy.random.Generator, jadi hasil per
+replikasi tidak identik tapi secara statistik sama.
+"""
+import numpy as np
+
+from .sampling import DiscreteSampler, RESOURCES
+from .topology import make_topology
+
+# state truck
+QUEUE_LOADER = 0
+LOADING = 1
+QUEUE_SCALE = 2
+SCALING = 3
+TRAVEL = 4
+
+
+class _VectorSampler:
+    """DiscreteSampler versi vektor: uniform * total lalu searchsorted(cdf)."""
+
+    def __init__(self, options):
+        base = DiscreteSampler(options)
+        self.values = np.asarray(base.values, dtype=np.float64)
+        self.cdf = np.asarray(base.cdf, dtype=np.float64)
+        self.total = base.total
+
+    def sample(self, gen, k):
+        if self.total <= 0:
+            return np.full(k, self.values[0])
+        # side="left" == bisect_left == aturan "r <= cum" di sampler lama
+        idx = np.searchsorted(self.cdf, gen.random(k) * self.total, side="left")
+        return self.values[np.minimum(idx, len(self.values) - 1)]
+
+
+def resource_generators(seed, resources=RESOURCES):
+    """
+    numpy.random.Generator per resource (versi batch dari resource_streams).
+    SeedSequence([seed, k]) -> stream resource k independen dan sama untuk
+    seed yang sama di skenario mana pun (common random numbers).
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    return {name: np.random.default_rng([int(seed), k]) for k, name in enumerate(resources)}
+
+
+def run_simulation_batch(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    n_reps=1000,
+    seed=None,
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+):
+    """
+    Jalankan n_reps replikasi sekaligus. loaders / scales: topologi N loader
+    x M scale seperti iter_simulation. legacy_trace hanya mengubah trace
+    event di engine referensi, jadi di sini diabaikan (metrics sama).
+    warmup: None atau angka (menit) seperti iter_simulation; "mser5" tidak
+    didukung di sini (replication.py memakai hasil deteksi replikasi #1).
+
+    returns dict {nama metric: np.ndarray (n_reps,)} dengan field yang sama
+    seperti final_metrics dari run_simulation_with_timeline.
+    """
+    if isinstance(warmup, str):
+        raise ValueError(f"batch engine needs a fixed warmup, got {warmup!r}")
+    warmup = float(warmup or 0.0)
+    if not 0 <= warmup < total_time:
+        raise ValueError(f"warmup must be in [0, total_time), got {warmup}")
+
+    topo = make_topology(dist_loader_A, dist_loader_B, dist_scale, loaders, scales)
+    gens = resource_generators(seed, topo.resources)
+    R, N = int(n_reps), int(n_trucks)
+    rows_all = np.arange(R)
+
+    L, S = topo.n_loaders, topo.n_scales
+    samplers = [_VectorSampler(dist) for dist in topo.dists]
+    server_gens = [gens[name] for name in topo.resources]
+    loader_samplers, scale_samplers = samplers[:L], samplers[L:]
+    loader_gens, scale_gens = server_gens[:L], server_gens[L:]
+
+    clock = np.zeros(R)
+    active = np.ones(R, dtype=bool)
+
+    # per truck (truck x replikasi)
+    state = np.full((N, R), QUEUE_LOADER, dtype=np.int8)
+    next_time = np.full((N, R), np.inf)
+    server = np.full((N, R), -1, dtype=np.int16)
+    enter_time = np.zeros((N, R))
+    # urutan penjadwalan (pemecah tie, hanya dipakai kalau > 1 scale)
+    order_ties = S > 1
+    seq = np.zeros((N, R), dtype=np.int64)
+    seq_counter = 0
+
+    # server: truck yang sedang dilayani (-1 = idle) + busy time
+    loader_truck = np.full((L, R), -1, dtype=np.int32)
+    scale_truck = np.full((S, R), -1, dtype=np.int32)
+    loader_busy_time = np.zeros((L, R))
+    scale_busy_time = np.zeros((S, R))
+
+    # FIFO queue sebagai ring buffer (kapasitas n_trucks cukup)
+    loader_ring = np.tile(np.arange(N, dtype=np.int32), (R, 1))
+    loader_head = np.zeros(R, dtype=np.int64)
+    loader_len = np.full(R, N, dtype=np.int64)
+    scale_ring = np.zeros((R, N), dtype=np.int32)
+    scale_head = np.zeros(R, dtype=np.int64)
+    scale_len = np.zeros(R, dtype=np.int64)
+
+    loader_wait = np.zeros(R)
+    loader_visits = np.zeros(R, dtype=np.int64)
+    scale_wait = np.zeros(R)
+    scale_visits = np.zeros(R, dtype=np.int64)
+    loads_delivered = np.zeros(R, dtype=np.int64)
+    # luas di bawah kurva panjang antrian + maksimum (interval durasi > 0)
+    loader_q_area = np.zeros(R)
+    scale_q_area = np.zeros(R)
+    max_loader_q = np.zeros(R, dtype=np.int64)
+    max_scale_q = np.zeros(R, dtype=np.int64)
+
+    def push(ring, head, length, rows, trucks):
+        ring[rows, (head[rows] + length[rows]) % N] = trucks
+        length[rows] += 1
+
+    def pop(ring, head, length, rows):
+        trucks = ring[rows, head[rows]]
+        head[rows] = (head[rows] + 1) % N
+        length[rows] -= 1
+        return trucks
+
+    def assign(mask, pool_truck, samplers, pool_gens, ring, head, length, wait_sum, visits, busy_state):
+        nonlocal seq_counter
+        # server dicoba berurutan (A dulu, lalu B) seperti try_assign_loader
+        for k, sampler in enumerate(samplers):
+            rows = np.nonzero(mask & (pool_truck[k] < 0) & (length > 0))[0]
+            if rows.size == 0:
+                continue
+            trucks = pop(ring, head, length, rows)
+            now = clock[rows]
+            post = now >= warmup   # statistik hanya setelah warm-up
+            wait_sum[rows] += np.where(post, now - enter_time[trucks, rows], 0.0)
+            visits[rows] += post
+            pool_truck[k, rows] = trucks
+            state[trucks, rows] = busy_state
+            server[trucks, rows] = k
+            end = now + sampler.sample(pool_gens[k], rows.size)
+            next_time[trucks, rows] = np.where(end <= total_time, end, np.inf)
+            seq[trucks, rows] = seq_counter
+            seq_counter += 1
+
+    # t = 0: CHECK_ASSIGN awal
+    assign(active, loader_truck, loader_samplers, loader_gens, loader_ring, loader_head, loader_len,
+           loader_wait, loader_visits, LOADING)
+    assign(active, scale_truck, scale_samplers, scale_gens, scale_ring, scale_head, scale_len,
+           scale_wait, scale_visits, SCALING)
+
+    while True:
+        ev_truck = np.argmin(next_time, axis=0)
+        ev_time = next_time[ev_truck, rows_all]
+        if order_ties:
+            tied = np.where(next_time == ev_time, seq, np.iinfo(np.int64).max)
+            ev_truck = np.argmin(tied, axis=0)
+        active = np.isfinite(ev_time)
+        if not active.any():
+            break
+
+        # akumulasi busy time sampai event berikutnya (bagian setelah
+        # warm-up saja), lalu maju clock
+        dt = np.where(active, np.maximum(ev_time - np.maximum(clock, warmup), 0.0), 0.0)
+        loader_busy_time += (loader_truck >= 0) * dt
+        scale_busy_time += (scale_truck >= 0) * dt
+        loader_q_area += loader_len * dt
+        scale_q_area += scale_len * dt
+        moved = dt > 0
+        np.maximum(max_loader_q, np.where(moved, loader_len, 0), out=max_loader_q)
+        np.maximum(max_scale_q, np.where(moved, scale_len, 0), out=max_scale_q)
+        clock = np.where(active, ev_time, clock)
+
+        ev_state = state[ev_truck, rows_all]
+        next_time[ev_truck[active], rows_all[active]] = np.inf
+
+        # END_LOAD_*: loader bebas, truck masuk antrian scale
+        rows = np.nonzero(active & (ev_state == LOADING))[0]
+        if rows.size:
+            trucks = ev_truck[rows]
+            loader_truck[server[trucks, rows], rows] = -1
+            state[trucks, rows] = QUEUE_SCALE
+            enter_time[trucks, rows] = clock[rows]
+            push(scale_ring, scale_head, scale_len, rows, trucks)
+            # referensi: END_LOAD langsung memanggil try_assign_scale
+            assign(active & (ev_state == LOADING), scale_truck, scale_samplers, scale_gens,
+                   scale_ring, scale_head, scale_len, scale_wait, scale_visits, SCALING)
+
+        # END_SCALE: scale bebas, truck mulai travel (deterministik)
+        rows = np.nonzero(active & (ev_state == SCALING))[0]
+        if rows.size:
+            trucks = ev_truck[rows]
+            scale_truck[server[trucks, rows], rows] = -1
+            loads_delivered[rows] += clock[rows] >= warmup
+            state[trucks, rows] = TRAVEL
+            end = clock[rows] + travel_time_value
+            next_time[trucks, rows] = np.where(end <= total_time, end, np.inf)
+            seq[trucks, rows] = seq_counter
+            seq_counter += 1
+
+        # END_TRAVEL: kembali ke antrian loader
+        rows = np.nonzero(active & (ev_state == TRAVEL))[0]
+        if rows.size:
+            trucks = ev_truck[rows]
+            state[trucks, rows] = QUEUE_LOADER
+            enter_time[trucks, rows] = clock[rows]
+            push(loader_ring, loader_head, loader_len, rows, trucks)
+
+        # CHECK_ASSIGN: di engine referensi CHECK_ASSIGN masuk heap setelah
+        # event lain di waktu yang sama, jadi assignment ditunda sampai semua
+        # event pada clock ini selesai (penting untuk preferensi Loader A).
+        ready = active & (next_time.min(axis=0) > clock)
+        assign(ready, loader_truck, loader_samplers, loader_gens, loader_ring, loader_head, loader_len,
+               loader_wait, loader_visits, LOADING)
+        assign(ready, scale_truck, scale_samplers, scale_gens, scale_ring, scale_head, scale_len,
+               scale_wait, scale_visits, SCALING)
+
+    sim_runtime = np.maximum(clock - warmup, 1e-9)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_loader_wait = np.where(loader_visits > 0, loader_wait / loader_visits, 0.0)
+        avg_scale_wait = np.where(scale_visits > 0, scale_wait / scale_visits, 0.0)
+
+    out = {
+        "avg_loader_queue_wait": avg_loader_wait,
+        "avg_scale_queue_wait": avg_scale_wait,
+        "avg_loader_queue_len": loader_q_area / sim_runtime,
+        "avg_scale_queue_len": scale_q_area / sim_runtime,
+        "max_loader_queue_len": max_loader_q,
+        "max_scale_queue_len": max_scale_q,
+        "avg_loader_wip": (loader_q_area + loader_busy_time.sum(axis=0)) / sim_runtime,
+        "avg_scale_wip": (scale_q_area + scale_busy_time.sum(axis=0)) / sim_runtime,
+    }
+    busy_time = np.concatenate([loader_busy_time, scale_busy_time])
+    for k, key in enumerate(topo.util_keys):
+        out[key] = busy_time[k] / sim_runtime
+    out["sim_end_time"] = clock
+    out["loads_delivered"] = loads_delivered
+    out["throughput_per_hour"] = loads_delivered * 60.0 / (total_time - warmup)
+    out["warmup_time"] = np.full(R, warmup)
+    return out
+
+
+def batch_to_metrics_list(batch_metrics):
+    """dict of arrays -> list of final_metrics dict (format replication.py)."""
+    keys = list(batch_metrics)
+    columns = [batch_metrics[k].tolist() for k in keys]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
@@ -0,0 +1,192 @@
+"""
+Cache hasil simulasi berbasis konten (content-addressed).
+
+Key = sha256 dari JSON kanonik semua input yang menentukan hasil
+(distribusi, travel time, horizon, jumlah truck, replikasi, seed, engine,
+...). LRU in-memory di depan store disk (1 file pickle per key) dengan
+eviksi berdasarkan total ukuran: file yang paling lama tidak dipakai
+dibuang duluan. Aman dipakai bersama dari banyak sesi Streamlit (thread).
+"""
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+# naikkan kalau semantik engine berubah -> semua key lama otomatis basi
+CACHE_VERSION = 3
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "DUMP_TRUCK_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "dump_truck_sim"),
+)
+
+_MISSING = object()
+
+
+def _canonical(value):
+    """
+    Nilai input -> bentuk JSON stabil (tuple -> list). int tetap eksak (seed
+    > 2**53 tidak bertabrakan); float bulat -> int supaya 5 dan 5.0 sama.
+    """
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    raise TypeError(f"cannot hash cache input of type {type(value).__name__}")
+
+
+def cache_key(namespace, **inputs):
+    """Hash kanonik: urutan argumen & 5 vs 5.0 tidak mengubah key."""
+    payload = json.dumps(
+        {"v": CACHE_VERSION, "ns": namespace, "inputs": _canonical(inputs)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU memory (max_items entry) + disk store (max_disk_bytes, None = tanpa
+    disk). get() -> value atau default; put(); get_or_compute().
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_items=32, max_disk_bytes=512 * 2**20):
+        self.directory = directory
+        self.max_items = max_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits_memory = 0
+        self.hits_disk = 0
+        self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    # ------------------------------------------------------------------ memory
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    # -------------------------------------------------------------------- disk
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _read_disk(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return _MISSING
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # file rusak / format lama: anggap miss
+            _remove(path)
+            return _MISSING
+        os.utime(path)  # mtime = waktu terakhir dipakai (untuk eviksi LRU)
+        return value
+
+    def _write_disk(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)  # atomic: pembaca tidak pernah lihat file setengah jadi
+        except BaseException:
+            _remove(tmp)
+            raise
+        self._evict_disk()
+
+    def _disk_entries(self):
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".pkl"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def _evict_disk(self):
+        entries = self._disk_entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            _remove(path)
+            total -= size
+
+    # ------------------------------------------------------------------ public
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits_memory += 1
+                return self._memory[key]
+            if self.directory:
+                value = self._read_disk(key)
+                if value is not _MISSING:
+                    self.hits_disk += 1
+                    self._remember(key, value)
+                    return value
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+            if self.directory:
+                self._write_disk(key, value)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self.directory:
+                for _, _, path in self._disk_entries():
+                    _remove(path)
+
+    def stats(self):
+        """Counter hit/miss + ukuran cache (untuk ditampilkan di UI)."""
+        with self._lock:
+            entries = self._disk_entries() if self.directory else []
+            lookups = self.hits_memory + self.hits_disk + self.misses
+            return {
+                "hits_memory": self.hits_memory,
+                "hits_disk": self.hits_disk,
+                "misses": self.misses,
+                "hit_rate": (self.hits_memory + self.hits_disk) / lookups if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "disk_items": len(entries),
+                "disk_bytes": sum(size for _, size, _ in entries),
+            }
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,454 @@
+"""
+Batch runner command line (tanpa Streamlit): replikasi headless atau sweep
+scenario dari file config YAML / JSON, dijalankan di semua core. Hasil per
+replikasi di-stream ke disk begitu chunk selesai, ringkasan (mean + half-width
+CI per scenario) dicetak di akhir.
+
+    python -m dump_truck_sim scenario.yaml
+    python -m dump_truck_sim scenario.json --replications 1000 --output out/metrics.parquet
+
+Contoh config (key scenario = argumen run_simulation_metrics):
+
+    n_trucks: 6
+    travel_time_value: 10
+    total_time: 480
+    warmup: null              # menit, "mser5", atau null
+    loaders:                  # list distribusi, atau mapping nama -> distribusi
+      A: [[4, 25], [5, 40], [6, 35]]
+      B: [[4, 35], [5, 40], [6, 25]]
+    scales:
+      - [[1, 30], [2, 45], [3, 25]]
+    replications: 100
+    seed: 1                   # null -> acak (seed dasar dicetak di ringkasan)
+    workers: null             # null -> semua core
+    sweep:                    # opsional, full factorial (grid_scenarios)
+      n_trucks: [4, 6, 8]
+      travel_time_value: [5, 10]
+    output: results/metrics.csv   # .csv / .jsonl / .parquet / .arrow
+    summary: results/summary.json # opsional, default <output>.summary.json
+
+Distribusi = list [durasi (menit), prob (%)]. Axis sweep loaders / scales /
+dist_* sebaiknya mapping {label: nilai} supaya kolom hasil cukup label.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+
+from .engine import WARMUP_MSER5
+from .replication import METRIC_KEYS, iter_metrics, replication_seeds
+from .stats import MetricAccumulator
+from .topology import make_topology
+
+SCENARIO_FIELDS = (
+    "n_trucks",
+    "travel_time_value",
+    "total_time",
+    "warmup",
+    "legacy_trace",
+    "loaders",
+    "scales",
+    "dist_loader_A",
+    "dist_loader_B",
+    "dist_scale",
+)
+RUN_FIELDS = ("replications", "seed", "workers", "confidence", "sweep", "output", "summary")
+_DIST_FIELDS = ("dist_loader_A", "dist_loader_B", "dist_scale")
+_POOL_FIELDS = ("loaders", "scales")
+OUTPUT_FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet", ".arrow": "arrow"}
+
+# metric yang ditampilkan di ringkasan sweep (single scenario: semua metric)
+_SWEEP_SUMMARY_KEYS = ("avg_loader_queue_wait", "avg_scale_queue_wait", "throughput_per_hour")
+
+
+# ---------------------------------------------------------------------------------
+# CONFIG
+# ---------------------------------------------------------------------------------
+
+def load_config(path):
+    """Baca config YAML (.yaml / .yml, butuh PyYAML) atau JSON -> dict."""
+    with open(path) as f:
+        text = f.read()
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ImportError(f"{path}: config YAML butuh PyYAML (pip install pyyaml) atau pakai config JSON") from exc
+        config = yaml.safe_load(text)
+    else:
+        config = json.loads(text)
+    if not isinstance(config, dict):
+        raise ValueError(f"{path}: config must be a mapping")
+    return config
+
+
+def _number(value, where):
+    """Angka JSON / YAML (int atau float, bukan bool) -> float."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{where}: expected a number, got {value!r}")
+    return float(value)
+
+
+def _integer(value, where, minimum=None):
+    """Bilangan bulat (bukan bool, bukan float) dengan batas bawah opsional."""
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{where}: expected an integer, got {value!r}")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{where}: must be >= {minimum}, got {value}")
+    return value
+
+
+def _dist(value, where):
+    """[[durasi, prob], ...] -> list of (float, float)."""
+    if not isinstance(value, (list, tuple)) or not value:
+        raise ValueError(f"{where}: distribution must be a non-empty list of [time, prob]")
+    out = []
+    for row in value:
+        if not isinstance(row, (list, tuple)) or len(row) != 2:
+            raise ValueError(f"{where}: distribution row must be [time, prob], got {row!r}")
+        out.append((_number(row[0], where), _number(row[1], where)))
+    return out
+
+
+def _pool(value, where):
+    """list distribusi atau mapping nama -> distribusi -> argumen loaders / scales."""
+    if isinstance(value, dict):
+        return [(str(name), _dist(dist, f"{where}.{name}")) for name, dist in value.items()]
+    if not isinstance(value, (list, tuple)) or not value:
+        raise ValueError(f"{where}: expected a list or mapping of distributions")
+    return [_dist(dist, f"{where}[{i}]") for i, dist in enumerate(value)]
+
+
+def _field(name, value, where):
+    if name in _DIST_FIELDS:
+        return _dist(value, where)
+    if name in _POOL_FIELDS:
+        return _pool(value, where)
+    if name == "n_trucks":
+        return _integer(value, where, minimum=1)
+    if name in ("travel_time_value", "total_time"):
+        return _number(value, where)
+    return value
+
+
+def build_scenarios(config):
+    """
+    Config -> list of (labels, scenario) seperti grid_scenarios. Tanpa
+    "sweep" hasilnya satu scenario dengan labels kosong.
+    """
+    unknown = sorted(set(config) - set(SCENARIO_FIELDS) - set(RUN_FIELDS))
+    if unknown:
+        raise ValueError(f"unknown config keys: {', '.join(unknown)}")
+
+    base = dict(
+        dist_loader_A=None,
+        dist_loader_B=None,
+        dist_scale=None,
+        loaders=None,
+        scales=None,
+        n_trucks=6,
+        legacy_trace=False,
+        warmup=None,
+    )
+    for name in SCENARIO_FIELDS:
+        if config.get(name) is not None:
+            base[name] = _field(name, config[name], name)
+
+    axes = {}
+    for name, levels in (config.get("sweep") or {}).items():
+        if name not in SCENARIO_FIELDS:
+            raise ValueError(f"sweep: unknown axis {name!r}")
+        if isinstance(levels, dict):
+            axes[name] = {label: _field(name, v, f"sweep.{name}.{label}") for label, v in levels.items()}
+        elif name in _POOL_FIELDS or name in _DIST_FIELDS:
+            raise ValueError(f"sweep.{name}: use a mapping {{label: value}} for distribution axes")
+        elif isinstance(levels, list) and levels:
+            axes[name] = [_field(name, v, f"sweep.{name}") for v in levels]
+        else:
+            raise ValueError(f"sweep.{name}: expected a non-empty list or mapping of levels")
+
+    from .sweep import grid_scenarios
+
+    scenarios = grid_scenarios(base, **axes) if axes else [({}, base)]
+    for labels, scenario in scenarios:
+        where = f"scenario {labels}" if labels else "config"
+        for name in ("travel_time_value", "total_time"):
+            if scenario.get(name) is None:
+                raise ValueError(f"{where}: missing {name}")
+        if scenario["loaders"] is None and None in (scenario["dist_loader_A"], scenario["dist_loader_B"]):
+            raise ValueError(f"{where}: missing loaders (or dist_loader_A / dist_loader_B)")
+        if scenario["scales"] is None and scenario["dist_scale"] is None:
+            raise ValueError(f"{where}: missing scales (or dist_scale)")
+        # prasyarat engine dicek di sini (bukan di tengah run / di worker)
+        if scenario["total_time"] <= 0:
+            raise ValueError(f"{where}: total_time must be > 0")
+        if scenario["travel_time_value"] < 0:
+            raise ValueError(f"{where}: travel_time_value must be >= 0")
+        warmup = scenario["warmup"]
+        if warmup is not None and warmup != WARMUP_MSER5:
+            if isinstance(warmup, bool) or not isinstance(warmup, (int, float)):
+                raise ValueError(f"{where}: warmup must be minutes, {WARMUP_MSER5!r} or null")
+            if not 0 <= warmup < scenario["total_time"]:
+                raise ValueError(f"{where}: warmup must be in [0, total_time), got {warmup}")
+        make_topology(*(scenario[k] for k in _DIST_FIELDS + _POOL_FIELDS))  # nama server valid
+    return scenarios, list(axes)
+
+
+def run_options(config, max_replications=None):
+    """
+    Key run (replications, seed, confidence, workers) -> (num_runs, seed,
+    confidence, workers), dicek sebelum ada replikasi yang jalan. Key kosong
+    / null -> default (1 replikasi, seed acak, 95%, semua core).
+    """
+    num_runs = config.get("replications")
+    num_runs = 1 if num_runs is None else _integer(num_runs, "replications", minimum=1)
+    if max_replications is not None and num_runs > max_replications:
+        raise ValueError(f"replications must be in [1, {max_replications}]")
+    seed = config.get("seed")
+    if seed is not None:
+        _integer(seed, "seed")
+    confidence = config.get("confidence")
+    confidence = 0.95 if confidence is None else _number(confidence, "confidence")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    workers = config.get("workers")
+    if workers is not None:
+        _integer(workers, "workers", minimum=1)
+    return num_runs, seed, confidence, workers
+
+
+def metric_keys(scenarios):
+    """Kolom metric semua scenario (util_* gabungan kalau topologi berbeda)."""
+    util = []
+    for _, scenario in scenarios:
+        for key in make_topology(*(scenario[k] for k in _DIST_FIELDS + _POOL_FIELDS)).util_keys:
+            if key not in util:
+                util.append(key)
+    keys = []
+    for key in METRIC_KEYS:
+        if not key.startswith("util_"):
+            keys.append(key)
+        if key == "avg_scale_wip":
+            keys.extend(util)
+    return keys
+
+
+def _label_values(labels):
+    """Label satu axis -> int / float / str seragam (tipe kolom output stabil)."""
+    if all(isinstance(v, int) and not isinstance(v, bool) for v in labels):
+        return list(labels)
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in labels):
+        return [float(v) for v in labels]
+    return [str(v) for v in labels]
+
+
+# ---------------------------------------------------------------------------------
+# OUTPUT (streaming, 1 baris per replikasi)
+# ---------------------------------------------------------------------------------
+
+class _CsvWriter:
+    def __init__(self, path, columns):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, restval="")
+        self._writer.writeheader()
+
+    def write(self, row):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path, columns):
+        self._file = open(path, "w")
+        self._columns = columns
+
+    def write(self, row):
+        self._file.write(json.dumps({c: row.get(c) for c in self._columns}) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class _ArrowWriter:
+    """Parquet / Arrow IPC lewat export.MetricsWriter (row group per 1024 replikasi)."""
+
+    def __init__(self, path, columns, format, metadata):
+        from .export import MetricsWriter
+
+        keys = [c for c in columns if c not in ("replication", "seed")]
+        self._writer = MetricsWriter(path, format, metadata=metadata, keys=keys)
+
+    def write(self, row):
+        self._writer.write(row["replication"], row["seed"], row)
+
+    def close(self):
+        self._writer.close()
+
+
+def open_output(path, columns, metadata=None):
+    """Writer baris sesuai ekstensi path (.csv / .jsonl / .parquet / .arrow)."""
+    format = OUTPUT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if format is None:
+        raise ValueError(f"unsupported output extension: {path} (use {', '.join(OUTPUT_FORMATS)})")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if format == "csv":
+        return _CsvWriter(path, columns)
+    if format == "jsonl":
+        return _JsonlWriter(path, columns)
+    return _ArrowWriter(path, columns, format, metadata)
+
+
+# ---------------------------------------------------------------------------------
+# RUN
+# ---------------------------------------------------------------------------------
+
+def run_config(config, log=None):
+    """
+    Jalankan config (dict, lihat docstring modul). Baris per replikasi ditulis
+    ke config["output"] (kalau ada) dalam urutan selesai.
+
+    returns {"base_seed", "replications", "seconds", "axes", "scenarios": [
+    {"scenario", "labels", **MetricAccumulator.summary()}]}.
+    """
+    scenarios, axes = build_scenarios(config)
+    num_runs, seed, confidence, workers = run_options(config)
+    seeds = replication_seeds(seed, num_runs)
+
+    keys = metric_keys(scenarios)
+    labels = [{} for _ in scenarios]
+    for axis in axes:
+        values = _label_values([lab[axis] for lab, _ in scenarios])
+        for s_idx, value in enumerate(values):
+            labels[s_idx][axis] = value
+
+    out = None
+    if config.get("output"):
+        columns = ["scenario"] + axes + ["replication", "seed"] + keys
+        out = open_output(config["output"], columns, metadata={"base_seed": seeds[0], "axes": axes})
+
+    accs = [None] * len(scenarios)
+    total = len(scenarios) * num_runs
+    done = 0
+    t0 = time.perf_counter()
+    try:
+        for s_idx, i, metrics in iter_metrics([s for _, s in scenarios], seeds, workers):
+            if accs[s_idx] is None:
+                accs[s_idx] = MetricAccumulator(metrics)
+            accs[s_idx].push(metrics)
+            if out is not None:
+                row = {"scenario": s_idx, "replication": i + 1, "seed": seeds[i]}
+                row.update(labels[s_idx])
+                row.update(metrics)
+                out.write(row)
+            done += 1
+            if log:
+                log(done, total)
+    finally:
+        if out is not None:
+            out.close()
+
+    return {
+        "base_seed": seeds[0],
+        "replications": num_runs,
+        "seconds": time.perf_counter() - t0,
+        "axes": axes,
+        "scenarios": [
+            dict(acc.summary(confidence), scenario=s_idx, labels=labels[s_idx])
+            for s_idx, acc in enumerate(accs)
+        ],
+    }
+
+
+def format_summary(result):
+    """Ringkasan teks: 1 blok per scenario, metric mean ± half-width."""
+    lines = [
+        f"{len(result['scenarios'])} scenario x {result['replications']} replikasi "
+        f"(seed {result['base_seed']}..{result['base_seed'] + result['replications'] - 1}), "
+        f"{result['seconds']:.1f} s"
+    ]
+    for summary in result["scenarios"]:
+        lines.append("")
+        head = f"scenario {summary['scenario']}"
+        if summary["labels"]:
+            head += "  " + " ".join(f"{k}={v}" for k, v in summary["labels"].items())
+        lines.append(head)
+        hw = summary["ci_halfwidth"]
+        keys = [k for k in hw if k.startswith("util_") or k in _SWEEP_SUMMARY_KEYS] if result["axes"] else list(hw)
+        for key in keys:
+            half = "" if math.isinf(hw[key]) or math.isnan(hw[key]) else f" ± {hw[key]:.4f}"
+            lines.append(f"  {key:<24} {summary[key]:>12.4f}{half}")
+    return "\n".join(lines)
+
+
+def _json_safe(value):
+    """inf / NaN (half-width n < 2, util server yang tidak ada) -> null."""
+    if isinstance(value, dict):
+        return {k: _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _progress(stream):
+    last = [0.0]
+
+    def log(done, total):
+        now = time.perf_counter()
+        if done == total or now - last[0] >= 0.5:
+            last[0] = now
+            stream.write(f"\rreplikasi {done}/{total}")
+            if done == total:
+                stream.write("\n")
+            stream.flush()
+
+    return log
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m dump_truck_sim",
+        description="Replikasi headless / sweep scenario dari config YAML atau JSON.",
+    )
+    parser.add_argument("config", help="file config .yaml / .yml / .json")
+    parser.add_argument("--replications", type=int, help="override 'replications'")
+    parser.add_argument("--seed", type=int, help="override 'seed'")
+    parser.add_argument("--workers", type=int, help="override 'workers' (1 = serial)")
+    parser.add_argument("--output", help="override 'output' (.csv / .jsonl / .parquet / .arrow)")
+    parser.add_argument("--summary", help="override 'summary' (JSON ringkasan)")
+    parser.add_argument("--quiet", action="store_true", help="tanpa progress di stderr")
+    args = parser.parse_args(argv)
+
+    try:
+        config = load_config(args.config)
+        for name in ("replications", "seed", "workers", "output", "summary"):
+            if getattr(args, name) is not None:
+                config[name] = getattr(args, name)
+        result = run_config(config, log=None if args.quiet else _progress(sys.stderr))
+    except (OSError, ValueError, ImportError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    print(format_summary(result))
+    summary_path = config.get("summary")
+    if summary_path is None and config.get("output"):
+        summary_path = os.path.splitext(config["output"])[0] + ".summary.json"
+    if summary_path:
+        with open(summary_path, "w") as f:
+            json.dump(_json_safe(result), f, indent=2)
+        print(f"\nringkasan ditulis ke {summary_path}")
+    if config.get("output"):
+        print(f"hasil per replikasi: {config['output']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
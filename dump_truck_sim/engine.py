@@ -0,0 +1,642 @@
+"""
+Simulation engine dump truck (tanpa Streamlit) supaya bisa di-import oleh
+worker process, batch job, maupun UI (dashboard.py).
+"""
+import heapq
+from contextlib import nullcontext
+from collections import deque
+
+from .stats import mser_truncation
+from .sampling import (
+    DiscreteSampler,
+    resource_streams,
+    sample_from_distribution,  # noqa: F401 (re-export)
+)
+from .timeline import (
+    ColumnarTimeline,
+    EVENT_NAMES,  # noqa: F401 (re-export: kode event topologi default -> nama)
+)
+from .topology import CHECK_ASSIGN, make_topology
+
+# jenis item yang di-yield iter_simulation
+EVENT = "event"
+STEP = "step"
+FINAL = "final"
+
+# warm-up otomatis: horizon dibagi MSER_BINS bin waktu, deret = panjang
+# antrian loader rata-rata per bin, dipotong dengan MSER-5
+WARMUP_MSER5 = "mser5"
+MSER_BINS = 100
+
+
+def _mark_times(warmup, total_time, n_batches):
+    """
+    Waktu checkpoint akumulator: grid bin MSER, atau [warmup] (kalau > 0)
+    + batas batch yang membagi [warmup, total_time] sama panjang.
+    """
+    if warmup == WARMUP_MSER5:
+        if n_batches and n_batches > MSER_BINS // 2:
+            raise ValueError(f"n_batches must be <= {MSER_BINS // 2} with MSER-5 warm-up")
+        return [total_time * i / MSER_BINS for i in range(1, MSER_BINS)]
+    warmup = float(warmup or 0.0)
+    if not 0 <= warmup < total_time:
+        raise ValueError(f"warmup must be in [0, total_time), got {warmup}")
+    times = [warmup] if warmup > 0 else []
+    if n_batches:
+        times += [warmup + (total_time - warmup) * j / n_batches for j in range(1, n_batches)]
+    return times
+
+
+def _interval_metrics(points, a, b, util_keys, n_loaders, span):
+    """
+    Metric untuk interval checkpoint points[a] -> points[b]. Checkpoint =
+    tuple kumulatif dari iter_simulation; max antrian = max per interval
+    mark di (a, b]. span = durasi pembagi throughput.
+    """
+    (t0, l_wait0, l_visits0, s_wait0, s_visits0,
+     l_area0, s_area0, loads0, busy0, _, _) = points[a]
+    (t1, l_wait1, l_visits1, s_wait1, s_visits1,
+     l_area1, s_area1, loads1, busy1, _, _) = points[b]
+
+    runtime = max(t1 - t0, 1e-9)
+    busy = [x1 - x0 for x0, x1 in zip(busy0, busy1)]
+    l_area = l_area1 - l_area0
+    s_area = s_area1 - s_area0
+    l_visits = l_visits1 - l_visits0
+    s_visits = s_visits1 - s_visits0
+    loads = loads1 - loads0
+
+    metrics = {
+        "avg_loader_queue_wait": (l_wait1 - l_wait0) / l_visits if l_visits else 0.0,
+        "avg_scale_queue_wait": (s_wait1 - s_wait0) / s_visits if s_visits else 0.0,
+        # panjang antrian rata-rata (time-weighted) & maksimum
+        "avg_loader_queue_len": l_area / runtime,
+        "avg_scale_queue_len": s_area / runtime,
+        "max_loader_queue_len": max(p[9] for p in points[a + 1:b + 1]) if b > a else 0,
+        "max_scale_queue_len": max(p[10] for p in points[a + 1:b + 1]) if b > a else 0,
+        # WIP per stasiun = antrian + truck yang sedang dilayani
+        "avg_loader_wip": (l_area + sum(busy[:n_loaders])) / runtime,
+        "avg_scale_wip": (s_area + sum(busy[n_loaders:])) / runtime,
+    }
+    # utilisasi per server: util_loader_A, util_loader_B, util_scale, ...
+    for k, key in enumerate(util_keys):
+        metrics[key] = busy[k] / runtime
+    metrics["sim_end_time"] = t1
+    metrics["loads_delivered"] = loads
+    metrics["throughput_per_hour"] = loads * 60.0 / span
+    metrics["warmup_time"] = t0
+    return metrics
+
+
+# ---------------------------------------------------------------------------------
+# SIMULATION CORE (1 replikasi, streaming event-by-event)
+# ---------------------------------------------------------------------------------
+def iter_simulation(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    seed=None,
+    events=True,
+    snapshots=False,
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+    n_batches=None,
+    profiler=None,
+):
+    """
+    Generator 1 replikasi. Item yang di-yield (tuple, elemen pertama = jenis):
+
+    ("event", clock, code, truck_id, service)
+        satu baris event log (posisi log_event lama). code -> nama event
+        lewat Topology.event_names (topologi default: EVENT_NAMES),
+        truck_id None untuk CHECK_ASSIGN, service None kecuali START_*.
+    ("step", clock, snapshot)
+        semua event heap pada satu clock selesai diproses. snapshot = dict
+        format snapshot_state lama kalau snapshots=True, selain itu None.
+    ("final", final_metrics, trucks, batch_metrics)
+        sentinel terakhir setelah horizon habis. batch_metrics = list
+        metric per batch kalau n_batches diisi, selain itu None.
+
+    loaders / scales: list dist atau list (nama, dist) per server; kalau
+    diisi menggantikan dist_loader_A/B / dist_scale (lihat topology.py).
+    events=False -> mode headless: tidak ada item per event, hanya sentinel
+    final (akumulator busy time & wait saja yang di-update).
+
+    Default: assignment dipanggil langsung setelah semua event heap dengan
+    clock yang sama diproses (1 step per clock, tanpa event CHECK_ASSIGN).
+    legacy_trace=True -> trace lama untuk pengajaran: tiap END_* / END_TRAVEL
+    menjadwalkan CHECK_ASSIGN nol-delay sebagai event & step sendiri. Urutan
+    assignment sama, jadi final_metrics identik per seed (selama service &
+    travel time > 0); hanya jumlah event heap / step yang berbeda.
+
+    warmup: None -> final_metrics atas seluruh run; angka (menit) -> semua
+    akumulator di-reset di clock tsb (statistik steady-state atas
+    [warmup, akhir]); "mser5" -> titik potong dideteksi per run dengan
+    MSER-5 atas rata-rata panjang antrian loader per bin waktu. Waktu yang
+    dipakai dilaporkan di final_metrics["warmup_time"]. Snapshot / timeline
+    tetap menampilkan angka "so far" tanpa potongan.
+
+    n_batches: periode setelah warm-up dibagi n_batches batch sama panjang
+    (MSER-5: kelompok bin setelah titik potong) dan metric tiap batch ikut
+    dikembalikan untuk CI batch means. Memori O(n_batches), tidak tergantung
+    panjang run.
+
+    profiler: profiling.Profiler opsional; fungsi hot-path (sampling, heap
+    push/pop, log event, snapshot) dibungkus timer hanya kalau diisi.
+    Consumer boleh berhenti kapan saja (break / close()).
+    """
+    topo = make_topology(dist_loader_A, dist_loader_B, dist_scale, loaders, scales)
+    n_loaders = topo.n_loaders
+    n_servers = topo.n_servers
+    end_travel_code = topo.end_travel
+    event_names = topo.event_names
+    server_keys = topo.keys
+    busy_states = topo.busy_states
+
+    # RNG privat per replikasi DAN per server. seed=None -> acak tiap run;
+    # seed tertentu -> reproducible (serial maupun paralel), dan dua skenario
+    # dengan seed sama memakai common random numbers per resource.
+    streams = resource_streams(seed, topo.resources)
+    rngs = [streams[name] for name in topo.resources]
+
+    # sampler dikompilasi sekali per run (bukan per service), 1 per server
+    samplers = [DiscreteSampler(dist).sample for dist in topo.dists]
+
+    clock = 0.0
+
+    # FIFO queue O(1) di kedua ujung + himpunan truck yang sedang travel
+    loader_queue = deque(range(n_trucks))
+    scale_queue = deque()
+    traveling = set()
+
+    # state server (array per server, index global k): truck aktif (None =
+    # idle), busy time yang sudah selesai, dan waktu mulai service berjalan
+    server_truck = [None] * n_servers
+    busy_time = [0.0] * n_servers
+    busy_since = [0.0] * n_servers
+
+    # server bebas per pool sebagai min-heap index: dispatch O(log n) dan
+    # index terkecil duluan (Loader A sebelum B, seperti urutan lama)
+    free_loaders = list(range(n_loaders))
+    free_scales = list(range(n_loaders, n_servers))
+
+    trucks = []
+    for i in range(n_trucks):
+        trucks.append({
+            "id": i,
+            "state": "QUEUE_LOADER",
+            "last_queue_enter_loader": 0.0,
+            "total_wait_loader": 0.0,
+            "loader_visits": 0,
+
+            "last_queue_enter_scale": None,
+            "total_wait_scale": 0.0,
+            "scale_visits": 0,
+
+            "travel_end_time": None,
+        })
+
+    loads_delivered = 0   # muatan yang selesai ditimbang (END_SCALE)
+
+    # running total wait & kunjungan (avg so far / final tanpa scan trucks)
+    loader_wait_total = 0.0
+    loader_visits_total = 0
+    scale_wait_total = 0.0
+    scale_visits_total = 0
+
+    # luas di bawah kurva panjang antrian (time-weighted) + maksimum; hanya
+    # interval dengan durasi > 0 yang dihitung (antrian sesaat di satu clock
+    # sebelum assignment tidak ikut)
+    loader_q_area = 0.0
+    scale_q_area = 0.0
+    max_loader_q = 0
+    max_scale_q = 0
+
+    # checkpoint kumulatif akumulator di waktu-waktu mark (warm-up, batas
+    # batch): metric = nilai akhir - nilai di mark terpilih, jadi "reset"
+    # akumulator bisa dipilih setelah run selesai (MSER) dengan biaya O(1)
+    # per event
+    mark_times = _mark_times(warmup, total_time, n_batches)
+    marks = [(0.0, 0.0, 0, 0.0, 0, 0.0, 0.0, 0, [0.0] * n_servers, 0, 0)]
+    next_mark = mark_times[0] if mark_times else float("inf")
+
+    fel = []
+    _ev_counter = 0
+
+    # baris event log dari event heap yang sedang diproses (di-flush per step)
+    pending = []
+    emit = pending.append if events else None
+
+    def schedule(time, code, truck_id):
+        nonlocal _ev_counter
+        if time > total_time:
+            return
+        heapq.heappush(fel, (time, _ev_counter, code, truck_id))
+        _ev_counter += 1
+
+    def avg_wait_so_far(target="loader"):
+        if target == "loader":
+            return loader_wait_total / loader_visits_total if loader_visits_total else 0.0
+        return scale_wait_total / scale_visits_total if scale_visits_total else 0.0
+
+    def busy_time_so_far(k):
+        if server_truck[k] is None:
+            return busy_time[k]
+        return busy_time[k] + (clock - busy_since[k])
+
+    def snapshot_state():
+        last = pending[-1] if pending else None
+        snap = {
+            "clock": clock,
+            "event": event_names[last[2]] if last else None,
+            "truck": last[3] if last else None,
+            "note": f"svc={last[4]}m" if last and last[4] is not None else "",
+
+            "loader_queue": list(loader_queue),
+            "scale_queue": list(scale_queue),
+            "traveling": sorted(traveling),
+        }
+        for k, key in enumerate(server_keys):
+            snap[key + "_busy"] = server_truck[k] is not None
+        for k, key in enumerate(server_keys):
+            snap[key + "_truck"] = server_truck[k]
+        for k, key in enumerate(server_keys):
+            snap[key + "_busy_time"] = busy_time_so_far(k)
+        snap["avg_loader_wait_so_far"] = avg_wait_so_far("loader")
+        snap["avg_scale_wait_so_far"] = avg_wait_so_far("scale")
+        return snap
+
+    def cumulative():
+        # akumulator kumulatif di clock; max antrian = max sejak mark terakhir
+        return (
+            clock,
+            loader_wait_total, loader_visits_total,
+            scale_wait_total, scale_visits_total,
+            loader_q_area, scale_q_area,
+            loads_delivered,
+            [busy_time_so_far(k) for k in range(n_servers)],
+            max_loader_q, max_scale_q,
+        )
+
+    def advance(t):
+        # tutup interval [clock, t) tanpa event (clock maju ke t)
+        nonlocal clock, loader_q_area, scale_q_area, max_loader_q, max_scale_q
+        dt = t - clock
+        if dt > 0:
+            loader_q_area += len(loader_queue) * dt
+            scale_q_area += len(scale_queue) * dt
+            max_loader_q = max(max_loader_q, len(loader_queue))
+            max_scale_q = max(max_scale_q, len(scale_queue))
+        clock = t
+
+    def take_mark(t):
+        # tutup interval [clock, t) lalu simpan checkpoint di t
+        nonlocal max_loader_q, max_scale_q
+        advance(t)
+        marks.append(cumulative())
+        max_loader_q = max_scale_q = 0
+
+    def flush_step():
+        # baris event + penanda step (snapshot kondisi setelah step diproses)
+        items = pending[:]
+        items.append((STEP, clock, snapshot_state() if snapshots else None))
+        pending.clear()
+        return items
+
+    def try_assign_loader():
+        nonlocal loader_wait_total, loader_visits_total
+        # selama ada loader bebas & truck antri: loader index terkecil dulu
+        while free_loaders and loader_queue:
+            k = heapq.heappop(free_loaders)
+            t_id = loader_queue.popleft()
+            server_truck[k] = t_id
+            busy_since[k] = clock
+
+            truck = trucks[t_id]
+            if truck["state"] == "QUEUE_LOADER":
+                wait = clock - truck["last_queue_enter_loader"]
+                truck["total_wait_loader"] += wait
+                loader_wait_total += wait
+            truck["loader_visits"] += 1
+            loader_visits_total += 1
+            truck["state"] = busy_states[k]
+
+            service = samplers[k](rngs[k])
+            schedule(clock + service, n_servers + 1 + k, t_id)
+            if emit:
+                emit((EVENT, clock, 1 + k, t_id, service))
+
+    def try_assign_scale():
+        nonlocal scale_wait_total, scale_visits_total
+        while free_scales and scale_queue:
+            k = heapq.heappop(free_scales)
+            t_id = scale_queue.popleft()
+            server_truck[k] = t_id
+            busy_since[k] = clock
+
+            truck = trucks[t_id]
+            if truck["state"] == "QUEUE_SCALE":
+                wait = clock - truck["last_queue_enter_scale"]
+                truck["total_wait_scale"] += wait
+                scale_wait_total += wait
+            truck["scale_visits"] += 1
+            scale_visits_total += 1
+            truck["state"] = busy_states[k]
+
+            service = samplers[k](rngs[k])
+            schedule(clock + service, n_servers + 1 + k, t_id)
+            if emit:
+                emit((EVENT, clock, 1 + k, t_id, service))
+
+    pop = heapq.heappop
+    if profiler is not None:
+        # bungkus hot-path (closure try_assign_* ikut memakai versi terbungkus)
+        samplers = [profiler.wrap("sampling", f) for f in samplers]
+        schedule = profiler.wrap("heap_push", schedule)
+        pop = profiler.wrap_heap_pop(pop, fel)
+        snapshot_state = profiler.wrap("snapshot_state", snapshot_state)
+        if emit:
+            emit = profiler.wrap("log_event", emit)
+
+    # Seed event awal
+    if legacy_trace:
+        schedule(0.0, CHECK_ASSIGN, None)
+    else:
+        try_assign_loader()
+        try_assign_scale()
+        if events and pending:
+            yield from flush_step()
+
+    while fel:
+        ev_time, _, code, t_id = pop(fel)
+        if ev_time > total_time:
+            break
+
+        # checkpoint warm-up yang terlewati (event pada clock == mark sudah
+        # termasuk periode setelah warm-up)
+        while ev_time >= next_mark:
+            take_mark(next_mark)
+            next_mark = mark_times[len(marks) - 1] if len(marks) <= len(mark_times) else float("inf")
+
+        # Maju clock (busy time diakumulasi saat server lepas, luas antrian
+        # untuk interval [clock, ev_time) di sini)
+        dt = ev_time - clock
+        if dt > 0:
+            n_q = len(loader_queue)
+            loader_q_area += n_q * dt
+            if n_q > max_loader_q:
+                max_loader_q = n_q
+            n_q = len(scale_queue)
+            scale_q_area += n_q * dt
+            if n_q > max_scale_q:
+                max_scale_q = n_q
+        clock = ev_time
+
+        # Proses event; mode default: semua event pada clock ini dalam 1 step
+        while True:
+            if code == CHECK_ASSIGN:
+                try_assign_loader()
+                try_assign_scale()
+                if emit:
+                    emit((EVENT, clock, CHECK_ASSIGN, None, None))
+
+            elif code == end_travel_code:
+                if emit:
+                    emit((EVENT, clock, code, t_id, None))
+                trucks[t_id]["state"] = "QUEUE_LOADER"
+                trucks[t_id]["last_queue_enter_loader"] = clock
+                trucks[t_id]["travel_end_time"] = None
+                traveling.discard(t_id)
+                loader_queue.append(t_id)
+
+                if legacy_trace:
+                    schedule(clock, CHECK_ASSIGN, None)
+
+            else:
+                # END server k: lepas server, kembalikan ke pool bebas
+                k = code - n_servers - 1
+                if emit:
+                    emit((EVENT, clock, code, t_id, None))
+                busy_time[k] += clock - busy_since[k]
+                server_truck[k] = None
+
+                if k < n_loaders:
+                    heapq.heappush(free_loaders, k)
+                    trucks[t_id]["state"] = "QUEUE_SCALE"
+                    trucks[t_id]["last_queue_enter_scale"] = clock
+                    scale_queue.append(t_id)
+
+                    if legacy_trace:
+                        schedule(clock, CHECK_ASSIGN, None)
+                    try_assign_scale()
+                else:
+                    heapq.heappush(free_scales, k)
+                    loads_delivered += 1
+
+                    trucks[t_id]["state"] = "TRAVEL"
+                    traveling.add(t_id)
+                    travel_end = clock + travel_time_value
+                    trucks[t_id]["travel_end_time"] = travel_end
+                    schedule(travel_end, end_travel_code, t_id)
+
+                    if legacy_trace:
+                        schedule(clock, CHECK_ASSIGN, None)
+
+            if legacy_trace or not fel or fel[0][0] != clock:
+                break
+            _, _, code, t_id = pop(fel)
+
+        # pengganti CHECK_ASSIGN: sama dengan CHECK_ASSIGN lama yang masuk
+        # heap setelah semua event lain pada clock ini
+        if not legacy_trace:
+            try_assign_loader()
+            try_assign_scale()
+
+        if events:
+            yield from flush_step()
+
+    # mark setelah event terakhir (tidak dilewati event mana pun) tetap
+    # dicatat; batch terakhir berakhir di total_time, bukan di event terakhir
+    while next_mark <= total_time:
+        take_mark(next_mark)
+        next_mark = mark_times[len(marks) - 1] if len(marks) <= len(mark_times) else float("inf")
+    if n_batches:
+        advance(total_time)
+
+    # Kalkulasi final metrics dari run ini
+    # pilih mark awal periode statistik (0 = tanpa warm-up)
+    if warmup == WARMUP_MSER5:
+        bins = [
+            (b[5] - a[5]) / (b[0] - a[0])
+            for a, b in zip(marks, marks[1:])
+        ]
+        cut = mser_truncation(bins)
+    else:
+        cut = 1 if warmup and len(marks) > 1 else 0
+
+    points = marks + [cumulative()]
+    end = len(points) - 1
+    util_keys = topo.util_keys
+    t0 = points[cut][0]
+    final_metrics = _interval_metrics(points, cut, end, util_keys, n_loaders, total_time - t0)
+
+    batch_metrics = None
+    if n_batches:
+        # batas batch = mark setelah titik potong, dibagi rata per index
+        n_points = end - cut
+        if n_points < n_batches:
+            raise ValueError(f"run too short for {n_batches} batches")
+        bounds = [cut + round(j * n_points / n_batches) for j in range(n_batches + 1)]
+        batch_metrics = [
+            _interval_metrics(points, a, b, util_keys, n_loaders, max(points[b][0] - points[a][0], 1e-9))
+            for a, b in zip(bounds, bounds[1:])
+        ]
+
+    yield (FINAL, final_metrics, trucks, batch_metrics)
+
+
+def run_simulation_with_timeline(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    seed=None,
+    record_timeline=True,
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+    profiler=None,
+):
+    """
+    Wrapper di atas iter_simulation yang merekam stream ke ColumnarTimeline.
+
+    returns (final_metrics, timeline_steps, event_log, trucks).
+    timeline_steps = ColumnarTimeline (len() & [i] -> snapshot dict),
+    event_log = view baris event log di atas timeline yang sama.
+
+    record_timeline=False -> mode headless: hanya akumulator busy time & wait
+    yang di-update, tanpa event_log / timeline_steps (dikembalikan kosong).
+    legacy_trace=True -> timeline memuat event CHECK_ASSIGN seperti dulu.
+    warmup: lihat iter_simulation (hanya final_metrics yang dipotong).
+    profiler: opsional, fase engine + timeline_record + total "simulate".
+    """
+    stream = iter_simulation(
+        dist_loader_A,
+        dist_loader_B,
+        dist_scale,
+        travel_time_value,
+        total_time,
+        n_trucks=n_trucks,
+        seed=seed,
+        events=record_timeline,
+        loaders=loaders,
+        scales=scales,
+        legacy_trace=legacy_trace,
+        warmup=warmup,
+        profiler=profiler,
+    )
+    phase = profiler.phase("simulate") if profiler is not None else nullcontext()
+    if not record_timeline:
+        with phase:
+            _, final_metrics, trucks, _ = _last(stream)
+        return final_metrics, [], [], trucks
+
+    topo = make_topology(dist_loader_A, dist_loader_B, dist_scale, loaders, scales)
+    timeline = ColumnarTimeline(n_trucks, topology=topo)
+    record, end_step = timeline.record, timeline.end_step
+    if profiler is not None:
+        record = profiler.wrap("timeline_record", record)
+        end_step = profiler.wrap("timeline_record", end_step)
+    with phase:
+        for item in stream:
+            kind = item[0]
+            if kind == EVENT:
+                record(item[2], item[3], item[1], item[4])
+            elif kind == STEP:
+                end_step()
+            else:
+                _, final_metrics, trucks, _ = item
+    return final_metrics, timeline, timeline.events, trucks
+
+
+def _last(stream):
+    item = None
+    for item in stream:
+        pass
+    return item
+
+
+def run_simulation_metrics(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    seed=None,
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+):
+    """
+    Entry point headless: 1 replikasi, hanya final_metrics.
+    Dipakai untuk replikasi 2..n yang tidak di-replay di UI.
+    """
+    _, final_metrics, _, _ = _last(iter_simulation(
+        dist_loader_A,
+        dist_loader_B,
+        dist_scale,
+        travel_time_value,
+        total_time,
+        n_trucks=n_trucks,
+        seed=seed,
+        events=False,
+        loaders=loaders,
+        scales=scales,
+        legacy_trace=legacy_trace,
+        warmup=warmup,
+    ))
+    return final_metrics
+
+
+def run_simulation_batch_means(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    seed=None,
+    n_batches=20,
+    warmup=None,
+    loaders=None,
+    scales=None,
+):
+    """
+    1 run panjang headless, dipotong warm-up lalu dibagi n_batches batch.
+    returns (final_metrics, batch_metrics) -- tanpa timeline, memori tetap.
+    """
+    _, final_metrics, _, batch_metrics = _last(iter_simulation(
+        dist_loader_A,
+        dist_loader_B,
+        dist_scale,
+        travel_time_value,
+        total_time,
+        n_trucks=n_trucks,
+        seed=seed,
+        events=False,
+        loaders=loaders,
+        scales=scales,
+        warmup=warmup,
+        n_batches=n_batches,
+    ))
+    return final_metrics, batch_metrics
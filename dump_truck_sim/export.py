@@ -0,0 +1,375 @@
+"""
+Export bulk ke Parquet / Arrow IPC: event log semua replikasi + final_metrics
+per replikasi, untuk analisis offline (pandas, DuckDB, Polars, ...).
+
+Writer streaming: item "event" dari iter_simulation langsung masuk buffer
+kolom (array bertipe) dan di-flush sebagai satu row group / record batch
+setiap `row_group_size` baris, jadi memori tetap O(row_group_size) berapa
+pun jumlah event dan replikasi. Reader membuka file lewat memory map
+(Arrow IPC tanpa kompresi -> zero-copy).
+
+pyarrow opsional untuk core simulasi; hanya modul ini yang membutuhkannya.
+"""
+import json
+from array import array
+
+import numpy as np
+
+from .engine import EVENT, STEP, run_simulation_metrics, iter_simulation
+from .replication import _sim_kwargs, replication_seeds
+from .topology import make_topology
+
+FORMATS = ("parquet", "arrow")
+DEFAULT_ROW_GROUP_SIZE = 65_536
+METADATA_KEY = b"dump_truck_sim"
+
+# magic bytes di awal file -> format (read_export tidak perlu tahu ekstensi)
+_MAGIC = ((b"PAR1", "parquet"), (b"ARROW1", "arrow"))
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError("export Parquet / Arrow butuh pyarrow (pip install pyarrow)") from exc
+    return pyarrow
+
+
+class _BatchWriter:
+    """Satu file Parquet / Arrow IPC; tiap write(batch) = satu row group."""
+
+    def __init__(self, path, schema, format, compression):
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}, got {format!r}")
+        pa = _pyarrow()
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(path, schema, compression=compression or "zstd")
+        else:
+            # default tanpa kompresi: buffer bisa di-memory-map langsung saat dibaca
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(path, schema, options=options)
+        self.schema = schema
+
+    def write(self, batch):
+        self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+
+
+class EventLogWriter:
+    """
+    Event log streaming, 1 baris per item "event" iter_simulation:
+    replication, seed, step (index timeline[i]), time, code, event (nama,
+    dictionary), truck (null untuk CHECK_ASSIGN), service (null kecuali START_*).
+    """
+
+    def __init__(self, path, topology, format="parquet", row_group_size=DEFAULT_ROW_GROUP_SIZE,
+                 compression=None, metadata=None):
+        pa = _pyarrow()
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._names = pa.array(topology.event_names, pa.string())
+        schema = pa.schema([
+            ("replication", pa.int32()),
+            ("seed", pa.int64()),
+            ("step", pa.int64()),
+            ("time", pa.float64()),
+            ("code", pa.uint16()),
+            ("event", pa.dictionary(pa.int32(), pa.string())),
+            ("truck", pa.int32()),
+            ("service", pa.float64()),
+        ], metadata={METADATA_KEY: json.dumps(dict(
+            metadata or {},
+            kind="events",
+            event_names=list(topology.event_names),
+            labels=list(topology.labels),
+        ))})
+        self._out = _BatchWriter(path, schema, format, compression)
+        self._reset()
+
+    def _reset(self):
+        self._step = array("q")
+        self._time = array("d")
+        self._code = array("H")
+        self._truck = array("i")
+        self._service = array("d")
+        # replication & seed konstan per run: cukup (replication, seed, jumlah baris)
+        self._runs = []
+
+    def write_stream(self, replication, seed, stream):
+        """
+        Konsumsi stream iter_simulation(events=True) sampai habis.
+        returns item "final" (final_metrics, trucks, batch_metrics).
+        """
+        step = 0
+        count = 0
+        limit = self.row_group_size
+        steps, times, codes = self._step.append, self._time.append, self._code.append
+        trucks, services = self._truck.append, self._service.append
+        nan = float("nan")
+        for item in stream:
+            kind = item[0]
+            if kind == EVENT:
+                _, clock, code, truck, service = item
+                steps(step)
+                times(clock)
+                codes(code)
+                trucks(-1 if truck is None else truck)
+                services(nan if service is None else service)
+                count += 1
+                if len(self._time) >= limit:
+                    self._runs.append((replication, seed, count))
+                    count = 0
+                    self.flush()
+                    steps, times, codes = self._step.append, self._time.append, self._code.append
+                    trucks, services = self._truck.append, self._service.append
+            elif kind == STEP:
+                step += 1
+            else:
+                if count:
+                    self._runs.append((replication, seed, count))
+                return item
+        raise RuntimeError("stream ended without final item")
+
+    def flush(self):
+        """Tulis buffer sebagai satu row group (no-op kalau kosong)."""
+        n = len(self._time)
+        if not n:
+            return
+        pa = _pyarrow()
+        replication = np.repeat(
+            np.array([r[0] for r in self._runs], dtype=np.int32), [r[2] for r in self._runs]
+        )
+        seed = np.repeat(np.array([r[1] for r in self._runs], dtype=np.int64), [r[2] for r in self._runs])
+        code = np.frombuffer(self._code, dtype=np.uint16)
+        truck = np.frombuffer(self._truck, dtype=np.int32)
+        service = np.frombuffer(self._service, dtype=np.float64)
+        batch = pa.RecordBatch.from_arrays([
+            pa.array(replication),
+            pa.array(seed),
+            pa.array(np.frombuffer(self._step, dtype=np.int64)),
+            pa.array(np.frombuffer(self._time, dtype=np.float64)),
+            pa.array(code),
+            pa.DictionaryArray.from_arrays(pa.array(code.astype(np.int32)), self._names),
+            pa.array(truck, mask=truck < 0),
+            pa.array(service, mask=np.isnan(service)),
+        ], schema=self._out.schema)
+        self._out.write(batch)
+        self.rows += n
+        self._reset()
+
+    def close(self):
+        self.flush()
+        self._out.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MetricsWriter:
+    """
+    final_metrics per replikasi (1 baris per replikasi). Kolom = keys, atau
+    key replikasi pertama kalau keys None; key yang tidak ada -> null. Tipe
+    kolom dari baris pertama: int -> int64, str -> string, lainnya float64.
+    """
+
+    def __init__(self, path, format="parquet", row_group_size=1024, compression=None, metadata=None,
+                 keys=None):
+        self.path = path
+        self.format = format
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.metadata = metadata
+        self.rows = 0
+        self._out = None
+        self._keys = list(keys) if keys is not None else None
+        self._buffer = []
+
+    def write(self, replication, seed, final_metrics):
+        if self._out is None:
+            pa = _pyarrow()
+            if self._keys is None:
+                self._keys = list(final_metrics)
+            fields = [("replication", pa.int32()), ("seed", pa.int64())]
+            for key in self._keys:
+                value = final_metrics.get(key)
+                if isinstance(value, str):
+                    fields.append((key, pa.string()))
+                elif isinstance(value, int) and not isinstance(value, bool):
+                    fields.append((key, pa.int64()))
+                else:
+                    fields.append((key, pa.float64()))
+            schema = pa.schema(fields, metadata={
+                METADATA_KEY: json.dumps(dict(self.metadata or {}, kind="metrics")),
+            })
+            self._out = _BatchWriter(self.path, schema, self.format, self.compression)
+        self._buffer.append([replication, seed] + [final_metrics.get(key) for key in self._keys])
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        pa = _pyarrow()
+        columns = list(zip(*self._buffer))
+        self._out.write(pa.RecordBatch.from_arrays(
+            [pa.array(col, type=field.type) for col, field in zip(columns, self._out.schema)],
+            schema=self._out.schema,
+        ))
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        if self._out is not None:
+            self.flush()
+            self._out.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ---------------------------------------------------------------------------------
+# EXPORT REPLIKASI
+# ---------------------------------------------------------------------------------
+
+def export_replications(
+    events_path,
+    metrics_path,
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    num_runs=1,
+    base_seed=None,
+    format="parquet",
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+    row_group_size=DEFAULT_ROW_GROUP_SIZE,
+    compression=None,
+    on_progress=None,
+):
+    """
+    Jalankan num_runs replikasi (seed base_seed + i seperti run_replications,
+    jadi angka identik dengan engine "python") dan stream event log +
+    final_metrics ke file. Serial di proses ini: writer satu file, dan
+    encoding kolom lebih mahal dari simulasinya sendiri.
+
+    events_path None -> hanya metrics (replikasi jalan headless).
+    format: "parquet" (default kompresi zstd) atau "arrow" (Arrow IPC file,
+    default tanpa kompresi supaya read_export bisa zero-copy).
+    on_progress(done, total): dipanggil tiap replikasi selesai.
+
+    returns {"replications", "events", "seeds", "events_path", "metrics_path"}.
+    """
+    sim_kwargs = _sim_kwargs(
+        dist_loader_A, dist_loader_B, dist_scale, travel_time_value, total_time, n_trucks,
+        loaders, scales, legacy_trace, warmup,
+    )
+    seeds = replication_seeds(base_seed, num_runs)
+    topo = make_topology(dist_loader_A, dist_loader_B, dist_scale, loaders, scales)
+    metadata = {
+        "n_trucks": n_trucks,
+        "total_time": total_time,
+        "travel_time": travel_time_value,
+        "base_seed": seeds[0],
+        "legacy_trace": legacy_trace,
+        "warmup": warmup,
+    }
+
+    events = None
+    metrics = MetricsWriter(metrics_path, format, compression=compression, metadata=metadata)
+    try:
+        if events_path is not None:
+            events = EventLogWriter(events_path, topo, format, row_group_size, compression, metadata)
+        for i, seed in enumerate(seeds):
+            if events is not None:
+                stream = iter_simulation(seed=seed, events=True, **sim_kwargs)
+                final_metrics = events.write_stream(i + 1, seed, stream)[1]
+            else:
+                final_metrics = run_simulation_metrics(seed=seed, **sim_kwargs)
+            metrics.write(i + 1, seed, final_metrics)
+            if on_progress:
+                on_progress(i + 1, num_runs)
+    finally:
+        if events is not None:
+            events.close()
+        metrics.close()
+
+    return {
+        "replications": num_runs,
+        "events": events.rows if events is not None else 0,
+        "seeds": seeds,
+        "events_path": events_path,
+        "metrics_path": metrics_path,
+    }
+
+
+# ---------------------------------------------------------------------------------
+# READER (memory map)
+# ---------------------------------------------------------------------------------
+
+def export_format(path):
+    """Format file hasil export dari magic bytes: "parquet" / "arrow"."""
+    with open(path, "rb") as f:
+        head = f.read(8)
+    for magic, format in _MAGIC:
+        if head.startswith(magic):
+            return format
+    raise ValueError(f"{path} is not a Parquet or Arrow IPC file")
+
+
+def read_export(path, columns=None):
+    """
+    Baca file export sebagai pyarrow.Table lewat memory map. Arrow IPC tanpa
+    kompresi -> kolom menunjuk langsung ke halaman file (zero-copy);
+    Parquet tetap di-decode, tapi hanya kolom yang diminta.
+    """
+    pa = _pyarrow()
+    if export_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns, memory_map=True)
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return table.select(columns) if columns is not None else table
+
+
+def iter_export(path, columns=None):
+    """Record batch (row group) satu per satu; memori O(row_group_size)."""
+    pa = _pyarrow()
+    if export_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path, memory_map=True)
+        for i in range(parquet.num_row_groups):
+            yield from parquet.read_row_group(i, columns=columns).to_batches()
+        return
+    reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i)
+        yield batch.select(columns) if columns is not None else batch
+
+
+def export_metadata(path):
+    """Metadata run (event_names, labels, n_trucks, total_time, ...) dari schema file."""
+    pa = _pyarrow()
+    if export_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        schema = pq.read_schema(path, memory_map=True)
+    else:
+        schema = pa.ipc.open_file(pa.memory_map(path, "r")).schema
+    raw = (schema.metadata or {}).get(METADATA_KEY)
+    return json.loads(raw) if raw else {}
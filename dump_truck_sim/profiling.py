@@ -0,0 +1,133 @@
+"""
+Instrumentasi opsional: waktu per fase hot-path, events/sec, peak memori
+(tracemalloc) dan ukuran future event list sepanjang run.
+
+Tanpa profiler tidak ada overhead: iter_simulation hanya membungkus fungsi
+hot-path (sampling, heap push/pop, log event, snapshot) kalau profiler
+diberikan. Fase kasar (simulate, render UI) dicatat dengan phase().
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Profiler:
+    """Akumulator waktu per fase + sampel ukuran heap. report() -> dict."""
+
+    def __init__(self, heap_sample_every=64):
+        self.heap_sample_every = heap_sample_every
+        self.phases = {}        # nama -> [detik, jumlah panggilan]
+        self.heap_samples = []  # (event ke-i, ukuran heap)
+        self.heap_max = 0
+        self.peak_memory_bytes = None
+
+    def _stat(self, name):
+        stat = self.phases.get(name)
+        if stat is None:
+            stat = self.phases[name] = [0.0, 0]
+        return stat
+
+    def wrap(self, name, fn):
+        """fn terbungkus: waktu & jumlah panggilan masuk fase `name`."""
+        stat = self._stat(name)
+        perf = time.perf_counter
+
+        def timed(*args):
+            t0 = perf()
+            result = fn(*args)
+            stat[0] += perf() - t0
+            stat[1] += 1
+            return result
+
+        return timed
+
+    def wrap_heap_pop(self, pop, heap):
+        """heappop terbungkus: fase heap_pop + hitung event + sampel ukuran heap."""
+        stat = self._stat("heap_pop")
+        perf = time.perf_counter
+        every = self.heap_sample_every
+        samples = self.heap_samples
+
+        def timed(h):
+            t0 = perf()
+            item = pop(h)
+            stat[0] += perf() - t0
+            stat[1] += 1
+            size = len(heap)
+            if size > self.heap_max:
+                self.heap_max = size
+            if stat[1] % every == 0:
+                samples.append((stat[1], size))
+            return item
+
+        return timed
+
+    @contextmanager
+    def phase(self, name):
+        stat = self._stat(name)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            stat[0] += time.perf_counter() - t0
+            stat[1] += 1
+
+    def report(self):
+        """Ringkasan JSON-able: fase (detik, panggilan, us/panggilan, share)."""
+        total = self.phases.get("simulate", [0.0, 0])[0]
+        events = self.phases.get("heap_pop", [0.0, 0])[1]
+        phases = {}
+        for name, (seconds, calls) in self.phases.items():
+            if not calls:
+                continue  # fungsi terbungkus yang tidak terpakai di mode ini
+            phases[name] = {
+                "seconds": seconds,
+                "calls": calls,
+                "us_per_call": seconds / calls * 1e6 if calls else 0.0,
+                "share": seconds / total if total else 0.0,
+            }
+        inner = sum(
+            s for name, (s, _) in self.phases.items()
+            if name != "simulate" and not name.startswith("render")
+        )
+        return {
+            "events": events,
+            "simulate_seconds": total,
+            "events_per_sec": events / total if total else 0.0,
+            "core_other_seconds": max(total - inner, 0.0),
+            "phases": phases,
+            "heap": {"max": self.heap_max, "samples": [list(s) for s in self.heap_samples]},
+            "peak_memory_bytes": self.peak_memory_bytes,
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.report(), indent=indent)
+
+
+def profile_simulation(sim_kwargs, seed=None, trace_memory=True):
+    """
+    Profil 1 replikasi lengkap (timeline + event log). Waktu fase diukur
+    tanpa tracemalloc; peak memori dari run kedua dengan seed sama, supaya
+    overhead tracemalloc tidak mengotori angka waktu.
+
+    returns Profiler (report() / to_json()).
+    """
+    from .engine import run_simulation_with_timeline
+
+    profiler = Profiler()
+    run_simulation_with_timeline(seed=seed, profiler=profiler, **sim_kwargs)
+
+    if trace_memory:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        result = run_simulation_with_timeline(seed=seed, **sim_kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        del result
+        if not was_tracing:
+            tracemalloc.stop()
+        profiler.peak_memory_bytes = peak - base
+    return profiler
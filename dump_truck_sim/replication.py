@@ -0,0 +1,520 @@
+"""
+Replication executor: menjalankan banyak replikasi simulasi, serial atau
+paralel (process pool), lalu merata-ratakan final_metrics. Mode sequential
+(run_until_precision) menambah replikasi per batch sampai CI cukup sempit.
+"""
+import math
+import os
+import random
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .engine import (
+    WARMUP_MSER5,
+    run_simulation_batch_means,
+    run_simulation_metrics,
+    run_simulation_with_timeline,
+)
+from .stats import MetricAccumulator, RunningStats, lag1_autocorrelation
+
+# metric topologi default; topologi lain punya util_* per server (urutan
+# key mengikuti final_metrics, jadi agregasi memakai key hasil replikasi)
+METRIC_KEYS = (
+    "avg_loader_queue_wait",
+    "avg_scale_queue_wait",
+    "avg_loader_queue_len",
+    "avg_scale_queue_len",
+    "max_loader_queue_len",
+    "max_scale_queue_len",
+    "avg_loader_wip",
+    "avg_scale_wip",
+    "util_loader_A",
+    "util_loader_B",
+    "util_scale",
+    "sim_end_time",
+    "loads_delivered",
+    "throughput_per_hour",
+    "warmup_time",
+)
+
+# "spawn" aman dipakai dari thread script Streamlit (fork dari proses
+# multi-thread bisa deadlock), dan worker cukup import engine saja.
+_MP_CONTEXT = "spawn"
+
+
+def replication_seeds(base_seed, num_runs):
+    """
+    Seed per replikasi: base_seed, base_seed+1, ...
+    base_seed=None -> ambil base acak (hasil tetap acak tiap klik Run).
+    """
+    if base_seed is None:
+        base_seed = random.SystemRandom().randrange(2**32)
+    return [int(base_seed) + i for i in range(num_runs)]
+
+
+def _run_metrics_chunk(sim_kwargs, seeds):
+    """Worker: jalankan beberapa replikasi, kirim balik final_metrics saja."""
+    results = []
+    for seed in seeds:
+        results.append(run_simulation_metrics(seed=seed, **sim_kwargs))
+    return results
+
+
+def _run_full(sim_kwargs, seed):
+    """Worker: replikasi #1 dikirim lengkap (timeline, event log, trucks)."""
+    return run_simulation_with_timeline(seed=seed, **sim_kwargs)
+
+
+def _chunk(seq, n_chunks):
+    n_chunks = max(1, min(n_chunks, len(seq)))
+    size, extra = divmod(len(seq), n_chunks)
+    chunks = []
+    start = 0
+    for i in range(n_chunks):
+        stop = start + size + (1 if i < extra else 0)
+        chunks.append(seq[start:stop])
+        start = stop
+    return chunks
+
+
+def _make_pool(max_workers):
+    ctx = multiprocessing.get_context(_MP_CONTEXT)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx)
+
+
+def _collect(pool, sim_kwargs, seeds, n_chunks, on_done, full_seed=None):
+    """
+    Jalankan replikasi metrics-only untuk `seeds` (+ opsional satu replikasi
+    lengkap full_seed). pool=None -> serial di proses ini.
+    on_done(k) dipanggil tiap k replikasi selesai.
+
+    returns (metrics_list urut sesuai seeds, first_run atau None)
+    """
+    metrics = [None] * len(seeds)
+    first_run = None
+
+    if pool is None:
+        if full_seed is not None:
+            first_run = _run_full(sim_kwargs, full_seed)
+            on_done(1)
+        for i, seed in enumerate(seeds):
+            metrics[i] = _run_metrics_chunk(sim_kwargs, [seed])[0]
+            on_done(1)
+        return metrics, first_run
+
+    futures = {
+        pool.submit(_run_metrics_chunk, sim_kwargs, [seeds[i] for i in idx]): idx
+        for idx in _chunk(list(range(len(seeds))), n_chunks)
+        if idx
+    }
+    if full_seed is not None:
+        futures[pool.submit(_run_full, sim_kwargs, full_seed)] = None
+
+    for fut in as_completed(futures):
+        idx = futures[fut]
+        if idx is None:
+            first_run = fut.result()
+            on_done(1)
+        else:
+            for i, m in zip(idx, fut.result()):
+                metrics[i] = m
+            on_done(len(idx))
+    return metrics, first_run
+
+
+def iter_metrics(scenarios, seeds, max_workers=None, chunks_per_worker=4):
+    """
+    Generator (scenario index, replikasi index, final_metrics) untuk semua
+    scenario x seed, urutan selesai (bukan urutan seed). scenario = dict
+    argumen run_simulation_metrics tanpa seed. Hasil di-yield begitu satu
+    chunk selesai, jadi consumer bisa langsung menulis ke disk tanpa
+    menampung semua hasil. max_workers=1 -> serial di proses ini.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 1:
+        for s_idx, scenario in enumerate(scenarios):
+            for i, seed in enumerate(seeds):
+                yield s_idx, i, run_simulation_metrics(seed=seed, **scenario)
+        return
+
+    n_chunks = max(1, (max_workers * chunks_per_worker) // max(1, len(scenarios)))
+    pool = _make_pool(max_workers)
+    try:
+        futures = {
+            pool.submit(_run_metrics_chunk, scenario, [seeds[i] for i in idx]): (s_idx, idx)
+            for s_idx, scenario in enumerate(scenarios)
+            for idx in _chunk(list(range(len(seeds))), n_chunks)
+        }
+        for fut in as_completed(futures):
+            s_idx, idx = futures.pop(fut)
+            for i, m in zip(idx, fut.result()):
+                yield s_idx, i, m
+    finally:
+        # consumer berhenti lebih awal (break / Ctrl-C) -> job sisa dibatalkan
+        pool.shutdown(cancel_futures=True)
+
+
+def _sim_kwargs(dist_loader_A, dist_loader_B, dist_scale, travel_time_value, total_time, n_trucks,
+                loaders=None, scales=None, legacy_trace=False, warmup=None):
+    return dict(
+        dist_loader_A=dist_loader_A,
+        dist_loader_B=dist_loader_B,
+        dist_scale=dist_scale,
+        travel_time_value=travel_time_value,
+        total_time=total_time,
+        n_trucks=n_trucks,
+        loaders=loaders,
+        scales=scales,
+        legacy_trace=legacy_trace,
+        warmup=warmup,
+    )
+
+
+def _batch_kwargs(sim_kwargs, first_run):
+    """kwargs batch numpy: warm-up MSER-5 diganti hasil deteksi replikasi #1."""
+    if sim_kwargs.get("warmup") == WARMUP_MSER5:
+        return dict(sim_kwargs, warmup=first_run[0]["warmup_time"])
+    return sim_kwargs
+
+
+def run_replications(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    num_runs=1,
+    base_seed=None,
+    max_workers=None,
+    on_progress=None,
+    engine="python",
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+):
+    """
+    Jalankan num_runs replikasi. Replikasi #1 dikembalikan lengkap untuk replay,
+    sisanya hanya final_metrics.
+
+    max_workers: None -> semua core; 1 -> serial di proses ini.
+    loaders / scales: topologi N loader x M scale (lihat topology.py).
+    legacy_trace: timeline replikasi #1 memuat event CHECK_ASSIGN (metrics sama).
+    warmup: None / menit / "mser5" (lihat iter_simulation); engine numpy
+            memakai warm-up hasil deteksi replikasi #1 untuk semua replikasi.
+    on_progress(done, total): callback opsional (dipanggil di proses pemanggil).
+    engine: "python" -> replikasi 2..n di process pool (identik per seed);
+            "numpy"  -> replikasi 2..n lockstep di batch.run_simulation_batch
+                        (statistik sama, angka per replikasi tidak identik).
+
+    returns (metrics_list, first_run) dengan first_run =
+    (final_metrics, timeline_steps, event_log, trucks) dari replikasi #1.
+    Karena tiap replikasi punya seed sendiri, hasil serial == paralel.
+    """
+    sim_kwargs = _sim_kwargs(
+        dist_loader_A, dist_loader_B, dist_scale, travel_time_value, total_time, n_trucks,
+        loaders, scales, legacy_trace, warmup,
+    )
+    seeds = replication_seeds(base_seed, num_runs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if engine == "numpy":
+        from .batch import run_simulation_batch, batch_to_metrics_list
+
+        first_run = _run_full(sim_kwargs, seeds[0])
+        metrics_rest = []
+        if num_runs > 1:
+            batch = run_simulation_batch(
+                n_reps=num_runs - 1, seed=seeds[1], **_batch_kwargs(sim_kwargs, first_run)
+            )
+            metrics_rest = batch_to_metrics_list(batch)
+        if on_progress:
+            on_progress(num_runs, num_runs)
+        return [first_run[0]] + metrics_rest, first_run
+
+    done = [0]
+
+    def on_done(k):
+        done[0] += k
+        if on_progress:
+            on_progress(done[0], num_runs)
+
+    if max_workers <= 1 or num_runs == 1:
+        metrics_rest, first_run = _collect(None, sim_kwargs, seeds[1:], 1, on_done, seeds[0])
+    else:
+        # ~4 chunk per worker: cukup untuk load balancing, IPC tetap kecil
+        with _make_pool(max_workers) as pool:
+            metrics_rest, first_run = _collect(
+                pool, sim_kwargs, seeds[1:], max_workers * 4, on_done, seeds[0]
+            )
+
+    return [first_run[0]] + metrics_rest, first_run
+
+
+# ---------------------------------------------------------------------------------
+# SEQUENTIAL STOPPING: replikasi per batch sampai CI cukup sempit
+# ---------------------------------------------------------------------------------
+
+# target default: half-width CI <= 5% dari mean (sim_end_time tidak ditarget)
+DEFAULT_TARGETS = {
+    "avg_loader_queue_wait": 0.05,
+    "avg_scale_queue_wait": 0.05,
+    "util_loader_A": 0.05,
+    "util_loader_B": 0.05,
+    "util_scale": 0.05,
+    "throughput_per_hour": 0.05,
+}
+
+
+def _next_batch(acc, targets, confidence, n, max_runs, min_step):
+    """
+    Ukuran batch berikutnya dari estimasi n yang dibutuhkan:
+    half-width ~ 1/sqrt(n) -> n_perlu = n * (hw / target)^2.
+    Paling banyak menggandakan n (varians awal masih kasar).
+    """
+    need = n
+    for key in acc.pending(targets, confidence):
+        rs = acc.stats[key]
+        goal = targets[key] * abs(rs.mean)
+        if goal <= 0:
+            need = max_runs
+            break
+        need = max(need, math.ceil(n * (rs.half_width(confidence) / goal) ** 2))
+    step = max(need - n, min_step)
+    return max(1, min(step, n, max_runs - n))
+
+
+def run_until_precision(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    targets=None,
+    confidence=0.95,
+    min_runs=10,
+    max_runs=1000,
+    base_seed=None,
+    max_workers=None,
+    on_progress=None,
+    engine="python",
+    loaders=None,
+    scales=None,
+    legacy_trace=False,
+    warmup=None,
+):
+    """
+    Replikasi berurutan per batch sampai half-width CI tiap metric <=
+    targets[metric] * |mean| (relatif), atau max_runs tercapai.
+
+    targets: {metric: relative half-width}; 0/None -> metric tidak ditarget.
+    Seed sama seperti run_replications (base_seed + i), jadi dengan base_seed
+    tetap hasilnya reproducible. Pool proses dipakai ulang antar batch.
+    on_progress(done, max_runs, summary): dipanggil tiap batch selesai.
+
+    returns (summary, first_run): summary = MetricAccumulator.summary()
+    + "converged" (bool) + "targets".
+    """
+    if targets is None:
+        targets = DEFAULT_TARGETS
+    sim_kwargs = _sim_kwargs(
+        dist_loader_A, dist_loader_B, dist_scale, travel_time_value, total_time, n_trucks,
+        loaders, scales, legacy_trace, warmup,
+    )
+    max_runs = max(int(max_runs), 1)
+    min_runs = max(2, min(int(min_runs), max_runs))
+    seeds = replication_seeds(base_seed, max_runs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # numpy: batch kecil tidak efisien (overhead per iterasi lockstep)
+    min_step = 64 if engine == "numpy" else max_workers
+
+    acc = None  # dibuat setelah replikasi #1 (key metric tergantung topologi)
+
+    def report():
+        if on_progress:
+            on_progress(acc.n, max_runs, acc.summary(confidence))
+
+    pool = _make_pool(max_workers) if engine == "python" and max_workers > 1 else None
+    try:
+        # batch pertama: replikasi #1 lengkap (untuk replay) + min_runs - 1
+        first_run = None
+        n, batch = 0, min_runs
+        while True:
+            batch_seeds = seeds[n:n + batch]
+            full_seed = None
+            if n == 0:
+                full_seed, batch_seeds = batch_seeds[0], batch_seeds[1:]
+
+            if engine == "numpy":
+                from .batch import run_simulation_batch, batch_to_metrics_list
+
+                if full_seed is not None:
+                    first_run = _run_full(sim_kwargs, full_seed)
+                metrics = []
+                if batch_seeds:
+                    metrics = batch_to_metrics_list(
+                        run_simulation_batch(
+                            n_reps=len(batch_seeds), seed=batch_seeds[0], **_batch_kwargs(sim_kwargs, first_run)
+                        )
+                    )
+            else:
+                metrics, full = _collect(
+                    pool, sim_kwargs, batch_seeds, max_workers * 2, lambda k: None, full_seed
+                )
+                if full is not None:
+                    first_run = full
+
+            if n == 0:
+                acc = MetricAccumulator(first_run[0])
+                targets = {k: v for k, v in targets.items() if v and k in acc.stats}
+                acc.push(first_run[0])
+            for m in metrics:
+                acc.push(m)
+            n = acc.n
+            report()
+
+            if not acc.pending(targets, confidence) or n >= max_runs:
+                break
+            batch = _next_batch(acc, targets, confidence, n, max_runs, min_step)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    summary = acc.summary(confidence)
+    summary["converged"] = not acc.pending(targets, confidence)
+    summary["targets"] = dict(targets)
+    return summary, first_run
+
+
+# ---------------------------------------------------------------------------------
+# PERBANDINGAN 2 SKENARIO (common random numbers)
+# ---------------------------------------------------------------------------------
+
+def compare_scenarios(
+    scenario_a,
+    scenario_b,
+    num_runs=30,
+    base_seed=None,
+    crn=True,
+    confidence=0.95,
+    max_workers=None,
+):
+    """
+    Bandingkan 2 konfigurasi (dict argumen run_simulation_metrics tanpa seed).
+
+    crn=True  -> replikasi i kedua skenario memakai seed yang sama, jadi
+                 stream per resource identik (common random numbers);
+    crn=False -> seed B terpisah dari seed A (replikasi independen).
+
+    returns {metric: {"mean_a", "mean_b", "diff", "half_width"}} dengan diff =
+    mean(B - A) berpasangan per replikasi dan half-width CI-nya.
+    """
+    seeds = replication_seeds(base_seed, 2 * num_runs)
+    seeds_a = seeds[:num_runs]
+    seeds_b = seeds_a if crn else seeds[num_runs:]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    def noop(k):
+        pass
+
+    if max_workers <= 1:
+        res_a, _ = _collect(None, scenario_a, seeds_a, 1, noop)
+        res_b, _ = _collect(None, scenario_b, seeds_b, 1, noop)
+    else:
+        with _make_pool(max_workers) as pool:
+            res_a, _ = _collect(pool, scenario_a, seeds_a, max_workers * 2, noop)
+            res_b, _ = _collect(pool, scenario_b, seeds_b, max_workers * 2, noop)
+
+    out = {}
+    for key in res_a[0]:
+        diff, a, b = RunningStats(), RunningStats(), RunningStats()
+        for ma, mb in zip(res_a, res_b):
+            a.push(ma[key])
+            b.push(mb[key])
+            diff.push(mb[key] - ma[key])
+        out[key] = {
+            "mean_a": a.mean,
+            "mean_b": b.mean,
+            "diff": diff.mean,
+            "half_width": diff.half_width(confidence),
+        }
+    return out
+
+
+# ---------------------------------------------------------------------------------
+# BATCH MEANS: 1 run panjang dibagi batch (alternatif replikasi independen)
+# ---------------------------------------------------------------------------------
+
+# atribut run penuh (bukan estimator steady-state): nilai run, tanpa CI
+_RUN_ATTRIBUTES = (
+    "sim_end_time",
+    "loads_delivered",
+    "warmup_time",
+    "max_loader_queue_len",
+    "max_scale_queue_len",
+)
+
+
+def run_batch_means(
+    dist_loader_A,
+    dist_loader_B,
+    dist_scale,
+    travel_time_value,
+    total_time,
+    n_trucks=6,
+    n_batches=20,
+    warmup=None,
+    base_seed=None,
+    confidence=0.95,
+    loaders=None,
+    scales=None,
+):
+    """
+    Steady-state dari 1 run panjang (total_time) lewat core streaming tanpa
+    timeline: warm-up dibuang sekali, sisanya dibagi n_batches batch. Mean &
+    half-width CI Student-t (df = n_batches - 1) dari batch means. Batch
+    cukup panjang -> batch means ~ independen; cek "batch_lag1"
+    (autokorelasi lag-1 per metric, idealnya dekat 0).
+
+    returns (summary, batch_metrics): summary format average_metrics
+    (replications = 1) + "batches" + "batch_lag1"; atribut run penuh
+    (sim_end_time, loads_delivered, warmup_time, max antrian) dari run utuh.
+    """
+    seed = replication_seeds(base_seed, 1)[0]
+    final, batches = run_simulation_batch_means(
+        dist_loader_A, dist_loader_B, dist_scale, travel_time_value, total_time,
+        n_trucks=n_trucks, seed=seed, n_batches=n_batches, warmup=warmup,
+        loaders=loaders, scales=scales,
+    )
+    acc = MetricAccumulator(final)
+    for m in batches:
+        acc.push(m)
+
+    summary = acc.summary(confidence)
+    for key in _RUN_ATTRIBUTES:
+        summary[key] = final[key]
+        summary["ci_halfwidth"][key] = math.nan
+    summary["replications"] = 1
+    summary["batches"] = len(batches)
+    summary["batch_lag1"] = {
+        key: lag1_autocorrelation([m[key] for m in batches])
+        for key in acc.keys if key not in _RUN_ATTRIBUTES
+    }
+    return summary, batches
+
+
+def average_metrics(metrics_list, confidence=0.95):
+    """
+    Rata-rata final_metrics dari semua replikasi (Welford streaming)
+    + jumlah replikasi + half-width CI per metric.
+    """
+    acc = MetricAccumulator(metrics_list[0])
+    for m in metrics_list:
+        acc.push(m)
+    return acc.summary(confidence)
@@ -0,0 +1,102 @@
+"""
+Sampling util untuk distribusi service time diskrit (value, prob_percent).
+"""
+import random
+from array import array
+from bisect import bisect_left
+
+_INV_2_53 = 2.0 ** -53
+
+# resource yang punya service time acak (travel deterministik)
+RESOURCES = ("loader_A", "loader_B", "scale")
+
+
+def resource_streams(seed, resources=RESOURCES):
+    """
+    Satu random.Random independen per resource untuk 1 replikasi.
+
+    Stream di-seed dari f"{seed}:{resource}" (string -> sha512, stabil antar
+    proses), jadi draw ke-k Loader A selalu sama untuk seed yang sama walau
+    konfigurasi lain (jumlah truck, travel, distribusi) berubah. Ini dasar
+    common random numbers: skenario A dan B dengan seed sama memakai angka
+    acak yang sama per resource. seed=None -> base acak (tidak reproducible).
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**63)
+    return {name: random.Random(f"{seed}:{name}") for name in resources}
+
+
+def sample_from_distribution(options, rng=random):
+    """
+    options: list of (value, prob_percent)
+    rng: object with .uniform() (random.Random instance or the random module)
+    returns sampled value based on probability weights
+    """
+    values = [opt[0] for opt in options]
+    weights = [opt[1] for opt in options]
+    total_w = sum(weights)
+    if total_w <= 0:
+        return values[0]
+    r = rng.uniform(0, total_w)
+    cum = 0.0
+    for v, w in zip(values, weights):
+        cum += w
+        if r <= cum:
+            return v
+    return values[-1]
+
+
+class DiscreteSampler:
+    """
+    Sampler yang dikompilasi sekali per run dari list of (value, prob_percent).
+
+    CDF kumulatif dihitung di depan, tiap draw cukup satu uniform + bisect.
+    Dengan rng yang sama, sample() memberi hasil persis sama dengan
+    sample_from_distribution() (uniform(0, total) lalu cari cum >= r pertama).
+    """
+
+    def __init__(self, options):
+        self.values = [opt[0] for opt in options]
+        weights = [opt[1] for opt in options]
+        self.total = sum(weights)
+        self.cdf = []
+        cum = 0.0
+        for w in weights:
+            cum += w
+            self.cdf.append(cum)
+        self._last = len(self.values) - 1
+
+    def sample(self, rng=random):
+        """Satu draw. rng.random() * total == rng.uniform(0, total)."""
+        if self.total <= 0:
+            return self.values[0]
+        i = bisect_left(self.cdf, rng.random() * self.total)
+        return self.values[i if i < self._last else self._last]
+
+    def sample_block(self, rng, k):
+        """
+        k draw sekaligus dari satu panggilan rng.randbytes (53 bit per draw).
+        Distribusinya sama dengan sample(), tapi urutan konsumsi RNG berbeda,
+        jadi jangan dicampur dengan sample() pada stream yang sama kalau
+        butuh hasil identik dengan jalur lama.
+        """
+        if self.total <= 0:
+            return [self.values[0]] * k
+        values, cdf, last = self.values, self.cdf, self._last
+        scale = self.total * _INV_2_53
+        out = []
+        for x in array("Q", rng.randbytes(8 * k)):
+            i = bisect_left(cdf, (x >> 11) * scale)
+            out.append(values[i if i < last else last])
+        return out
+
+    def probabilities(self):
+        """Probabilitas ternormalisasi per value (untuk cek statistik)."""
+        if self.total <= 0:
+            return [1.0] + [0.0] * self._last
+        prev = 0.0
+        probs = []
+        for c in self.cdf:
+            probs.append((c - prev) / self.total)
+            prev = c
+        return probs
@@ -0,0 +1,337 @@
+"""
+Service HTTP/JSON lokal di atas engine: tool lain bisa mengirim scenario
+tanpa membuka sesi Streamlit sendiri. Satu process pool hangat dipakai
+bersama semua request; request yang identik dan sedang berjalan digabung
+(satu komputasi, banyak penunggu), hasil dengan seed tetap di-cache, dan
+jumlah job yang berjalan + antri dibatasi (penuh -> 429 + Retry-After).
+
+    python -m dump_truck_sim.service --port 8765 --workers 4
+
+Endpoint (body = key scenario seperti config cli.py, tanpa sweep/output):
+
+    GET  /health    status pool, job berjalan, counter dedupe / cache / ditolak
+    POST /simulate  {..., "replications": n, "seed": s, "confidence": 0.95,
+                     "per_replication": false}
+                    -> {"base_seed", "replications", "summary", ["metrics"]}
+    POST /timeline  {..., "seed": s, "format": "payload" | "ndjson"}
+                    payload -> JSON {"base_seed", "final_metrics", "trucks",
+                               "timeline": ColumnarTimeline.to_payload()}
+                    ndjson  -> stream: 1 baris header lalu 1 baris per step
+
+Hanya stdlib (http.server); bind default 127.0.0.1.
+"""
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cache import ResultCache, cache_key
+from .cli import SCENARIO_FIELDS, _json_safe, build_scenarios, run_options
+from .replication import (
+    _chunk,
+    _make_pool,
+    _run_full,
+    _run_metrics_chunk,
+    average_metrics,
+    replication_seeds,
+)
+
+MAX_BODY_BYTES = 1 << 20
+_REQUEST_FIELDS = {
+    "simulate": ("replications", "seed", "confidence", "per_replication"),
+    "timeline": ("seed", "format"),
+}
+TIMELINE_FORMATS = ("payload", "ndjson")
+_NDJSON_BATCH = 256  # baris step per write
+
+
+class ServiceBusy(RuntimeError):
+    """Antrian job penuh (backpressure): client sebaiknya retry nanti."""
+
+
+def _warm():
+    """Job kosong per worker: proses spawn + import engine sebelum request pertama."""
+    return True
+
+
+def parse_request(kind, body, max_replications):
+    """
+    Body JSON -> (scenario, seeds, options, deterministic). Seed kosong ->
+    seed dasar acak ditarik di sini (dikembalikan ke client, tidak di-cache).
+    """
+    if not isinstance(body, dict):
+        raise ValueError("request body must be a JSON object")
+    extra = _REQUEST_FIELDS[kind]
+    unknown = sorted(set(body) - set(SCENARIO_FIELDS) - set(extra))
+    if unknown:
+        raise ValueError(f"unknown request keys: {', '.join(unknown)}")
+    scenarios, _ = build_scenarios({k: v for k, v in body.items() if k in SCENARIO_FIELDS})
+    scenario = scenarios[0][1]
+
+    # tipe & rentang dicek sebelum job masuk pool (sama dengan config cli.py)
+    num_runs, seed, confidence, _ = run_options(body, max_replications)
+    per_replication = body.get("per_replication")
+    per_replication = False if per_replication is None else per_replication
+    if not isinstance(per_replication, bool):
+        raise ValueError(f"per_replication must be true or false, got {per_replication!r}")
+    options = {
+        "confidence": confidence,
+        "per_replication": per_replication,
+        "format": "payload" if body.get("format") is None else body["format"],
+    }
+    if options["format"] not in TIMELINE_FORMATS:
+        raise ValueError(f"format must be one of {TIMELINE_FORMATS}")
+    return scenario, replication_seeds(seed, num_runs), options, seed is not None
+
+
+class SimulationService:
+    """
+    Process pool hangat + job coordinator. submit() -> (Future, source) dengan
+    source "computed" (job baru), "joined" (menumpang job identik yang
+    sedang berjalan) atau "cached".
+    """
+
+    def __init__(self, max_workers=None, max_pending=32, cache_items=256, max_replications=10_000):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_replications = max_replications
+        self.cache = ResultCache(directory=None, max_items=cache_items)
+        self._pool = None
+        # 1 thread coordinator per job yang diterima (<= max_pending): menunggu
+        # chunk di process pool tanpa memblok thread HTTP lain
+        self._coordinator = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="sim-job")
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.counters = {"computed": 0, "joined": 0, "cached": 0, "rejected": 0, "failed": 0}
+
+    # ---------------------------------------------------------------- lifecycle
+    def start(self):
+        if self.max_workers is None:
+            self.max_workers = os.cpu_count() or 1
+        self._pool = _make_pool(self.max_workers)
+        for fut in [self._pool.submit(_warm) for _ in range(self.max_workers)]:
+            fut.result()
+        return self
+
+    def close(self):
+        self._coordinator.shutdown(wait=False, cancel_futures=True)
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    # ------------------------------------------------------------------- jobs
+    def submit(self, kind, scenario, seeds, deterministic):
+        key = cache_key("service", kind=kind, seeds=seeds, **scenario)
+        if deterministic:
+            cached = self.cache.get(key)
+            if cached is not None:
+                fut = Future()
+                fut.set_result(cached)
+                self._count("cached")
+                return fut, "cached"
+        with self._lock:
+            job = self._inflight.get(key)
+            if job is not None:
+                self.counters["joined"] += 1
+                return job, "joined"
+            if len(self._inflight) >= self.max_pending:
+                self.counters["rejected"] += 1
+                raise ServiceBusy(f"{len(self._inflight)} jobs pending (max {self.max_pending})")
+            run = self._run_metrics if kind == "simulate" else self._run_timeline
+            job = self._coordinator.submit(run, scenario, seeds)
+            self._inflight[key] = job
+            self.counters["computed"] += 1
+        job.add_done_callback(lambda fut: self._finish(key, fut, deterministic))
+        return job, "computed"
+
+    def _finish(self, key, fut, deterministic):
+        with self._lock:
+            self._inflight.pop(key, None)
+        if fut.cancelled() or fut.exception() is not None:
+            self._count("failed")
+        elif deterministic:
+            self.cache.put(key, fut.result())
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _run_metrics(self, scenario, seeds):
+        """final_metrics semua seed (urut seed), dibagi ~2 chunk per worker."""
+        chunks = _chunk(list(range(len(seeds))), self.max_workers * 2)
+        futures = [self._pool.submit(_run_metrics_chunk, scenario, [seeds[i] for i in idx]) for idx in chunks]
+        metrics = []
+        for fut in futures:
+            metrics.extend(fut.result())
+        return metrics
+
+    def _run_timeline(self, scenario, seeds):
+        final_metrics, timeline, _, trucks = self._pool.submit(_run_full, scenario, seeds[0]).result()
+        return final_metrics, timeline, trucks
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                self.counters,
+                workers=self.max_workers,
+                pending=len(self._inflight),
+                max_pending=self.max_pending,
+                cache_items=self.cache.stats()["memory_items"],
+            )
+
+
+# ---------------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "DumpTruckSim/1.0"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, obj, headers=None):
+        data = json.dumps(_json_safe(obj), separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"request body too large (max {MAX_BODY_BYTES} bytes)")
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON: {exc}") from exc
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, dict(self.service.stats(), status="ok"))
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        kind = self.path.strip("/")
+        if kind not in _REQUEST_FIELDS:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        service = self.service
+        try:
+            scenario, seeds, options, deterministic = parse_request(
+                kind, self._read_body(), service.max_replications
+            )
+            job, source = service.submit(kind, scenario, seeds, deterministic)
+        except (ValueError, TypeError) as exc:  # TypeError: tipe JSON yang lolos validasi
+            self._send_json(400, {"error": str(exc)})
+            return
+        except ServiceBusy as exc:
+            self._send_json(429, {"error": str(exc)}, {"Retry-After": "1"})
+            return
+
+        try:
+            result = job.result()
+        except ValueError as exc:  # input ditolak engine (lolos parse_request) -> tetap 400
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        headers = {"X-Result-Source": source}
+        if kind == "simulate":
+            out = {
+                "base_seed": seeds[0],
+                "replications": len(seeds),
+                "summary": average_metrics(result, options["confidence"]),
+            }
+            if options["per_replication"]:
+                out["metrics"] = result
+            self._send_json(200, out, headers)
+            return
+
+        final_metrics, timeline, trucks = result
+        if options["format"] == "payload":
+            self._send_json(200, {
+                "base_seed": seeds[0],
+                "final_metrics": final_metrics,
+                "trucks": trucks,
+                "timeline": timeline.to_payload(),
+            }, headers)
+            return
+        self._stream_steps(seeds[0], final_metrics, timeline, trucks, headers)
+
+    def _stream_steps(self, seed, final_metrics, timeline, trucks, headers):
+        """NDJSON tanpa Content-Length (koneksi ditutup di akhir stream)."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.close_connection = True
+        header = {
+            "base_seed": seed,
+            "n_steps": len(timeline),
+            "labels": list(timeline.topology.labels),
+            "final_metrics": final_metrics,
+            "trucks": trucks,
+        }
+        lines = [json.dumps(_json_safe(header))]
+        for snap in timeline:
+            lines.append(json.dumps(snap))
+            if len(lines) >= _NDJSON_BATCH:
+                self.wfile.write(("\n".join(lines) + "\n").encode("utf-8"))
+                lines = []
+        if lines:
+            self.wfile.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # backlog listen default socketserver (5) -> koneksi di-reset saat burst
+    request_queue_size = 128
+
+
+def make_server(service, host="127.0.0.1", port=8765, verbose=False):
+    """ThreadingHTTPServer untuk service (yang sudah start()); port 0 = port bebas."""
+    server = _Server((host, port), _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Service HTTP/JSON simulasi dump truck.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="jumlah worker process (default: semua core)")
+    parser.add_argument("--max-pending", type=int, default=32, help="job berjalan + antri maksimum (lebih -> 429)")
+    parser.add_argument("--verbose", action="store_true", help="log tiap request")
+    args = parser.parse_args(argv)
+
+    service = SimulationService(max_workers=args.workers, max_pending=args.max_pending).start()
+    server = make_server(service, args.host, args.port, args.verbose)
+    print(f"dump truck simulation service di http://{args.host}:{server.server_address[1]} "
+          f"({service.max_workers} worker)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
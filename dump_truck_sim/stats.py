@@ -0,0 +1,179 @@
+"""
+Statistik streaming untuk hasil replikasi: mean/variance Welford dan
+confidence interval Student-t (tanpa scipy).
+"""
+import math
+from statistics import NormalDist
+
+
+# di atas ini ekspansi Cornish-Fisher sudah akurat (< 1e-6); di bawahnya
+# kuantil dihaluskan lewat CDF eksak supaya CI n kecil tidak kesempitan
+_T_EXACT_MAX_DF = 100
+
+
+def _t_cdf(t, df):
+    """CDF Student-t untuk df bulat, bentuk tertutup (Abramowitz-Stegun 26.7.3/4)."""
+    theta = math.atan(t / math.sqrt(df))
+    c2 = math.cos(theta) ** 2
+    s = math.sin(theta)
+    if df % 2:
+        term, acc = 1.0, 1.0 if df > 1 else 0.0
+        for k in range(2, df - 1, 2):
+            term *= c2 * k / (k + 1)
+            acc += term
+        a = 2 / math.pi * (theta + s * math.cos(theta) * acc)
+    else:
+        term, acc = 1.0, 1.0
+        for k in range(1, df - 2, 2):
+            term *= c2 * k / (k + 1)
+            acc += term
+        a = s * acc
+    return 0.5 + 0.5 * a
+
+
+def _t_pdf(t, df):
+    log_c = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+    return math.exp(log_c - (df + 1) / 2 * math.log1p(t * t / df))
+
+
+def t_quantile(p, df):
+    """
+    Kuantil distribusi Student-t. df=1 dan df=2 bentuk tertutup; df>=3 mulai
+    dari ekspansi Cornish-Fisher kuantil normal, lalu (df <= 100) dihaluskan
+    dengan Newton pada CDF eksak -> galat ~1e-12. Untuk df > 100 galat
+    Cornish-Fisher sendiri < 1e-6.
+    """
+    if df <= 0:
+        raise ValueError("df must be positive")
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    z = NormalDist().inv_cdf(p)
+    z2 = z * z
+    g1 = (z2 + 1) * z / 4
+    g2 = ((5 * z2 + 16) * z2 + 3) * z / 96
+    g3 = (((3 * z2 + 19) * z2 + 17) * z2 - 15) * z / 384
+    g4 = ((((79 * z2 + 776) * z2 + 1482) * z2 - 1920) * z2 - 945) * z / 92160
+    t = z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+    if df > _T_EXACT_MAX_DF or df != int(df):
+        return t
+    df = int(df)
+    for _ in range(20):
+        step = (_t_cdf(t, df) - p) / _t_pdf(t, df)
+        t -= step
+        if abs(step) <= 1e-12 * max(1.0, abs(t)):
+            break
+    return t
+
+
+class RunningStats:
+    """Mean & variance satu metric secara streaming (Welford)."""
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self):
+        """Sample variance (n-1); 0.0 kalau n < 2."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def half_width(self, confidence=0.95):
+        """Half-width CI Student-t; inf kalau n < 2."""
+        if self.n < 2:
+            return math.inf
+        q = t_quantile(0.5 + confidence / 2, self.n - 1)
+        return q * math.sqrt(self.variance / self.n)
+
+    def meets(self, rel_target, confidence=0.95):
+        """True kalau half-width <= rel_target * |mean| (0 == 0 dianggap lolos)."""
+        hw = self.half_width(confidence)
+        return hw <= rel_target * abs(self.mean)
+
+
+class MetricAccumulator:
+    """Kumpulan RunningStats per nama metric (pengganti akumulator sum_*)."""
+
+    def __init__(self, keys):
+        self.keys = tuple(keys)
+        self.stats = {k: RunningStats() for k in self.keys}
+
+    @property
+    def n(self):
+        return self.stats[self.keys[0]].n if self.keys else 0
+
+    def push(self, metrics):
+        for k in self.keys:
+            self.stats[k].push(metrics[k])
+
+    def pending(self, targets, confidence=0.95):
+        """Metric yang belum memenuhi target relatif {metric: rel_half_width}."""
+        return [
+            k for k, rel in targets.items()
+            if rel and not self.stats[k].meets(rel, confidence)
+        ]
+
+    def summary(self, confidence=0.95):
+        """Mean tiap metric + replications + half-width CI per metric."""
+        out = {k: self.stats[k].mean for k in self.keys}
+        out["replications"] = self.n
+        out["confidence"] = confidence
+        out["ci_halfwidth"] = {k: self.stats[k].half_width(confidence) for k in self.keys}
+        return out
+
+
+def mser_truncation(series, batch=5):
+    """
+    Titik potong warm-up MSER-m (default MSER-5): series dikelompokkan jadi
+    batch mean berisi `batch` observasi, lalu dipilih d (jumlah batch yang
+    dibuang, d <= setengah batch) yang meminimalkan
+
+        MSER(d) = sum_{i>d} (Y_i - mean_d)^2 / (k - d)^2
+
+    returns jumlah observasi series yang dibuang (kelipatan batch; 0 kalau
+    series terlalu pendek).
+    """
+    k = len(series) // batch
+    if k < 2:
+        return 0
+    means = [sum(series[i * batch:(i + 1) * batch]) / batch for i in range(k)]
+
+    # jumlah & jumlah kuadrat suffix -> MSER(d) O(1) per d
+    best_d, best = 0, math.inf
+    s = sq = 0.0
+    suffix = []
+    for y in reversed(means):
+        s += y
+        sq += y * y
+        suffix.append((s, sq))
+    suffix.reverse()
+    for d in range(k // 2 + 1):
+        n = k - d
+        s, sq = suffix[d]
+        mser = max(sq - s * s / n, 0.0) / (n * n)
+        if mser < best:
+            best_d, best = d, mser
+    return best_d * batch
+
+
+def lag1_autocorrelation(values):
+    """Autokorelasi lag-1 (cek independensi batch means); 0.0 kalau n < 3."""
+    n = len(values)
+    if n < 3:
+        return 0.0
+    mean = sum(values) / n
+    dev = [x - mean for x in values]
+    denom = sum(d * d for d in dev)
+    if denom == 0:
+        return 0.0
+    return sum(a * b for a, b in zip(dev, dev[1:])) / denom
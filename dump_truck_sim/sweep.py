@@ -0,0 +1,275 @@
+"""
+Scenario sweep / design of experiments: banyak konfigurasi x replikasi
+dalam satu process pool, hasil dalam tabel pandas tidy.
+
+Scenario = dict argumen run_simulation_metrics (tanpa seed):
+n_trucks, travel_time_value, total_time, dist_loader_A, dist_loader_B,
+dist_scale, dan opsional loaders / scales (topologi N x M) dan warmup.
+Axis distribusi boleh berupa dict {label: tabel} supaya tabel hasil cukup
+menyimpan label.
+"""
+import itertools
+import os
+import random
+
+import pandas as pd
+
+from .cache import ResultCache, cache_key
+from .replication import (
+    _chunk,
+    _make_pool,
+    _run_metrics_chunk,
+    replication_seeds,
+)
+from .stats import RunningStats
+from .topology import make_topology
+
+SCENARIO_KEYS = (
+    "n_trucks",
+    "travel_time_value",
+    "total_time",
+    "dist_loader_A",
+    "dist_loader_B",
+    "dist_scale",
+)
+_TOPOLOGY_ARGS = ("dist_loader_A", "dist_loader_B", "dist_scale", "loaders", "scales")
+# kolom identitas di tabel tidy (sisanya metric)
+_ID_COLUMNS = ("scenario",) + SCENARIO_KEYS + ("n_loaders", "n_scales", "replication", "seed")
+
+# cache default per scenario (memory saja): key konten -> list final_metrics
+_SCENARIO_CACHE = ResultCache(directory=None, max_items=1024)
+
+
+# ---------------------------------------------------------------------------------
+# DESAIN SCENARIO
+# ---------------------------------------------------------------------------------
+
+def _levels(values):
+    """Axis -> list of (label, value). dict {label: value} atau list value."""
+    if isinstance(values, dict):
+        return list(values.items())
+    return [(_label(v), v) for v in values]
+
+
+def _label(value):
+    if isinstance(value, (list, tuple)):
+        return "/".join(f"{v:g}:{p:g}" for v, p in value)
+    return value
+
+
+def grid_scenarios(base, **axes):
+    """
+    Full factorial: semua kombinasi level tiap axis, sisanya dari base.
+
+        grid_scenarios(base, n_trucks=[2, 4, 6, 8], travel_time_value=[5, 10])
+    """
+    names = list(axes)
+    level_lists = [_levels(axes[name]) for name in names]
+    scenarios = []
+    for combo in itertools.product(*level_lists):
+        scenario = dict(base)
+        labels = {}
+        for name, (label, value) in zip(names, combo):
+            scenario[name] = value
+            labels[name] = label
+        scenarios.append((labels, scenario))
+    return scenarios
+
+
+def lhs_scenarios(base, n_samples, seed=None, **axes):
+    """
+    Latin hypercube: tiap axis dibagi n_samples strata, tiap strata dipakai
+    tepat sekali (urutan strata diacak per axis).
+
+    axis (lo, hi) tuple -> kontinu (n_trucks dibulatkan ke int);
+    axis list / dict    -> level diskrit dipilih per strata.
+    """
+    rng = random.Random(seed)
+    columns = {}
+    for name, spec in axes.items():
+        strata = list(range(n_samples))
+        rng.shuffle(strata)
+        if isinstance(spec, tuple):
+            lo, hi = spec
+            col = []
+            for k in strata:
+                x = lo + (k + rng.random()) / n_samples * (hi - lo)
+                x = int(round(x)) if name == "n_trucks" else x
+                col.append((x, x))
+        else:
+            levels = _levels(spec)
+            col = [levels[k * len(levels) // n_samples] for k in strata]
+        columns[name] = col
+
+    scenarios = []
+    for i in range(n_samples):
+        scenario = dict(base)
+        labels = {}
+        for name, col in columns.items():
+            label, value = col[i]
+            scenario[name] = value
+            labels[name] = label
+        scenarios.append((labels, scenario))
+    return scenarios
+
+
+def _scenario_key(scenario, seeds):
+    inputs = {key: scenario.get(key) for key in SCENARIO_KEYS + ("loaders", "scales", "warmup")}
+    return cache_key("sweep", seeds=seeds, **inputs)
+
+
+# ---------------------------------------------------------------------------------
+# EKSEKUSI
+# ---------------------------------------------------------------------------------
+
+def run_sweep(
+    scenarios,
+    num_runs=10,
+    base_seed=None,
+    max_workers=None,
+    on_progress=None,
+    use_cache=True,
+    cache=None,
+):
+    """
+    Jalankan semua (scenario x replikasi) dalam satu pool.
+
+    scenarios: list of (labels, scenario) dari grid_scenarios / lhs_scenarios.
+    Semua scenario memakai seed yang sama (base_seed + i) -> common random
+    numbers antar scenario. Scenario yang sudah pernah dijalankan dengan
+    seed yang sama diambil dari cache per scenario (cache=None -> cache
+    memory modul; boleh ResultCache dengan disk store).
+    on_progress(done, total): dihitung dalam replikasi.
+
+    returns DataFrame tidy: 1 baris per (scenario, replikasi) dengan kolom
+    scenario, label axis, n_loaders, n_scales, replication, seed, lalu semua
+    metric final_metrics (util_* per server bisa NaN kalau topologi beda).
+    """
+    if base_seed is None:
+        base_seed = random.SystemRandom().randrange(2**32)
+    seeds = replication_seeds(base_seed, num_runs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if cache is None:
+        cache = _SCENARIO_CACHE
+
+    results = {}
+    todo = []
+    for s_idx, (_, scenario) in enumerate(scenarios):
+        key = _scenario_key(scenario, seeds)
+        cached = cache.get(key) if use_cache else None
+        if cached is not None:
+            results[s_idx] = cached
+        else:
+            todo.append((s_idx, key))
+
+    total = len(scenarios) * num_runs
+    done = (len(scenarios) - len(todo)) * num_runs
+    if on_progress:
+        on_progress(done, total)
+
+    # job = (scenario, potongan seed); ~4 job per worker untuk load balancing
+    n_chunks = max(1, (max_workers * 4) // max(1, len(todo)))
+    jobs = [
+        (s_idx, idx)
+        for s_idx, _ in todo
+        for idx in _chunk(list(range(num_runs)), n_chunks)
+    ]
+    partial = {s_idx: [None] * num_runs for s_idx, _ in todo}
+
+    def collect(s_idx, idx, metrics):
+        nonlocal done
+        for i, m in zip(idx, metrics):
+            partial[s_idx][i] = m
+        done += len(idx)
+        if on_progress:
+            on_progress(done, total)
+
+    if jobs and max_workers <= 1:
+        for s_idx, idx in jobs:
+            scenario = scenarios[s_idx][1]
+            collect(s_idx, idx, _run_metrics_chunk(scenario, [seeds[i] for i in idx]))
+    elif jobs:
+        from concurrent.futures import as_completed
+
+        with _make_pool(max_workers) as pool:
+            futures = {
+                pool.submit(_run_metrics_chunk, scenarios[s_idx][1], [seeds[i] for i in idx]): (s_idx, idx)
+                for s_idx, idx in jobs
+            }
+            for fut in as_completed(futures):
+                s_idx, idx = futures[fut]
+                collect(s_idx, idx, fut.result())
+
+    for s_idx, key in todo:
+        results[s_idx] = partial[s_idx]
+        if use_cache:
+            cache.put(key, partial[s_idx])
+
+    rows = []
+    for s_idx, (labels, scenario) in enumerate(scenarios):
+        topo = make_topology(*(scenario.get(k) for k in _TOPOLOGY_ARGS))
+        for i, metrics in enumerate(results[s_idx]):
+            row = {"scenario": s_idx}
+            for key in SCENARIO_KEYS:
+                row[key] = labels.get(key, _label(scenario[key]))
+            row["n_loaders"] = topo.n_loaders
+            row["n_scales"] = topo.n_scales
+            row["replication"] = i + 1
+            row["seed"] = seeds[i]
+            row.update(metrics)
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def clear_sweep_cache():
+    _SCENARIO_CACHE.clear()
+
+
+# ---------------------------------------------------------------------------------
+# RINGKASAN & CHART
+# ---------------------------------------------------------------------------------
+
+def summarize_sweep(results, confidence=0.95, metrics=None):
+    """Mean + half-width CI per scenario (1 baris per scenario)."""
+    if metrics is None:
+        metrics = [c for c in results.columns if c not in _ID_COLUMNS]
+    rows = []
+    for s_idx, group in results.groupby("scenario", sort=True):
+        row = {"scenario": s_idx}
+        first = group.iloc[0]
+        for key in SCENARIO_KEYS + ("n_loaders", "n_scales"):
+            row[key] = first[key]
+        row["replications"] = len(group)
+        for key in metrics:
+            rs = RunningStats()
+            for x in group[key]:
+                if x == x:  # NaN = server tidak ada di topologi scenario ini
+                    rs.push(float(x))
+            row[key] = rs.mean if rs.n else float("nan")
+            row[key + "_hw"] = rs.half_width(confidence) if rs.n > 1 else float("nan")
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def throughput_chart(summary, metric="throughput_per_hour", color="travel_time_value"):
+    """Altair chart: metric vs jumlah truck (garis per level `color`) + band CI."""
+    import altair as alt
+
+    data = summary.copy()
+    hw = data[metric + "_hw"].fillna(0.0)
+    data["lo"] = data[metric] - hw
+    data["hi"] = data[metric] + hw
+    data[color] = data[color].astype(str)
+
+    base = alt.Chart(data).encode(
+        x=alt.X("n_trucks:Q", title="Jumlah truck"),
+        color=alt.Color(f"{color}:N", title=color),
+    )
+    band = base.mark_area(opacity=0.2).encode(y="lo:Q", y2="hi:Q")
+    line = base.mark_line(point=True).encode(
+        y=alt.Y(f"{metric}:Q", title=metric),
+        tooltip=["n_trucks", color, metric, metric + "_hw"],
+    )
+    return band + line
@@ -0,0 +1,407 @@
+"""
+Timeline kolom (columnar) untuk replay step-by-step, dengan checkpoint.
+
+Recorder ini mengonsumsi stream iter_simulation: record(event, truck,
+clock, service) untuk tiap baris event log dan end_step() setelah tiap
+step (semua event pada satu clock) diproses. Yang disimpan
+hanya event stream ringkas dalam array bertipe:
+
+- per baris event log: kode event, truck, service time;
+- per step (snapshot): indeks baris event terakhir dan clock.
+
+State sistem (queue, server, busy time, wait per truck) bisa diturunkan
+ulang dari event stream dengan _ReplayState. Setiap `checkpoint_every`
+step, state lengkap dibekukan sebagai checkpoint. Snapshot step i dibangun
+on-demand lewat timeline[i]: ambil checkpoint terdekat sebelum i lalu
+replay paling banyak `checkpoint_every` step. Memori tumbuh dengan
+~20 byte per step + ukuran state / checkpoint_every, bukan events x state.
+"""
+import base64
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+from .topology import DEFAULT_TOPOLOGY
+
+# kode event topologi default (Loader A, Loader B, Scale); topologi lain
+# lihat Topology.event_names
+EVENT_NAMES = (
+    "CHECK_ASSIGN",
+    "START_LOAD_A",
+    "START_LOAD_B",
+    "START_SCALE",
+    "END_LOAD_A",
+    "END_LOAD_B",
+    "END_SCALE",
+    "END_TRAVEL",
+)
+EVENT_CODE = {name: code for code, name in enumerate(EVENT_NAMES)}
+(
+    CHECK_ASSIGN,
+    START_LOAD_A,
+    START_LOAD_B,
+    START_SCALE,
+    END_LOAD_A,
+    END_LOAD_B,
+    END_SCALE,
+    END_TRAVEL,
+) = range(len(EVENT_NAMES))
+
+# truck state (versi int dari state string di engine)
+_QUEUE_LOADER, _LOADING, _QUEUE_SCALE, _SCALING, _TRAVEL = range(5)
+
+_NAN = float("nan")
+
+# (typecode, itemsize) array -> nama dtype typed array di payload browser
+_DTYPES = {
+    ("B", 1): "uint8",
+    ("H", 2): "uint16",
+    ("h", 2): "int16",
+    ("i", 4): "int32",
+    ("d", 8): "float64",
+}
+
+DEFAULT_CHECKPOINT_EVERY = 256
+
+
+class _ReplayState:
+    """
+    State sistem yang diturunkan dari event stream. Operasi float-nya sama
+    persis dengan core (busy time += clock - busy_since saat server lepas,
+    wait += clock - enter), jadi hasil replay identik bit-per-bit dengan
+    nilai yang dilihat core. Wait disimpan sebagai running total (bukan per
+    truck), sama seperti core.
+    """
+
+    __slots__ = (
+        "clock", "loader_queue", "scale_queue", "server", "busy", "since", "state",
+        "enter_loader", "enter_scale", "totals",
+    )
+
+    def __init__(self, n_trucks, n_servers):
+        self.clock = 0.0
+        self.loader_queue = deque(range(n_trucks))
+        self.scale_queue = deque()
+        self.server = [-1] * n_servers
+        self.busy = [0.0] * n_servers
+        self.since = [0.0] * n_servers
+        self.state = [_QUEUE_LOADER] * n_trucks
+        self.enter_loader = [0.0] * n_trucks
+        self.enter_scale = [0.0] * n_trucks
+        # running total: [wait loader, kunjungan loader, wait scale, kunjungan scale]
+        self.totals = [0.0, 0, 0.0, 0]
+
+    def freeze(self):
+        return tuple(
+            getattr(self, name) if name == "clock" else tuple(getattr(self, name))
+            for name in self.__slots__
+        )
+
+    @classmethod
+    def thaw(cls, frozen):
+        obj = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, frozen):
+            if name == "clock":
+                obj.clock = value
+            elif name.endswith("_queue"):
+                setattr(obj, name, deque(value))
+            else:
+                setattr(obj, name, list(value))
+        return obj
+
+    def advance(self, clock):
+        # busy time dihitung saat server lepas (apply_end), bukan per event
+        self.clock = clock
+
+    def apply_start(self, code, truck, n_loaders, n_servers):
+        """Efek START_* (baris log START ditulis setelah efek ini)."""
+        if 1 <= code <= n_servers:
+            k = code - 1
+            self.server[k] = truck
+            self.since[k] = self.clock
+            totals = self.totals
+            if k < n_loaders:
+                self.loader_queue.popleft()
+                totals[0] += self.clock - self.enter_loader[truck]
+                totals[1] += 1
+                self.state[truck] = _LOADING
+            else:
+                self.scale_queue.popleft()
+                totals[2] += self.clock - self.enter_scale[truck]
+                totals[3] += 1
+                self.state[truck] = _SCALING
+
+    def apply_end(self, code, truck, n_loaders, n_servers):
+        """Efek END_* (baris log END ditulis sebelum efek ini)."""
+        if n_servers < code <= 2 * n_servers:
+            k = code - n_servers - 1
+            self.busy[k] += self.clock - self.since[k]
+            self.server[k] = -1
+            if k < n_loaders:
+                self.state[truck] = _QUEUE_SCALE
+                self.enter_scale[truck] = self.clock
+                self.scale_queue.append(truck)
+            else:
+                self.state[truck] = _TRAVEL
+        elif code == 2 * n_servers + 1:
+            self.state[truck] = _QUEUE_LOADER
+            self.enter_loader[truck] = self.clock
+            self.loader_queue.append(truck)
+
+    def view(self, with_stats, server_keys):
+        """Field state untuk snapshot (with_stats=True) atau baris event log."""
+        out = {
+            "loader_queue": list(self.loader_queue),
+            "scale_queue": list(self.scale_queue),
+        }
+        if with_stats:
+            out["traveling"] = [i for i, s in enumerate(self.state) if s == _TRAVEL]
+        servers = [None if t == -1 else t for t in self.server]
+        for k, key in enumerate(server_keys):
+            out[key + "_busy"] = servers[k] is not None
+        for k, key in enumerate(server_keys):
+            out[key + "_truck"] = servers[k]
+        if with_stats:
+            clock = self.clock
+            for k, key in enumerate(server_keys):
+                busy = self.busy[k]
+                if servers[k] is not None:
+                    busy += clock - self.since[k]
+                out[key + "_busy_time"] = busy
+            wait_l, visits_l, wait_s, visits_s = self.totals
+            out["avg_loader_wait_so_far"] = wait_l / visits_l if visits_l else 0.0
+            out["avg_scale_wait_so_far"] = wait_s / visits_s if visits_s else 0.0
+        return out
+
+
+class ColumnarTimeline:
+    """Timeline run #1: event stream kolom + checkpoint; len() & [i] seperti list snapshot."""
+
+    def __init__(self, n_trucks, checkpoint_every=DEFAULT_CHECKPOINT_EVERY, topology=None):
+        self.n_trucks = n_trucks
+        self.checkpoint_every = checkpoint_every
+        self.topology = topology or DEFAULT_TOPOLOGY
+        self._event_names = self.topology.event_names
+        self._server_keys = self.topology.keys
+        self._dims = (self.topology.n_loaders, self.topology.n_servers)
+
+        # kolom per baris event log
+        self.ev_code = array("H")
+        self.ev_truck = array("i")   # int32: fleet besar (> 32767 truck) tetap muat
+        self.ev_service = array("d")
+
+        # kolom per step (snapshot)
+        self.st_row = array("i")      # baris event log terakhir di step ini
+        self.st_clock = array("d")
+
+        # checkpoint j = state setelah j * checkpoint_every step
+        self._live = _ReplayState(n_trucks, self.topology.n_servers)
+        self._checkpoints = [self._live.freeze()]
+
+        self.events = TimelineEvents(self)
+
+    # ------------------------------------------------------------------ record
+    def record(self, code, truck, clock, service=None):
+        """Satu baris event log (item "event" dari iter_simulation)."""
+        live = self._live
+        live.advance(clock)
+        live.apply_start(code, truck, *self._dims)
+        self.ev_code.append(code)
+        self.ev_truck.append(-1 if truck is None else truck)
+        self.ev_service.append(_NAN if service is None else service)
+        live.apply_end(code, truck, *self._dims)
+
+    def end_step(self):
+        """Tutup satu step dan simpan checkpoint tiap K step."""
+        self.st_row.append(len(self.ev_code) - 1)
+        self.st_clock.append(self._live.clock)
+        if len(self.st_row) % self.checkpoint_every == 0:
+            self._checkpoints.append(self._live.freeze())
+
+    # ------------------------------------------------------------------ replay
+    def _first_row(self, step):
+        return self.st_row[step - 1] + 1 if step > 0 else 0
+
+    def _state_before_step(self, step):
+        """State sebelum step `step`: checkpoint terdekat + replay <= K step."""
+        j = step // self.checkpoint_every
+        state = _ReplayState.thaw(self._checkpoints[j])
+        codes, trucks, dims = self.ev_code, self.ev_truck, self._dims
+        for s in range(j * self.checkpoint_every, step):
+            clock = self.st_clock[s]
+            for r in range(self._first_row(s), self.st_row[s] + 1):
+                code, truck = codes[r], trucks[r]
+                state.advance(clock)
+                state.apply_start(code, truck, *dims)
+                state.apply_end(code, truck, *dims)
+        return state
+
+    def _iter_steps(self, start, stop):
+        state = self._state_before_step(start)
+        codes, trucks, dims = self.ev_code, self.ev_truck, self._dims
+        for s in range(start, stop):
+            clock = self.st_clock[s]
+            last = self.st_row[s]
+            for r in range(self._first_row(s), last + 1):
+                code, truck = codes[r], trucks[r]
+                state.advance(clock)
+                state.apply_start(code, truck, *dims)
+                state.apply_end(code, truck, *dims)
+            snap = {
+                "clock": clock,
+                "event": self._event_names[codes[last]] if last >= 0 else None,
+                "truck": _truck(trucks[last]) if last >= 0 else None,
+                "note": _note(self.ev_service[last]) if last >= 0 else "",
+            }
+            snap.update(state.view(True, self._server_keys))
+            yield snap
+
+    def _iter_rows(self, start, stop):
+        if start >= stop:
+            return
+        step = bisect_left(self.st_row, start)
+        state = self._state_before_step(step)
+        codes, trucks, dims = self.ev_code, self.ev_truck, self._dims
+        for r in range(self._first_row(step), stop):
+            while self.st_row[step] < r:
+                step += 1
+            code, truck = codes[r], trucks[r]
+            state.advance(self.st_clock[step])
+            state.apply_start(code, truck, *dims)
+            if r >= start:
+                row = {
+                    "time": state.clock,
+                    "event": self._event_names[code],
+                    "truck": _truck(truck),
+                    "note": _note(self.ev_service[r]),
+                }
+                row.update(state.view(False, self._server_keys))
+                yield row
+            state.apply_end(code, truck, *dims)
+
+    def __len__(self):
+        return len(self.st_row)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, stride = i.indices(len(self))
+            if stride != 1:
+                return [self.snapshot(j) for j in range(start, stop, stride)]
+            return list(self._iter_steps(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("timeline index out of range")
+        return self.snapshot(i)
+
+    def __iter__(self):
+        return self._iter_steps(0, len(self))
+
+    def snapshot(self, i):
+        """Rebuild snapshot dict step i (format sama dengan snapshot_state lama)."""
+        return next(self._iter_steps(i, i + 1))
+
+    def event_row(self, r):
+        """Rebuild baris event log r (format sama dengan log_event lama)."""
+        return next(self._iter_rows(r, r + 1))
+
+    def to_payload(self, compress=True):
+        """
+        Event stream dalam bentuk JSON-able untuk replay di browser
+        (replay_view.py). Kolom dibuat ringkas dulu: kode event uint8, service
+        time sebagai indeks ke tabel nilai unik (distribusi diskrit -> sedikit
+        nilai), jumlah baris log per step alih-alih indeks baris terakhir.
+        Tiap kolom = typed array little-endian, opsional dikompres zlib
+        ("deflate" di DecompressionStream), lalu base64. Client menurunkan
+        state dengan aturan yang sama dengan _ReplayState.
+        """
+        topo = self.topology
+        codes = self.ev_code
+        if codes and max(codes) < 256:
+            codes = array("B", codes)
+        service_values = sorted({v for v in self.ev_service if v == v})
+        if len(service_values) < 65535:
+            index = {v: i + 1 for i, v in enumerate(service_values)}
+            service = array("B" if len(service_values) < 255 else "H")
+            service.extend(0 if v != v else index[v] for v in self.ev_service)
+        else:
+            service_values, service = None, self.ev_service
+        st_count = array("i", self.st_row)
+        for s in range(len(st_count) - 1, 0, -1):
+            st_count[s] -= st_count[s - 1]
+        if st_count:
+            st_count[0] += 1
+        return {
+            "n_trucks": self.n_trucks,
+            "n_loaders": topo.n_loaders,
+            "labels": list(topo.labels),
+            "event_names": list(self._event_names),
+            "checkpoint_every": self.checkpoint_every,
+            "service_values": service_values,
+            "ev_code": _encode_column(codes, compress),
+            "ev_truck": _encode_column(self.ev_truck, compress),
+            "ev_service": _encode_column(service, compress),
+            "st_count": _encode_column(st_count, compress),
+            "st_clock": _encode_column(self.st_clock, compress),
+        }
+
+    def nbytes(self):
+        """Perkiraan ukuran event stream + checkpoint (byte)."""
+        total = 0
+        for value in (self.ev_code, self.ev_truck, self.ev_service, self.st_row, self.st_clock):
+            total += value.itemsize * len(value)
+        for frozen in self._checkpoints:
+            total += sys.getsizeof(frozen)
+            for part in frozen:
+                total += sys.getsizeof(part)
+        return total
+
+
+class TimelineEvents:
+    """View event log di atas ColumnarTimeline: len(), [i], [-30:]."""
+
+    def __init__(self, timeline):
+        self._timeline = timeline
+
+    def __len__(self):
+        return len(self._timeline.ev_code)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, stride = i.indices(len(self))
+            if stride != 1:
+                return [self._timeline.event_row(r) for r in range(start, stop, stride)]
+            return list(self._timeline._iter_rows(start, stop))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("event log index out of range")
+        return self._timeline.event_row(i)
+
+    def __iter__(self):
+        return self._timeline._iter_rows(0, len(self))
+
+
+def _encode_column(column, compress):
+    dtype = _DTYPES[(column.typecode, column.itemsize)]
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    data = column.tobytes()
+    if compress:
+        data = zlib.compress(data, 6)
+    return {
+        "dtype": dtype,
+        "codec": "deflate" if compress else None,
+        "data": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def _truck(t_id):
+    return None if t_id == -1 else t_id
+
+
+def _note(service):
+    return "" if service != service else f"svc={service}m"
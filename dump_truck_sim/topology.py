@@ -0,0 +1,111 @@
+"""
+Topologi resource: pool loader (N server) -> pool scale (M server) -> travel.
+
+Tiap server punya nama dan distribusi service time sendiri. Dari nama
+diturunkan semua label yang dipakai engine / timeline / UI, dan untuk
+topologi default (Loader A, Loader B, 1 Scale) hasilnya sama persis dengan
+nama lama: event START_LOAD_A / END_SCALE, snapshot loaderA_busy / scale_truck,
+metric util_loader_A / util_scale, RNG stream loader_A / scale.
+
+Kode event (int) per topologi dengan K = N + M server:
+    0            CHECK_ASSIGN
+    1 .. K       START server k-1
+    K+1 .. 2K    END server k-K-1
+    2K+1         END_TRAVEL
+Untuk topologi default ini sama dengan kode di timeline.EVENT_NAMES.
+"""
+import string
+
+CHECK_ASSIGN = 0
+
+
+def _is_named(item):
+    return isinstance(item, (list, tuple)) and len(item) == 2 and isinstance(item[0], str)
+
+
+def _named(items, default_names):
+    """list dist atau list (nama, dist) -> tuple (nama, dist)."""
+    out = []
+    for i, item in enumerate(items):
+        if _is_named(item):
+            out.append((item[0], item[1]))
+        else:
+            out.append((default_names(i, len(items)), item))
+    return tuple(out)
+
+
+def _loader_name(i, n):
+    letters = string.ascii_uppercase
+    return letters[i] if i < len(letters) else f"L{i + 1}"
+
+
+def _scale_name(i, n):
+    # 1 scale -> tanpa nama (kompatibel: util_scale, START_SCALE, scale_busy)
+    return "" if n == 1 else str(i + 1)
+
+
+class Topology:
+    """Pool loader + pool scale. Server global k: 0..N-1 loader, N..N+M-1 scale."""
+
+    def __init__(self, loaders, scales):
+        self.loaders = _named(loaders, _loader_name)
+        self.scales = _named(scales, _scale_name)
+        if not self.loaders or not self.scales:
+            raise ValueError("topology needs at least one loader and one scale")
+        for pool in (self.loaders, self.scales):
+            names = [name for name, _ in pool]
+            if len(set(names)) != len(names):
+                raise ValueError(f"duplicate server names: {names}")
+
+        self.n_loaders = len(self.loaders)
+        self.n_scales = len(self.scales)
+        self.n_servers = self.n_loaders + self.n_scales
+        self.dists = tuple(d for _, d in self.loaders) + tuple(d for _, d in self.scales)
+
+        loader_names = [name for name, _ in self.loaders]
+        scale_names = [name for name, _ in self.scales]
+        sfx = ["_" + n if n else "" for n in scale_names]
+
+        # prefix field snapshot: loaderA_busy, scale_truck, ...
+        self.keys = tuple("loader" + n for n in loader_names) + tuple("scale" + n for n in scale_names)
+        self.labels = tuple("Loader " + n for n in loader_names) + tuple(("Scale " + n).strip() for n in scale_names)
+        self.util_keys = tuple("util_loader_" + n for n in loader_names) + tuple("util_scale" + s for s in sfx)
+        self.resources = tuple("loader_" + n for n in loader_names) + tuple("scale" + s for s in sfx)
+        self.busy_states = tuple("LOADING_" + n for n in loader_names) + tuple("SCALING" + s for s in sfx)
+        self.event_names = (
+            ("CHECK_ASSIGN",)
+            + tuple("START_LOAD_" + n for n in loader_names)
+            + tuple("START_SCALE" + s for s in sfx)
+            + tuple("END_LOAD_" + n for n in loader_names)
+            + tuple("END_SCALE" + s for s in sfx)
+            + ("END_TRAVEL",)
+        )
+        self.end_travel = 2 * self.n_servers + 1
+
+    def start_code(self, k):
+        return 1 + k
+
+    def end_code(self, k):
+        return 1 + self.n_servers + k
+
+    def is_loader(self, k):
+        return k < self.n_loaders
+
+    def __repr__(self):
+        return f"Topology(loaders={list(n for n, _ in self.loaders)}, scales={list(n for n, _ in self.scales)})"
+
+
+def make_topology(dist_loader_A=None, dist_loader_B=None, dist_scale=None, loaders=None, scales=None):
+    """
+    Topologi dari argumen engine. loaders / scales (list dist atau list
+    (nama, dist)) menggantikan dist_loader_A/B dan dist_scale kalau diisi.
+    """
+    if loaders is None:
+        loaders = [("A", dist_loader_A), ("B", dist_loader_B)]
+    if scales is None:
+        scales = [("", dist_scale)]
+    return Topology(loaders, scales)
+
+
+# topologi default (hanya nama; dipakai timeline kalau topologi tidak diberikan)
+DEFAULT_TOPOLOGY = make_topology()
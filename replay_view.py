@@ -0,0 +1,406 @@
+"""
+Replay step run #1 di browser. Timeline kolom (ColumnarTimeline.to_payload,
+terkompres) dikirim sekali ke satu iframe components.html; state tiap step
+diturunkan di client dengan aturan yang sama dengan timeline._ReplayState
+(checkpoint tiap checkpoint_every step), jadi Next / Prev / slider dan
+autoplay (step/s atau menit simulasi/s) tidak memicu rerun Streamlit.
+"""
+import json
+
+# ---------------------------------------------------------------------------------
+# REPLAY CORE (tanpa DOM; dicek vs ColumnarTimeline: benchmarks/check_replay_js.py)
+# ---------------------------------------------------------------------------------
+REPLAY_CORE_JS = r"""
+const QUEUE_LOADER = 0, LOADING = 1, QUEUE_SCALE = 2, SCALING = 3, TRAVEL = 4;
+const TYPED = {
+  uint8: Uint8Array, uint16: Uint16Array, int16: Int16Array, int32: Int32Array, float64: Float64Array,
+};
+
+async function decodeColumn(col) {
+  const bin = atob(col.data);
+  let bytes = new Uint8Array(bin.length);
+  for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+  if (col.codec === "deflate") {
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("deflate"));
+    bytes = new Uint8Array(await new Response(stream).arrayBuffer());
+  }
+  return new TYPED[col.dtype](bytes.buffer);
+}
+
+// payload to_payload() -> kolom typed array (st_row dibangun ulang dari st_count)
+async function loadTimeline(p) {
+  const [code, truck, service, count, stClock] = await Promise.all(
+    [p.ev_code, p.ev_truck, p.ev_service, p.st_count, p.st_clock].map(decodeColumn)
+  );
+  const stRow = new Int32Array(count.length);
+  let row = -1;
+  for (let s = 0; s < count.length; s++) stRow[s] = row += count[s];
+  return {code: code, truck: truck, service: service, stRow: stRow, stClock: stClock};
+}
+
+// repr float ala Python (4.0 -> "4.0") untuk teks yang sama dengan server
+function pyFloat(x) {
+  return Number.isInteger(x) && Math.abs(x) < 1e16 ? x.toFixed(1) : String(x);
+}
+
+function makeReplay(p, cols) {
+  const code = cols.code, truck = cols.truck, service = cols.service;
+  const stRow = cols.stRow, stClock = cols.stClock;
+  const values = p.service_values;
+  const nTrucks = p.n_trucks, nLoaders = p.n_loaders, nServers = p.labels.length;
+  const K = p.checkpoint_every, nSteps = stRow.length;
+
+  function fresh() {
+    const lq = [];
+    for (let t = 0; t < nTrucks; t++) lq.push(t);
+    return {
+      clock: 0.0, lq: lq, sq: [],
+      server: new Array(nServers).fill(-1),
+      busy: new Array(nServers).fill(0.0),
+      since: new Array(nServers).fill(0.0),
+      state: new Array(nTrucks).fill(QUEUE_LOADER),
+      enterL: new Array(nTrucks).fill(0.0),
+      enterS: new Array(nTrucks).fill(0.0),
+      totals: [0.0, 0, 0.0, 0],
+    };
+  }
+
+  function clone(s) {
+    return {
+      clock: s.clock, lq: s.lq.slice(), sq: s.sq.slice(), server: s.server.slice(),
+      busy: s.busy.slice(), since: s.since.slice(), state: s.state.slice(),
+      enterL: s.enterL.slice(), enterS: s.enterS.slice(), totals: s.totals.slice(),
+    };
+  }
+
+  // sama dengan _ReplayState.apply_start lalu apply_end untuk satu baris log
+  function apply(s, c, t) {
+    if (c >= 1 && c <= nServers) {
+      const k = c - 1;
+      s.server[k] = t;
+      s.since[k] = s.clock;
+      if (k < nLoaders) {
+        s.lq.shift();
+        s.totals[0] += s.clock - s.enterL[t];
+        s.totals[1] += 1;
+        s.state[t] = LOADING;
+      } else {
+        s.sq.shift();
+        s.totals[2] += s.clock - s.enterS[t];
+        s.totals[3] += 1;
+        s.state[t] = SCALING;
+      }
+    } else if (c > nServers && c <= 2 * nServers) {
+      const k = c - nServers - 1;
+      s.busy[k] += s.clock - s.since[k];
+      s.server[k] = -1;
+      if (k < nLoaders) {
+        s.state[t] = QUEUE_SCALE;
+        s.enterS[t] = s.clock;
+        s.sq.push(t);
+      } else {
+        s.state[t] = TRAVEL;
+      }
+    } else if (c === 2 * nServers + 1) {
+      s.state[t] = QUEUE_LOADER;
+      s.enterL[t] = s.clock;
+      s.lq.push(t);
+    }
+  }
+
+  function applyStep(s, step) {
+    const clock = stClock[step];
+    const first = step > 0 ? stRow[step - 1] + 1 : 0;
+    for (let r = first; r <= stRow[step]; r++) {
+      s.clock = clock;
+      apply(s, code[r], truck[r]);
+    }
+  }
+
+  // checkpoint j = state setelah j * K step (sekali jalan saat mount)
+  const checkpoints = [clone(fresh())];
+  {
+    const s = fresh();
+    for (let step = 0; step < nSteps; step++) {
+      applyStep(s, step);
+      if ((step + 1) % K === 0) checkpoints.push(clone(s));
+    }
+  }
+
+  // state setelah step `cur`; maju 1 step cukup applyStep (autoplay / Next)
+  let cur = -1, live = clone(checkpoints[0]);
+
+  function seek(i) {
+    if (i < cur || i - cur > K) {
+      const j = Math.floor(i / K);
+      live = clone(checkpoints[j]);
+      cur = j * K - 1;
+    }
+    while (cur < i) applyStep(live, ++cur);
+    return live;
+  }
+
+  function snapshot(i) {
+    const s = seek(i);
+    const last = stRow[i];
+    const server = s.server.map(t => (t === -1 ? null : t));
+    const busyTime = s.busy.map((b, k) => (server[k] !== null ? b + (s.clock - s.since[k]) : b));
+    const traveling = [];
+    for (let t = 0; t < nTrucks; t++) if (s.state[t] === TRAVEL) traveling.push(t);
+    let svc = last >= 0 ? service[last] : NaN;
+    if (values && last >= 0) svc = svc ? values[svc - 1] : NaN;
+    return {
+      clock: stClock[i],
+      event: last >= 0 ? p.event_names[code[last]] : null,
+      truck: last >= 0 && truck[last] !== -1 ? truck[last] : null,
+      note: svc === svc ? "svc=" + pyFloat(svc) + "m" : "",
+      loader_queue: s.lq.slice(),
+      scale_queue: s.sq.slice(),
+      traveling: traveling,
+      server: server,
+      busy_time: busyTime,
+      avg_loader_wait_so_far: s.totals[1] ? s.totals[0] / s.totals[1] : 0.0,
+      avg_scale_wait_so_far: s.totals[3] ? s.totals[2] / s.totals[3] : 0.0,
+    };
+  }
+
+  // step terakhir dengan clock <= t (autoplay berbasis menit simulasi)
+  function stepAt(t) {
+    let lo = 0, hi = nSteps - 1;
+    if (!(stClock[0] <= t)) return 0;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      if (stClock[mid] <= t) lo = mid; else hi = mid - 1;
+    }
+    return lo;
+  }
+
+  return {length: nSteps, snapshot: snapshot, stClock: stClock, stepAt: stepAt};
+}
+"""
+
+# ---------------------------------------------------------------------------------
+# REPLAY UI (DOM, kelas CSS sama dengan render_step_ui di dashboard.py)
+# ---------------------------------------------------------------------------------
+REPLAY_CSS = """
+.replay-controls {
+    display: flex;
+    align-items: center;
+    gap: .5rem;
+    margin-bottom: .75rem;
+    font-family: ui-rounded, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+    color: #cbd5e1;
+    font-size: .8rem;
+}
+.replay-controls button {
+    background: #1e293b;
+    color: #f8fafc;
+    border: 1px solid #334155;
+    border-radius: .5rem;
+    padding: .35rem .7rem;
+    cursor: pointer;
+}
+.replay-controls input[type=range] { flex: 1; }
+.replay-controls select, .replay-controls .replay-speed {
+    background: #0f172a;
+    color: #f8fafc;
+    border: 1px solid #334155;
+    border-radius: .5rem;
+    padding: .3rem .4rem;
+}
+.replay-controls .replay-speed { width: 4.5rem; }
+.replay-section { margin-bottom: 1rem; }
+"""
+
+REPLAY_UI_JS = r"""
+function round2(x) { return pyFloat(Math.round(x * 100) / 100); }
+
+function trucksHtml(ids) {
+  if (!ids.length) return '<span style="color:#475569;font-size:.8rem;">(empty)</span>';
+  return ids.map(t => '<span class="truck-chip">🚚 T' + t + '</span>').join(" ");
+}
+
+function badgeHtml(busy) {
+  return '<span class="badge ' + (busy ? "badge-busy" : "badge-idle") + '">' + (busy ? "BUSY" : "IDLE") + "</span>";
+}
+
+async function mount(root, p) {
+  const replay = makeReplay(p, await loadTimeline(p));
+  const nLoaders = p.n_loaders;
+  const role = k => (k < nLoaders ? "Muat material." : "Bottleneck potensial.");
+  const icon = k => (k < nLoaders ? "🏗" : "⚖️");
+  let idx = 0;
+
+  root.innerHTML =
+    '<div class="replay-controls">' +
+    '<button data-go="first">⏮</button><button data-go="prev">◀ Prev</button>' +
+    '<button data-go="next">Next ▶</button><button data-go="last">⏭</button>' +
+    '<button class="replay-play">▶ Play</button>' +
+    '<input class="replay-speed" type="number" min="0.1" step="any" value="20">' +
+    '<select class="replay-unit"><option value="steps">step/s</option>' +
+    '<option value="minutes">menit sim/s</option></select>' +
+    '<input type="range" min="0" step="1">' +
+    '<span class="replay-pos"></span></div>' +
+    '<div class="replay-section replay-metrics"></div>' +
+    '<div class="replay-section replay-pipeline pipeline-diagram" style="overflow-x:auto;"></div>' +
+    '<div class="replay-section replay-status" style="display:flex; flex-wrap:wrap; gap:1rem;"></div>';
+  const slider = root.querySelector("input[type=range]");
+  slider.max = replay.length - 1;
+  const pos = root.querySelector(".replay-pos");
+  const metricsEl = root.querySelector(".replay-metrics");
+  const pipelineEl = root.querySelector(".replay-pipeline");
+  const statusEl = root.querySelector(".replay-status");
+  const playBtn = root.querySelector(".replay-play");
+  const speedInput = root.querySelector(".replay-speed");
+  const unitSelect = root.querySelector(".replay-unit");
+
+  function card(label, value, suffix) {
+    return '<div class="metric-card"><div class="metric-label">' + label + "</div>" +
+      '<div class="metric-value">' + value + '<span class="metric-suffix">' + suffix + "</span></div></div>";
+  }
+
+  function stage(title, stageIcon, content, style) {
+    return '<div class="stage-box"' + (style ? ' style="' + style + '"' : "") + ">" +
+      '<div class="stage-title">' + title + '</div><div class="stage-icon">' + stageIcon + "</div>" +
+      '<div class="stage-content">' + content + "</div></div>";
+  }
+
+  function render() {
+    const cur = replay.snapshot(idx);
+    const clock = cur.clock;
+    const util = cur.busy_time.map(b => round2((b / Math.max(clock, 1e-9)) * 100.0));
+
+    metricsEl.innerHTML = '<div class="metrics-grid">' +
+      card("Sim Clock (now)", round2(clock), " min") +
+      card("Event", cur.event || "-", "") +
+      card("Truck", cur.truck !== null ? "T" + cur.truck : "-", "") +
+      card("Avg Wait Loader (so far)", round2(cur.avg_loader_wait_so_far), " min") +
+      card("Avg Wait Scale (so far)", round2(cur.avg_scale_wait_so_far), " min") +
+      p.labels.map((label, k) => card(label.replace(/ /g, "") + " Util (so far)", util[k], " %")).join("") +
+      card("Step", idx, " / " + (replay.length - 1)) +
+      "</div>";
+
+    const servers = isLoader => p.labels.map((label, k) => ((k < nLoaders) !== isLoader ? "" :
+      stage(label, icon(k), badgeHtml(cur.server[k] !== null) + "<br/>" +
+        trucksHtml(cur.server[k] !== null ? [cur.server[k]] : []), "min-width:160px;"))).join("");
+    pipelineEl.innerHTML =
+      '<div style="display:flex; flex-wrap:wrap; align-items:flex-start; justify-content:center; gap:.75rem;">' +
+      stage("Loader Queue", "🚚⏳", trucksHtml(cur.loader_queue)) + '<div class="arrow">➡</div>' +
+      servers(true) + '<div class="arrow">➡</div>' +
+      stage("Scale Queue", "🚚⏳", trucksHtml(cur.scale_queue)) + '<div class="arrow">➡</div>' +
+      servers(false) + '<div class="arrow">➡</div>' +
+      stage("Traveling", "🔄", trucksHtml(cur.traveling)) + "</div>";
+
+    statusEl.innerHTML = p.labels.map((label, k) =>
+      '<div class="status-card" style="flex:1; min-width:250px;">' +
+      '<div class="status-title">' + label + " " + icon(k) + "</div>" +
+      '<div class="status-body">' + badgeHtml(cur.server[k] !== null) +
+      '<div class="truck-chip">🚚 Active: ' + (cur.server[k] !== null ? "T" + cur.server[k] : "None") + "</div></div>" +
+      '<div style="font-size:.75rem;color:#94a3b8;line-height:1.4;">Util (so far): <b>' + util[k] + "%</b><br/>" +
+      role(k) + "</div></div>").join("");
+
+    slider.value = idx;
+    pos.textContent = "Step " + idx + " / " + (replay.length - 1) + " · t=" + round2(clock) + " min" +
+      (cur.note ? " · " + cur.note : "") + (playing ? " · " + fps + " fps" : "");
+  }
+
+  function go(i) {
+    idx = Math.max(0, Math.min(replay.length - 1, i));
+    simTime = replay.stClock[idx];
+    carry = 0;
+    render();
+  }
+
+  // autoplay: tiap frame maju sesuai kecepatan (step/s atau menit simulasi/s);
+  // banyak step per frame cukup -> seek incremental / dari checkpoint
+  let playing = false, lastFrame = 0, simTime = 0, carry = 0;
+  let fps = 0, frames = 0, fpsSince = 0;
+
+  function frame(now) {
+    if (!playing) return;
+    const dt = Math.min((now - lastFrame) / 1000, 0.25);  // tab di background -> jangan lompat jauh
+    lastFrame = now;
+    frames++;
+    if (now - fpsSince >= 1000) {
+      fps = Math.round((frames * 1000) / (now - fpsSince));
+      frames = 0;
+      fpsSince = now;
+    }
+    const speed = Math.max(parseFloat(speedInput.value) || 0, 0);
+    let target = idx;
+    if (unitSelect.value === "minutes") {
+      const t = simTime + dt * speed;
+      target = Math.max(idx, replay.stepAt(t));
+      go(target);
+      simTime = t;
+    } else {
+      const c = carry + dt * speed;
+      target = idx + Math.floor(c);
+      go(target);
+      carry = c - Math.floor(c);
+    }
+    if (idx >= replay.length - 1) pause();
+    else requestAnimationFrame(frame);
+  }
+
+  function play() {
+    if (idx >= replay.length - 1) go(0);
+    playing = true;
+    playBtn.textContent = "⏸ Pause";
+    lastFrame = fpsSince = performance.now();
+    frames = 0;
+    requestAnimationFrame(frame);
+  }
+
+  function pause() {
+    playing = false;
+    playBtn.textContent = "▶ Play";
+    render();
+  }
+
+  playBtn.addEventListener("click", () => (playing ? pause() : play()));
+
+  root.querySelectorAll("button[data-go]").forEach(b => b.addEventListener("click", () => {
+    const where = b.dataset.go;
+    go(where === "first" ? 0 : where === "last" ? replay.length - 1 : where === "prev" ? idx - 1 : idx + 1);
+  }));
+  slider.addEventListener("input", () => go(parseInt(slider.value, 10)));
+  document.addEventListener("keydown", e => {
+    if (e.key === "ArrowRight") go(idx + 1);
+    else if (e.key === "ArrowLeft") go(idx - 1);
+    else if (e.key === " ") {
+      e.preventDefault();
+      playing ? pause() : play();
+    }
+  });
+  go(0);
+  return {go: go, play: play, pause: pause, replay: replay};
+}
+"""
+
+
+def replay_height(n_servers):
+    """Tinggi iframe: kontrol + grid metric + pipeline + status card."""
+    n_cards = 6 + n_servers
+    metrics = 270 + 90 * max(0, (n_cards - 9 + 2) // 3)
+    return 60 + metrics + 380 + 260 * ((n_servers + 2) // 3)
+
+
+def replay_html(payload, css):
+    """Dokumen HTML mandiri (CSS dashboard + payload timeline + JS replay)."""
+    # "</" di-escape supaya string JSON tidak bisa menutup tag <script>
+    data = json.dumps(payload, separators=(",", ":")).replace("</", "<\\/")
+    return f"""
+    <html>
+    <head><style>{css}{REPLAY_CSS}</style></head>
+    <body style="background-color:transparent;margin:0;">
+    <div id="replay"></div>
+    <script>
+    {REPLAY_CORE_JS}
+    {REPLAY_UI_JS}
+    const root = document.getElementById("replay");
+    mount(root, {data}).catch(e => {{ root.textContent = "Replay gagal dimuat: " + e; }});
+    </script>
+    </body>
+    </html>
+    """